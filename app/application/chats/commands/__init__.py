@@ -5,6 +5,9 @@ from application.chats.commands.chats import (
     DeleteChatCommandHandler,
 )
 from application.chats.commands.messages import (
+    BulkCreateMessagesCommand,
+    BulkCreateMessagesCommandHandler,
+    BulkMessageData,
     CreateMessageCommand,
     CreateMessageCommandHandler,
 )
@@ -17,4 +20,7 @@ __all__ = [
     "DeleteChatCommandHandler",
     "CreateMessageCommand",
     "CreateMessageCommandHandler",
+    "BulkCreateMessagesCommand",
+    "BulkCreateMessagesCommandHandler",
+    "BulkMessageData",
 ]
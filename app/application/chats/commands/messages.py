@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterable
 from uuid import UUID
 
 from application.base.command import (
@@ -6,6 +8,10 @@ from application.base.command import (
     BaseCommandHandler,
 )
 from domain.chats.entities.messages import MessageEntity
+from domain.chats.exceptions.messages import (
+    InvalidBulkMessageException,
+    MessageException,
+)
 from domain.chats.interfaces.repository import BaseMessagesRepository
 from domain.chats.value_objects.messages import MessageContentValueObject
 
@@ -34,3 +40,84 @@ class CreateMessageCommandHandler(
 
         await self.messages_repository.add_message(message)
         return message
+
+
+# Сколько сообщений валидируется и вставляется за один вызов репозитория
+BULK_CREATE_MESSAGES_CHUNK_SIZE = 1000
+
+
+def _to_local_naive(value: datetime) -> datetime:
+    # Сущности хранят наивное локальное время (datetime.now), как и остальные сообщения
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone().replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class BulkMessageData:
+    content: str
+    # Номер строки в теле запроса (с 1), чтобы указать клиенту на ошибку
+    line_number: int
+    # Время сообщения в истории-источнике; без него сообщение получает текущее время
+    created_at: datetime | None = None
+
+
+@dataclass(frozen=True)
+class BulkCreateMessagesCommand(BaseCommand):
+    chat_id: UUID
+    sender_id: UUID
+    # Поток сообщений, чтобы весь импорт не держать в памяти
+    messages: AsyncIterable[BulkMessageData]
+
+
+@dataclass(frozen=True)
+class BulkCreateMessagesCommandHandler(
+    BaseCommandHandler[BulkCreateMessagesCommand, int],
+):
+    messages_repository: BaseMessagesRepository
+    chunk_size: int = BULK_CREATE_MESSAGES_CHUNK_SIZE
+
+    async def handle(self, command: BulkCreateMessagesCommand) -> int:
+        """Возвращает число созданных сообщений.
+
+        Каждый чанк целиком валидируется до вставки: при невалидном
+        сообщении чанк не пишется, а уже вставленные чанки остаются.
+        Время сообщений никогда не опережает текущее: иначе импорт встал
+        бы в истории новее сообщений, отправленных после него. Сообщения
+        с одинаковым created_at упорядочиваются по oid, как и везде.
+        """
+        created = 0
+        chunk: list[MessageEntity] = []
+
+        async for data in command.messages:
+            try:
+                content_vo = MessageContentValueObject(value=data.content)
+            except MessageException as exc:
+                raise InvalidBulkMessageException(line_number=data.line_number, reason=exc.message)
+
+            now = datetime.now()
+            created_at = _to_local_naive(data.created_at) if data.created_at is not None else now
+            if created_at > now:
+                raise InvalidBulkMessageException(line_number=data.line_number, reason="created_at is in the future")
+
+            chunk.append(
+                MessageEntity(
+                    chat_id=command.chat_id,
+                    sender_id=command.sender_id,
+                    content=content_vo,
+                    created_at=created_at,
+                    updated_at=created_at,
+                ),
+            )
+
+            if len(chunk) >= self.chunk_size:
+                await self.messages_repository.add_messages(chunk)
+                created += len(chunk)
+                chunk = []
+
+        if chunk:
+            await self.messages_repository.add_messages(chunk)
+            created += len(chunk)
+
+        return created
@@ -3,6 +3,8 @@ from application.chats.queries.chats import (
     GetChatByIdQueryHandler,
 )
 from application.chats.queries.messages import (
+    ExportMessagesQuery,
+    ExportMessagesQueryHandler,
     GetMessagesQuery,
     GetMessagesQueryHandler,
 )
@@ -13,4 +15,6 @@ __all__ = [
     "GetChatByIdQueryHandler",
     "GetMessagesQuery",
     "GetMessagesQueryHandler",
+    "ExportMessagesQuery",
+    "ExportMessagesQueryHandler",
 ]
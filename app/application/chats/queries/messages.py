@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import Iterable
+from typing import (
+    AsyncIterator,
+    Iterable,
+)
 from uuid import UUID
 
 from application.base.query import (
@@ -7,8 +10,19 @@ from application.base.query import (
     BaseQueryHandler,
 )
 from domain.chats.entities.messages import MessageEntity
-from domain.chats.filters.messages import GetMessagesFilters
-from domain.chats.interfaces.repository import BaseMessagesRepository
+from domain.chats.exceptions.chats import ChatNotFoundException
+from domain.chats.filters.messages import (
+    GetMessagesFilters,
+    MessagesCursor,
+)
+from domain.chats.interfaces.repository import (
+    BaseChatsRepository,
+    BaseMessagesRepository,
+)
+
+
+# Сколько документов Mongo отдает за один round trip при экспорте
+EXPORT_MESSAGES_BATCH_SIZE = 1000
 
 
 @dataclass(frozen=True)
@@ -16,24 +30,55 @@ class GetMessagesQuery(BaseQuery):
     chat_id: UUID
     limit: int = 10
     offset: int = 0
+    before: str | None = None
+    after: str | None = None
+    with_total: bool = True
 
 
 @dataclass(frozen=True)
 class GetMessagesQueryHandler(
-    BaseQueryHandler[GetMessagesQuery, tuple[Iterable[MessageEntity], int]],
+    BaseQueryHandler[GetMessagesQuery, tuple[Iterable[MessageEntity], int | None]],
 ):
     messages_repository: BaseMessagesRepository
 
     async def handle(
         self,
         query: GetMessagesQuery,
-    ) -> tuple[Iterable[MessageEntity], int]:
+    ) -> tuple[Iterable[MessageEntity], int | None]:
         filters = GetMessagesFilters(
             limit=query.limit,
             offset=query.offset,
+            before=MessagesCursor.decode(query.before) if query.before else None,
+            after=MessagesCursor.decode(query.after) if query.after else None,
+            with_total=query.with_total,
         )
 
         return await self.messages_repository.get_messages(
             chat_id=query.chat_id,
             filters=filters,
         )
+
+
+@dataclass(frozen=True)
+class ExportMessagesQuery(BaseQuery):
+    chat_id: UUID
+    batch_size: int = EXPORT_MESSAGES_BATCH_SIZE
+
+
+@dataclass(frozen=True)
+class ExportMessagesQueryHandler(
+    BaseQueryHandler[ExportMessagesQuery, AsyncIterator[MessageEntity]],
+):
+    chats_repository: BaseChatsRepository
+    messages_repository: BaseMessagesRepository
+
+    async def handle(self, query: ExportMessagesQuery) -> AsyncIterator[MessageEntity]:
+        # Проверяем чат заранее: после начала потоковой выдачи ошибку уже не вернуть
+        chat = await self.chats_repository.get_chat_by_oid(str(query.chat_id))
+        if not chat:
+            raise ChatNotFoundException(chat_id=query.chat_id)
+
+        return self.messages_repository.iterate_messages(
+            chat_id=query.chat_id,
+            batch_size=query.batch_size,
+        )
@@ -1,15 +1,40 @@
 from functools import lru_cache
 
+from infrastructure.cache.recent_messages import RecentMessagesCache
+from infrastructure.cache.stats import CacheRegistry
+from infrastructure.cache.ttl import TTLCache
 from infrastructure.database.gateways.postgres import SQLDatabase
+from infrastructure.database.indexes.mongo import (
+    CHATS_INDEXES,
+    MESSAGES_INDEXES,
+    MongoDBIndexManager,
+)
+from infrastructure.database.repositories.cached.chats import CachedChatsRepository
+from infrastructure.database.repositories.cached.messages import CachedMessagesRepository
+from infrastructure.database.repositories.cached.users import CachedUserRepository
 from infrastructure.database.repositories.chats.chats import MongoDBChatsRepository
-from infrastructure.database.repositories.chats.messages import MongoDBMessagesRepository
+from infrastructure.database.repositories.chats.messages import (
+    BufferedMongoDBMessagesRepository,
+    MongoDBMessagesRepository,
+)
+from infrastructure.database.repositories.chats.write_buffer import MongoDBMessagesWriteBuffer
 from infrastructure.database.repositories.users.users import SQLAlchemyUserRepository
+from infrastructure.images.thumbnails import PillowThumbnailGenerator
+from infrastructure.s3.cached import CachedFileStorage
 from infrastructure.s3.client import S3Client
 from infrastructure.s3.storage import S3FileStorage
+from infrastructure.security.bcrypt import BcryptPasswordHasher
+from infrastructure.websockets.brokers import (
+    BaseMessageBroker,
+    InMemoryMessageBroker,
+    UnixSocketMessageBroker,
+)
+from infrastructure.websockets.connection import OverflowPolicy
 from infrastructure.websockets.manager import (
     BaseConnectionManager,
-    ConnectionManager,
+    BrokerConnectionManager,
 )
+from infrastructure.websockets.replay import ChatEventReplayBuffer
 from motor.motor_asyncio import AsyncIOMotorClient
 from punq import (
     Container,
@@ -17,6 +42,8 @@ from punq import (
 )
 
 from application.chats.commands import (
+    BulkCreateMessagesCommand,
+    BulkCreateMessagesCommandHandler,
     CreateChatCommand,
     CreateChatCommandHandler,
     CreateMessageCommand,
@@ -25,6 +52,8 @@ from application.chats.commands import (
     DeleteChatCommandHandler,
 )
 from application.chats.queries import (
+    ExportMessagesQuery,
+    ExportMessagesQueryHandler,
     GetChatByIdQuery,
     GetChatByIdQueryHandler,
     GetMessagesQuery,
@@ -34,6 +63,10 @@ from application.mediator import Mediator
 from application.users.commands import (
     CreateUserCommand,
     CreateUserCommandHandler,
+    GenerateAvatarThumbnailsCommand,
+    GenerateAvatarThumbnailsCommandHandler,
+    RehashPasswordCommand,
+    RehashPasswordCommandHandler,
     UploadAvatarCommand,
     UploadAvatarCommandHandler,
 )
@@ -46,7 +79,11 @@ from application.users.queries import (
 from domain.base.file_storage import BaseFileStorage
 from domain.chats.interfaces import BaseChatsRepository
 from domain.chats.interfaces.repository import BaseMessagesRepository
-from domain.users.interfaces.repository import BaseUserRepository
+from domain.users.interfaces import (
+    BasePasswordHasher,
+    BaseThumbnailGenerator,
+    BaseUserRepository,
+)
 from domain.users.services import UserService
 from settings.config import Config
 
@@ -64,9 +101,30 @@ def _init_container() -> Container:
     container.register(Config, instance=config, scope=Scope.singleton)
 
     # WebSocket Manager
+    def init_message_broker() -> BaseMessageBroker:
+        if config.websocket_broker == "unix":
+            return UnixSocketMessageBroker(socket_dir=config.websocket_broker_socket_dir)
+        return InMemoryMessageBroker()
+
+    container.register(BaseMessageBroker, factory=init_message_broker, scope=Scope.singleton)
+
+    def init_connection_manager() -> BaseConnectionManager:
+        return BrokerConnectionManager(
+            broker=container.resolve(BaseMessageBroker),
+            send_timeout=config.websocket_send_timeout,
+            max_queue_size=config.websocket_queue_size,
+            overflow_policy=OverflowPolicy(config.websocket_overflow_policy),
+            replay_buffer=ChatEventReplayBuffer(
+                size=config.websocket_replay_buffer_size,
+                max_chats=config.websocket_replay_max_chats,
+            ),
+            heartbeat_interval=config.websocket_heartbeat_interval,
+            heartbeat_timeout=config.websocket_heartbeat_timeout,
+        )
+
     container.register(
         BaseConnectionManager,
-        instance=ConnectionManager(),
+        factory=init_connection_manager,
         scope=Scope.singleton,
     )
 
@@ -85,13 +143,6 @@ def _init_container() -> Container:
 
     container.register(S3Client, factory=init_s3_client, scope=Scope.singleton)
 
-    # Регистрируем FileStorage
-    def init_file_storage() -> BaseFileStorage:
-        s3_client = container.resolve(S3Client)
-        return S3FileStorage(s3_client=s3_client)
-
-    container.register(BaseFileStorage, factory=init_file_storage, scope=Scope.singleton)
-
     # Регистрируем MongoDB Client
     def create_mongodb_client():
         return AsyncIOMotorClient(
@@ -107,31 +158,173 @@ def _init_container() -> Container:
 
     mongodb_client = container.resolve(AsyncIOMotorClient)
 
+    # Регистрируем менеджер индексов MongoDB
+    def init_mongodb_index_manager() -> MongoDBIndexManager:
+        return MongoDBIndexManager(
+            mongo_db_client=mongodb_client,
+            mongo_db_database_name=config.mongo_database,
+            indexes={
+                config.mongodb_chat_collection: CHATS_INDEXES,
+                config.mongodb_message_collection: MESSAGES_INDEXES,
+            },
+        )
+
+    container.register(
+        MongoDBIndexManager,
+        factory=init_mongodb_index_manager,
+        scope=Scope.singleton,
+    )
+
     # Регистрируем репозитории
+    # Кэши создаются один раз и общие для всех экземпляров репозиториев
+    cache_registry = CacheRegistry()
+    container.register(CacheRegistry, instance=cache_registry, scope=Scope.singleton)
+
+    chats_cache = TTLCache(maxsize=config.chats_cache_max_size, ttl=config.chats_cache_ttl)
+    if config.chats_cache_enabled:
+        cache_registry.register("chats", chats_cache)
+
+    users_cache = TTLCache(maxsize=config.users_cache_max_size, ttl=config.users_cache_ttl)
+    if config.users_cache_enabled:
+        cache_registry.register("users", users_cache)
+
+    # TTL каждой ссылки задается при записи, исходя из ее expiration
+    file_urls_cache = TTLCache(maxsize=config.file_urls_cache_max_size)
+    if config.file_urls_cache_enabled:
+        cache_registry.register("file_urls", file_urls_cache)
+
+    # Регистрируем FileStorage
+    def init_file_storage() -> BaseFileStorage:
+        storage = S3FileStorage(s3_client=container.resolve(S3Client))
+        if config.file_urls_cache_enabled:
+            return CachedFileStorage(
+                storage=storage,
+                cache=file_urls_cache,
+                safety_margin=config.file_urls_cache_safety_margin,
+            )
+
+        return storage
+
+    container.register(BaseFileStorage, factory=init_file_storage, scope=Scope.singleton)
+
     def init_chats_mongodb_repository() -> BaseChatsRepository:
-        return MongoDBChatsRepository(
+        repository = MongoDBChatsRepository(
             mongo_db_client=mongodb_client,
             mongo_db_database_name=config.mongo_database,
             mongo_db_collection_name=config.mongodb_chat_collection,
         )
+        if config.chats_cache_enabled:
+            return CachedChatsRepository(
+                repository=repository,
+                cache=chats_cache,
+                negative_ttl=config.chats_cache_negative_ttl,
+            )
+
+        return repository
+
+    # Буфер group commit общий для всех экземпляров репозитория сообщений
+    def init_messages_write_buffer() -> MongoDBMessagesWriteBuffer:
+        return MongoDBMessagesWriteBuffer(
+            mongo_db_client=mongodb_client,
+            mongo_db_database_name=config.mongo_database,
+            mongo_db_collection_name=config.mongodb_message_collection,
+            mongo_db_chats_collection_name=config.mongodb_chat_collection,
+            max_delay=config.mongodb_write_buffer_max_delay_ms / 1000,
+            max_size=config.mongodb_write_buffer_max_size,
+        )
+
+    container.register(
+        MongoDBMessagesWriteBuffer,
+        factory=init_messages_write_buffer,
+        scope=Scope.singleton,
+    )
+
+    # Кэш последних сообщений общий для всех экземпляров репозитория
+    def init_recent_messages_cache() -> RecentMessagesCache:
+        cache = RecentMessagesCache(
+            per_chat_limit=config.messages_cache_per_chat,
+            max_chats=config.messages_cache_max_chats,
+            max_bytes=config.messages_cache_max_bytes,
+            ttl=config.messages_cache_ttl,
+        )
+        cache_registry.register("messages", cache)
+
+        return cache
+
+    container.register(
+        RecentMessagesCache,
+        factory=init_recent_messages_cache,
+        scope=Scope.singleton,
+    )
 
     def init_messages_mongodb_repository() -> BaseMessagesRepository:
+        if config.mongodb_write_buffer_enabled:
+            return BufferedMongoDBMessagesRepository(
+                mongo_db_client=mongodb_client,
+                mongo_db_database_name=config.mongo_database,
+                mongo_db_collection_name=config.mongodb_message_collection,
+                mongo_db_chats_collection_name=config.mongodb_chat_collection,
+                write_buffer=container.resolve(MongoDBMessagesWriteBuffer),
+            )
+
         return MongoDBMessagesRepository(
             mongo_db_client=mongodb_client,
             mongo_db_database_name=config.mongo_database,
             mongo_db_collection_name=config.mongodb_message_collection,
+            mongo_db_chats_collection_name=config.mongodb_chat_collection,
         )
 
+    def init_messages_repository() -> BaseMessagesRepository:
+        repository = init_messages_mongodb_repository()
+        if config.messages_cache_enabled:
+            return CachedMessagesRepository(
+                repository=repository,
+                cache=container.resolve(RecentMessagesCache),
+            )
+
+        return repository
+
     container.register(BaseChatsRepository, factory=init_chats_mongodb_repository)
     container.register(
         BaseMessagesRepository,
-        factory=init_messages_mongodb_repository,
+        factory=init_messages_repository,
     )
 
-    container.register(
-        BaseUserRepository,
-        SQLAlchemyUserRepository,
-    )
+    def init_user_repository() -> BaseUserRepository:
+        repository = SQLAlchemyUserRepository(database=container.resolve(SQLDatabase))
+        if config.users_cache_enabled:
+            return CachedUserRepository(repository=repository, cache=users_cache)
+
+        return repository
+
+    container.register(BaseUserRepository, factory=init_user_repository)
+
+    # Хэширование паролей вынесено в пул потоков, пул общий на воркер
+    def init_password_hasher() -> BasePasswordHasher:
+        return BcryptPasswordHasher(
+            rounds=config.password_hasher_rounds,
+            max_workers=config.password_hasher_workers,
+            max_concurrency=config.password_hasher_max_concurrency,
+            acquire_timeout=config.password_hasher_acquire_timeout,
+            latency_budget=(
+                config.password_hasher_latency_budget_ms / 1000
+                if config.password_hasher_latency_budget_ms is not None
+                else None
+            ),
+            min_rounds=config.password_hasher_min_rounds,
+            max_rounds=config.password_hasher_max_rounds,
+        )
+
+    container.register(BasePasswordHasher, factory=init_password_hasher, scope=Scope.singleton)
+
+    def init_thumbnail_generator() -> BaseThumbnailGenerator:
+        return PillowThumbnailGenerator(
+            sizes=config.avatar_thumbnail_sizes,
+            quality=config.avatar_thumbnail_quality,
+            max_workers=config.avatar_thumbnail_workers,
+        )
+
+    container.register(BaseThumbnailGenerator, factory=init_thumbnail_generator, scope=Scope.singleton)
 
     # Регистрируем доменные сервисы
     container.register(UserService)
@@ -140,11 +333,14 @@ def _init_container() -> Container:
     # Users
     container.register(CreateUserCommandHandler)
     container.register(UploadAvatarCommandHandler)
+    container.register(RehashPasswordCommandHandler)
+    container.register(GenerateAvatarThumbnailsCommandHandler)
 
     # Chats
     container.register(CreateChatCommandHandler)
     container.register(DeleteChatCommandHandler)
     container.register(CreateMessageCommandHandler)
+    container.register(BulkCreateMessagesCommandHandler)
 
     # Регистрируем query handlers
     # Users
@@ -154,6 +350,7 @@ def _init_container() -> Container:
     # Chats
     container.register(GetChatByIdQueryHandler)
     container.register(GetMessagesQueryHandler)
+    container.register(ExportMessagesQueryHandler)
 
     # Инициализируем медиатор
     def init_mediator() -> Mediator:
@@ -169,6 +366,14 @@ def _init_container() -> Container:
             UploadAvatarCommand,
             [container.resolve(UploadAvatarCommandHandler)],
         )
+        mediator.register_command(
+            RehashPasswordCommand,
+            [container.resolve(RehashPasswordCommandHandler)],
+        )
+        mediator.register_command(
+            GenerateAvatarThumbnailsCommand,
+            [container.resolve(GenerateAvatarThumbnailsCommandHandler)],
+        )
 
         # Chats
         mediator.register_command(
@@ -183,6 +388,10 @@ def _init_container() -> Container:
             CreateMessageCommand,
             [container.resolve(CreateMessageCommandHandler)],
         )
+        mediator.register_command(
+            BulkCreateMessagesCommand,
+            [container.resolve(BulkCreateMessagesCommandHandler)],
+        )
 
         # Регистрируем queries
         # Users
@@ -204,6 +413,10 @@ def _init_container() -> Container:
             GetMessagesQuery,
             container.resolve(GetMessagesQueryHandler),
         )
+        mediator.register_query(
+            ExportMessagesQuery,
+            container.resolve(ExportMessagesQueryHandler),
+        )
 
         return mediator
 
@@ -1,6 +1,10 @@
 from application.users.commands.users import (
     CreateUserCommand,
     CreateUserCommandHandler,
+    GenerateAvatarThumbnailsCommand,
+    GenerateAvatarThumbnailsCommandHandler,
+    RehashPasswordCommand,
+    RehashPasswordCommandHandler,
     UploadAvatarCommand,
     UploadAvatarCommandHandler,
 )
@@ -11,4 +15,8 @@ __all__ = [
     "CreateUserCommandHandler",
     "UploadAvatarCommand",
     "UploadAvatarCommandHandler",
+    "RehashPasswordCommand",
+    "RehashPasswordCommandHandler",
+    "GenerateAvatarThumbnailsCommand",
+    "GenerateAvatarThumbnailsCommandHandler",
 ]
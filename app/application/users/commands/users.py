@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from io import BytesIO
+from typing import AsyncIterable
 from uuid import UUID
 
 from application.base.command import (
@@ -35,7 +35,7 @@ class CreateUserCommandHandler(
 @dataclass(frozen=True)
 class UploadAvatarCommand(BaseCommand):
     user_id: UUID
-    file_obj: BytesIO
+    content: AsyncIterable[bytes]
     filename: str
 
 
@@ -48,7 +48,45 @@ class UploadAvatarCommandHandler(
     async def handle(self, command: UploadAvatarCommand) -> UserEntity:
         result = await self.user_service.upload_avatar(
             user_id=command.user_id,
-            file_obj=command.file_obj,
+            content=command.content,
             filename=command.filename,
         )
         return result
+
+
+@dataclass(frozen=True)
+class RehashPasswordCommand(BaseCommand):
+    user_id: UUID
+    password: str
+
+
+@dataclass(frozen=True)
+class RehashPasswordCommandHandler(
+    BaseCommandHandler[RehashPasswordCommand, bool],
+):
+    user_service: UserService
+
+    async def handle(self, command: RehashPasswordCommand) -> bool:
+        return await self.user_service.rehash_password(
+            user_id=command.user_id,
+            password=command.password,
+        )
+
+
+@dataclass(frozen=True)
+class GenerateAvatarThumbnailsCommand(BaseCommand):
+    user_id: UUID
+    avatar_path: str
+
+
+@dataclass(frozen=True)
+class GenerateAvatarThumbnailsCommandHandler(
+    BaseCommandHandler[GenerateAvatarThumbnailsCommand, dict[str, str]],
+):
+    user_service: UserService
+
+    async def handle(self, command: GenerateAvatarThumbnailsCommand) -> dict[str, str]:
+        return await self.user_service.generate_avatar_thumbnails(
+            user_id=command.user_id,
+            avatar_path=command.avatar_path,
+        )
@@ -0,0 +1,90 @@
+"""Накладные расходы DI на запрос.
+
+Запуск из директории app: python -m benchmarks.dependency_injection
+
+Каждый маршрут меряется в отдельном процессе клиентом httpx через
+ASGITransport, без сети и без dependency_overrides (с ними FastAPI
+пересобирает зависимости на каждый запрос и искажает результат).
+"""
+
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+from fastapi import (
+    Depends,
+    FastAPI,
+)
+
+import httpx
+from presentation.api.dependencies import get_mediator
+from punq import Container
+
+from application.container import init_container
+from application.mediator import Mediator
+
+
+WARMUP_REQUESTS = 300
+REQUESTS = 3000
+ROUNDS = 3
+
+app = FastAPI()
+
+
+@app.get("/baseline")
+async def baseline() -> dict:
+    """Без зависимостей: стоимость самого FastAPI."""
+    return {}
+
+
+@app.get("/sync-container")
+async def sync_container(container: Container = Depends(init_container)) -> dict:
+    """Как было: синхронная зависимость (пул потоков) и resolve на каждый запрос."""
+    container.resolve(Mediator)
+    return {}
+
+
+@app.get("/async-mediator")
+async def async_mediator(mediator: Mediator = Depends(get_mediator)) -> dict:
+    """Как стало: асинхронная зависимость и закэшированный медиатор."""
+    return {}
+
+
+ROUTES = ["/baseline", "/sync-container", "/async-mediator"]
+
+
+async def measure(path: str) -> float:
+    """Лучшее из ROUNDS прогонов по REQUESTS запросов, мкс на запрос."""
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for _ in range(WARMUP_REQUESTS):
+            await client.get(path)
+
+        timings = []
+        for _ in range(ROUNDS):
+            started_at = time.perf_counter()
+            for _ in range(REQUESTS):
+                await client.get(path)
+            timings.append((time.perf_counter() - started_at) / REQUESTS * 1e6)
+
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", nargs="?", choices=ROUTES, help="Маршрут; без него меряются все")
+    args = parser.parse_args()
+
+    if args.path is not None:
+        print(f"{args.path}: {asyncio.run(measure(args.path)):.1f} us/request")
+        return
+
+    for path in ROUTES:
+        subprocess.run([sys.executable, "-m", "benchmarks.dependency_injection", path], check=True)
+
+
+if __name__ == "__main__":
+    main()
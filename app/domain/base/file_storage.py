@@ -2,15 +2,27 @@ from abc import (
     ABC,
     abstractmethod,
 )
-from io import BytesIO
+from typing import (
+    AsyncIterable,
+    Iterable,
+)
 
 
 class BaseFileStorage(ABC):
     @abstractmethod
-    async def upload_file(self, file_obj: BytesIO, file_path: str) -> None: ...
+    async def upload_file(self, content: AsyncIterable[bytes], file_path: str) -> None:
+        """Stores the stream chunk by chunk; the file is never held in memory as a whole."""
+
+    @abstractmethod
+    async def read_file(self, file_path: str) -> bytes | None:
+        """Whole file content, or None if there is no such file."""
 
     @abstractmethod
     async def delete_file(self, file_path: str) -> None: ...
 
     @abstractmethod
     async def get_file_url(self, file_path: str, expiration: int = 3600) -> str | None: ...
+
+    async def get_file_urls(self, file_paths: Iterable[str], expiration: int = 3600) -> dict[str, str | None]:
+        """URLs for several files at once, keyed by path."""
+        return {file_path: await self.get_file_url(file_path, expiration) for file_path in dict.fromkeys(file_paths)}
@@ -6,7 +6,10 @@ from domain.chats.exceptions.chats import (
     EmptyChatTitleException,
 )
 from domain.chats.exceptions.messages import (
+    AmbiguousMessagesCursorException,
     EmptyMessageContentException,
+    InvalidBulkMessageException,
+    InvalidMessagesCursorException,
     MessageContentTooLongException,
     MessageException,
     MessageNotFoundException,
@@ -23,4 +26,7 @@ __all__ = [
     "EmptyMessageContentException",
     "MessageContentTooLongException",
     "MessageNotFoundException",
+    "InvalidMessagesCursorException",
+    "AmbiguousMessagesCursorException",
+    "InvalidBulkMessageException",
 ]
@@ -38,3 +38,29 @@ class MessageNotFoundException(MessageException):
     @property
     def message(self) -> str:
         return f"Message with id {self.message_id} not found"
+
+
+@dataclass(eq=False)
+class InvalidMessagesCursorException(MessageException):
+    cursor: str
+
+    @property
+    def message(self) -> str:
+        return f"Invalid messages cursor: '{self.cursor}'"
+
+
+@dataclass(eq=False)
+class AmbiguousMessagesCursorException(MessageException):
+    @property
+    def message(self) -> str:
+        return "Only one of 'before' and 'after' cursors can be provided"
+
+
+@dataclass(eq=False)
+class InvalidBulkMessageException(MessageException):
+    line_number: int
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Line {self.line_number} is invalid: {self.reason}"
@@ -1,4 +1,7 @@
-from .messages import GetMessagesFilters  # noqa
+from .messages import (  # noqa
+    GetMessagesFilters,
+    MessagesCursor,
+)
 
 
-__all__ = ["GetMessagesFilters"]
+__all__ = ["GetMessagesFilters", "MessagesCursor"]
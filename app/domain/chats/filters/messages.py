@@ -1,7 +1,55 @@
+import base64
+import binascii
+import json
 from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from domain.chats.entities.messages import MessageEntity
+from domain.chats.exceptions.messages import (
+    AmbiguousMessagesCursorException,
+    InvalidMessagesCursorException,
+)
+
+
+@dataclass(frozen=True)
+class MessagesCursor:
+    """Позиция сообщения в ленте чата (created_at + oid) для keyset
+    пагинации."""
+
+    created_at: datetime
+    oid: UUID
+
+    @classmethod
+    def from_entity(cls, message: MessageEntity) -> "MessagesCursor":
+        return cls(created_at=message.created_at, oid=message.oid)
+
+    def encode(self) -> str:
+        raw = json.dumps([self.created_at.isoformat(), str(self.oid)], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "MessagesCursor":
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            created_at, oid = json.loads(raw)
+            return cls(created_at=datetime.fromisoformat(created_at), oid=UUID(oid))
+        except (binascii.Error, TypeError, ValueError):
+            raise InvalidMessagesCursorException(cursor=token)
 
 
 @dataclass
 class GetMessagesFilters:
     limit: int = 10
     offset: int = 0
+    before: MessagesCursor | None = None
+    after: MessagesCursor | None = None
+    with_total: bool = True
+
+    def __post_init__(self):
+        if self.before and self.after:
+            raise AmbiguousMessagesCursorException()
+
+    @property
+    def is_cursor_mode(self) -> bool:
+        return self.before is not None or self.after is not None
@@ -3,7 +3,10 @@ from abc import (
     abstractmethod,
 )
 from dataclasses import dataclass
-from typing import Iterable
+from typing import (
+    AsyncIterator,
+    Iterable,
+)
 from uuid import UUID
 
 from domain.chats.entities.chats import ChatEntity
@@ -31,9 +34,16 @@ class BaseMessagesRepository(ABC):
     @abstractmethod
     async def add_message(self, message: MessageEntity) -> None: ...
 
+    @abstractmethod
+    async def add_messages(self, messages: Iterable[MessageEntity]) -> None: ...
+
     @abstractmethod
     async def get_messages(
         self,
         chat_id: UUID,
         filters: GetMessagesFilters,
-    ) -> tuple[Iterable[MessageEntity], int]: ...
+    ) -> tuple[Iterable[MessageEntity], int | None]: ...
+
+    @abstractmethod
+    def iterate_messages(self, chat_id: UUID, batch_size: int) -> AsyncIterator[MessageEntity]:
+        """Все сообщения чата от старых к новым, без загрузки их в память целиком."""
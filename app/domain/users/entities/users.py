@@ -1,4 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import (
+    dataclass,
+    field,
+)
 from datetime import datetime
 from typing import Optional
 
@@ -16,3 +19,5 @@ class UserEntity(BaseEntity):
     name: UserNameValueObject
     last_online_at: Optional[datetime] = None
     avatar_path: Optional[str] = None
+    # Имя размера -> путь миниатюры аватара в хранилище
+    avatar_thumbnails: dict[str, str] = field(default_factory=dict)
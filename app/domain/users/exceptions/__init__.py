@@ -1,10 +1,12 @@
 from .users import (
+    AvatarTooLargeException,
     EmptyEmailException,
     EmptyPasswordException,
     EmptyUserNameException,
     InvalidCredentialsException,
     InvalidEmailException,
     InvalidPasswordException,
+    PasswordHasherBusyException,
     PasswordTooShortException,
     UserAlreadyExistsException,
     UserException,
@@ -14,6 +16,7 @@ from .users import (
 
 
 __all__ = (
+    "AvatarTooLargeException",
     "EmptyEmailException",
     "EmptyPasswordException",
     "EmptyUserNameException",
@@ -21,6 +24,7 @@ __all__ = (
     "InvalidCredentialsException",
     "InvalidEmailException",
     "InvalidPasswordException",
+    "PasswordHasherBusyException",
     "PasswordTooShortException",
     "UserAlreadyExistsException",
     "UserNameTooLongException",
@@ -98,3 +98,19 @@ class InvalidCredentialsException(UserException):
     @property
     def message(self) -> str:
         return "Invalid credentials"
+
+
+@dataclass(eq=False)
+class AvatarTooLargeException(UserException):
+    max_size: int
+
+    @property
+    def message(self) -> str:
+        return f"Avatar file is too large, maximum size is {self.max_size} bytes"
+
+
+@dataclass(eq=False)
+class PasswordHasherBusyException(UserException):
+    @property
+    def message(self) -> str:
+        return "Too many concurrent password operations, try again later"
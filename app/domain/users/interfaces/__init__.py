@@ -1,4 +1,10 @@
+from .password_hasher import BasePasswordHasher
 from .repository import BaseUserRepository
+from .thumbnails import BaseThumbnailGenerator
 
 
-__all__ = ("BaseUserRepository",)
+__all__ = (
+    "BasePasswordHasher",
+    "BaseThumbnailGenerator",
+    "BaseUserRepository",
+)
@@ -0,0 +1,22 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+
+class BasePasswordHasher(ABC):
+    @abstractmethod
+    async def hash_password(self, password: str) -> str: ...
+
+    @abstractmethod
+    async def verify_password(self, password: str, hashed_password: str) -> bool: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Хэш посчитан с другими параметрами, чем используются сейчас."""
+
+    async def calibrate(self) -> None:
+        """Подбирает параметры хэширования под железо при старте приложения."""
+
+    async def close(self) -> None:
+        """Освобождает ресурсы хэшера при остановке приложения."""
@@ -18,4 +18,16 @@ class BaseUserRepository(ABC):
     async def get_by_email(self, email: str) -> UserEntity | None: ...
 
     @abstractmethod
-    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> None: ...
+    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> tuple[str | None, dict[str, str]]:
+        """Меняет аватар и сбрасывает миниатюры предыдущего.
+
+        Возвращает замененные avatar_path и миниатюры - те, что были в
+        записи в момент обновления, а не прочитанные заранее.
+        """
+
+    @abstractmethod
+    async def update_avatar_thumbnails(self, user_id: UUID, avatar_path: str, thumbnails: dict[str, str]) -> bool:
+        """Сохраняет миниатюры, только если аватар пользователя все еще avatar_path."""
+
+    @abstractmethod
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None: ...
@@ -0,0 +1,18 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+
+
+class BaseThumbnailGenerator(ABC):
+    @property
+    @abstractmethod
+    def file_extension(self) -> str:
+        """Расширение файлов миниатюр, без точки."""
+
+    @abstractmethod
+    async def generate(self, content: bytes) -> dict[str, bytes]:
+        """Миниатюры изображения по имени размера; пустой словарь, если это не изображение."""
+
+    async def close(self) -> None:
+        """Освобождает ресурсы генератора при остановке приложения."""
@@ -1,16 +1,19 @@
 import re
+from contextlib import suppress
 from dataclasses import dataclass
-from io import BytesIO
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+)
 from uuid import (
     UUID,
     uuid4,
 )
 
-import bcrypt
-
 from domain.base.file_storage import BaseFileStorage
 from domain.users.entities import UserEntity
 from domain.users.exceptions import (
+    AvatarTooLargeException,
     EmptyPasswordException,
     InvalidCredentialsException,
     InvalidPasswordException,
@@ -18,7 +21,11 @@ from domain.users.exceptions import (
     UserAlreadyExistsException,
     UserNotFoundException,
 )
-from domain.users.interfaces.repository import BaseUserRepository
+from domain.users.interfaces import (
+    BasePasswordHasher,
+    BaseThumbnailGenerator,
+    BaseUserRepository,
+)
 from domain.users.value_objects import (
     EmailValueObject,
     UserNameValueObject,
@@ -26,12 +33,29 @@ from domain.users.value_objects import (
 
 
 MIN_PASSWORD_LENGTH = 8
+MAX_AVATAR_SIZE = 5 * 1024 * 1024
+
+
+async def _iter_bytes(content: bytes) -> AsyncIterator[bytes]:
+    yield content
+
+
+async def _limit_size(content: AsyncIterable[bytes], max_size: int) -> AsyncIterator[bytes]:
+    size = 0
+    async for chunk in content:
+        size += len(chunk)
+        if size > max_size:
+            raise AvatarTooLargeException(max_size=max_size)
+
+        yield chunk
 
 
 @dataclass
 class UserService:
     user_repository: BaseUserRepository
     file_storage: BaseFileStorage
+    password_hasher: BasePasswordHasher
+    thumbnail_generator: BaseThumbnailGenerator
 
     def _validate_password(self, password: str) -> None:
         if not password:
@@ -64,10 +88,7 @@ class UserService:
 
         self._validate_password(password)
 
-        hashed_password = bcrypt.hashpw(
-            password.encode("utf-8"),
-            bcrypt.gensalt(rounds=8),
-        ).decode("utf-8")
+        hashed_password = await self.password_hasher.hash_password(password)
 
         user = UserEntity(
             email=EmailValueObject(email),
@@ -98,23 +119,49 @@ class UserService:
         user = await self.user_repository.get_by_email(email)
 
         if user:
-            password_valid = bcrypt.checkpw(
-                password.encode("utf-8"),
-                user.hashed_password.encode("utf-8"),
-            )
+            password_valid = await self.password_hasher.verify_password(password, user.hashed_password)
 
         if not user or not password_valid:
             raise InvalidCredentialsException()
 
         return user
 
+    async def rehash_password(
+        self,
+        user_id: UUID,
+        password: str,
+    ) -> bool:
+        """Пересчитывает хэш пароля с текущей стоимостью, если он устарел.
+
+        Пароль проверяется еще раз, чтобы метод нельзя было использовать
+        для смены пароля. Возвращает True, если хэш был обновлен.
+        """
+        user = await self.user_repository.get_by_id(user_id)
+
+        if not user or not self.password_hasher.needs_rehash(user.hashed_password):
+            return False
+
+        if not await self.password_hasher.verify_password(password, user.hashed_password):
+            return False
+
+        hashed_password = await self.password_hasher.hash_password(password)
+        await self.user_repository.update_hashed_password(user_id, hashed_password)
+
+        return True
+
     async def upload_avatar(
         self,
         user_id: UUID,
-        file_obj: BytesIO,
+        content: AsyncIterable[bytes],
         filename: str,
     ) -> UserEntity:
-        """Upload avatar for user and update avatar_path."""
+        """Upload avatar for user and update avatar_path.
+
+        The size limit is checked while streaming, so an oversized file is
+        rejected as soon as it crosses MAX_AVATAR_SIZE. The avatar and
+        thumbnails replaced by the update are removed from storage once the
+        new one is saved, including thumbnails recorded during the upload.
+        """
         # Check if user exists (will raise UserNotFoundException if not)
         await self.get_by_id(user_id)
 
@@ -130,12 +177,49 @@ class UserService:
         avatar_path = f"avatars/{user_id}/{random_filename}"
 
         # Upload file to storage
-        await self.file_storage.upload_file(file_obj, avatar_path)
+        await self.file_storage.upload_file(_limit_size(content, MAX_AVATAR_SIZE), avatar_path)
+
+        # Update avatar_path in repository; it reports what the update actually replaced
+        previous_path, previous_thumbnails = await self.user_repository.update_avatar_path(user_id, avatar_path)
+        previous_files = [previous_path, *previous_thumbnails.values()] if previous_path else []
 
-        # Update avatar_path in repository
-        await self.user_repository.update_avatar_path(user_id, avatar_path)
+        # Old files are no longer referenced; a failed cleanup must not fail the upload
+        for file_path in previous_files:
+            with suppress(Exception):
+                await self.file_storage.delete_file(file_path)
 
         # Return updated user
         updated_user = await self.user_repository.get_by_id(user_id)
 
         return updated_user
+
+    async def generate_avatar_thumbnails(self, user_id: UUID, avatar_path: str) -> dict[str, str]:
+        """Generate thumbnails for the avatar and store them beside it.
+
+        Thumbnails are recorded only if avatar_path is still the user's avatar;
+        otherwise the freshly stored files are removed again.
+        """
+        content = await self.file_storage.read_file(avatar_path)
+        if content is None:
+            return {}
+
+        thumbnails = await self.thumbnail_generator.generate(content)
+        if not thumbnails:
+            return {}
+
+        # avatars/{user_id}/{uuid}.png -> avatars/{user_id}/{uuid}_{size}.jpg
+        directory, filename = avatar_path.rsplit("/", 1)
+        stem = filename.split(".", 1)[0]
+        thumbnail_paths = {
+            name: f"{directory}/{stem}_{name}.{self.thumbnail_generator.file_extension}" for name in thumbnails
+        }
+
+        for name, thumbnail in thumbnails.items():
+            await self.file_storage.upload_file(_iter_bytes(thumbnail), thumbnail_paths[name])
+
+        if not await self.user_repository.update_avatar_thumbnails(user_id, avatar_path, thumbnail_paths):
+            for thumbnail_path in thumbnail_paths.values():
+                await self.file_storage.delete_file(thumbnail_path)
+            return {}
+
+        return thumbnail_paths
@@ -0,0 +1,168 @@
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from uuid import UUID
+
+from infrastructure.cache.stats import CacheStats
+
+from domain.chats.entities.messages import MessageEntity
+
+
+# Грубая оценка памяти под сущность сообщения без учета текста (объекты, UUID, datetime)
+MESSAGE_OVERHEAD_BYTES = 600
+
+
+def _sort_key(message: MessageEntity) -> tuple:
+    return message.created_at, str(message.oid)
+
+
+def _estimate_size(message: MessageEntity) -> int:
+    return MESSAGE_OVERHEAD_BYTES + sys.getsizeof(message.content.as_generic_type())
+
+
+@dataclass
+class _ChatMessages:
+    # Новые сообщения первыми
+    messages: list[MessageEntity]
+    total: int
+    loaded_at: float
+    size: int
+
+    @property
+    def is_complete(self) -> bool:
+        """В кэше лежат все сообщения чата."""
+        return len(self.messages) >= self.total
+
+
+@dataclass
+class RecentMessagesCache:
+    """Последние per_chat_limit сообщений горячих чатов в памяти воркера.
+
+    Чаты вытесняются по LRU, пока число чатов не станет не больше
+    max_chats, а оценка занятой памяти - не больше max_bytes.
+    Запись через этот воркер обновляет кэш сразу (write-through), а запись
+    через другие воркеры видна не позже чем через ttl секунд.
+    """
+
+    per_chat_limit: int = 100
+    max_chats: int = 1000
+    max_bytes: int = 64 * 1024 * 1024
+    ttl: float = 30.0
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    _chats: OrderedDict[UUID, _ChatMessages] = field(default_factory=OrderedDict, init=False)
+    _size: int = field(default=0, init=False)
+    # Для чатов, которые сейчас загружаются: число загрузок и номер версии,
+    # растущий при каждой записи, чтобы не положить в кэш устаревшую загрузку
+    _loads: dict[UUID, int] = field(default_factory=dict, init=False)
+    _generations: dict[UUID, int] = field(default_factory=dict, init=False)
+
+    @property
+    def size(self) -> int:
+        """Оценка занятой памяти в байтах."""
+        return self._size
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(items=len(self._chats), hits=self.hits, misses=self.misses)
+
+    def get(self, chat_id: UUID, end: int) -> tuple[list[MessageEntity], int] | None:
+        """Первые end сообщений чата (новые первыми) и общее число, если кэш может их отдать."""
+        entry = self._chats.get(chat_id)
+
+        if entry is not None and time.monotonic() - entry.loaded_at > self.ttl:
+            self._evict(chat_id)
+            entry = None
+
+        if entry is None or (end > len(entry.messages) and not entry.is_complete):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._chats.move_to_end(chat_id)
+        return entry.messages[:end], entry.total
+
+    def start_load(self, chat_id: UUID) -> int:
+        self._loads[chat_id] = self._loads.get(chat_id, 0) + 1
+        return self._generations.get(chat_id, 0)
+
+    def finish_load(
+        self,
+        chat_id: UUID,
+        generation: int,
+        messages: list[MessageEntity] | None = None,
+        total: int | None = None,
+    ) -> None:
+        """Кладет загруженные сообщения, если за время загрузки в чат ничего не писали."""
+        is_current = self._generations.get(chat_id, 0) == generation
+
+        self._loads[chat_id] -= 1
+        if not self._loads[chat_id]:
+            del self._loads[chat_id]
+            self._generations.pop(chat_id, None)
+
+        if messages is None or total is None or not is_current:
+            return
+
+        self._evict(chat_id)
+        messages = list(messages[: self.per_chat_limit])
+        entry = _ChatMessages(
+            messages=messages,
+            total=total,
+            loaded_at=time.monotonic(),
+            size=sum(_estimate_size(message) for message in messages),
+        )
+        self._chats[chat_id] = entry
+        self._size += entry.size
+        self._shrink()
+
+    def add(self, message: MessageEntity) -> None:
+        """Write-through: новое сообщение сразу попадает в закэшированный чат."""
+        self._bump_generation(message.chat_id)
+
+        entry = self._chats.get(message.chat_id)
+        if entry is None:
+            return
+
+        # Почти всегда новое сообщение самое свежее и встает в начало
+        key = _sort_key(message)
+        position = 0
+        while position < len(entry.messages) and _sort_key(entry.messages[position]) > key:
+            position += 1
+
+        entry.messages.insert(position, message)
+        entry.total += 1
+        entry.size += _estimate_size(message)
+        self._size += _estimate_size(message)
+
+        while len(entry.messages) > self.per_chat_limit:
+            removed = entry.messages.pop()
+            entry.size -= _estimate_size(removed)
+            self._size -= _estimate_size(removed)
+
+        self._chats.move_to_end(message.chat_id)
+        self._shrink()
+
+    def invalidate(self, chat_id: UUID) -> None:
+        self._bump_generation(chat_id)
+        self._evict(chat_id)
+
+    def _bump_generation(self, chat_id: UUID) -> None:
+        if chat_id in self._loads:
+            self._generations[chat_id] = self._generations.get(chat_id, 0) + 1
+
+    def _evict(self, chat_id: UUID) -> None:
+        entry = self._chats.pop(chat_id, None)
+        if entry is not None:
+            self._size -= entry.size
+
+    def _shrink(self) -> None:
+        while self._chats and (len(self._chats) > self.max_chats or self._size > self.max_bytes):
+            _, entry = self._chats.popitem(last=False)
+            self._size -= entry.size
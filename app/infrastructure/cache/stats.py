@@ -0,0 +1,35 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    items: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+
+class SupportsCacheStats(Protocol):
+    @property
+    def stats(self) -> CacheStats: ...
+
+
+@dataclass
+class CacheRegistry:
+    """Именованные кэши воркера, чтобы отдавать их статистику наружу."""
+
+    _caches: dict[str, SupportsCacheStats] = field(default_factory=dict, init=False)
+
+    def register(self, name: str, cache: SupportsCacheStats) -> None:
+        self._caches[name] = cache
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        return {name: cache.stats for name, cache in self._caches.items()}
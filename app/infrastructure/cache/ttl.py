@@ -0,0 +1,114 @@
+import time
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Generic,
+    Hashable,
+    TypeVar,
+)
+
+from infrastructure.cache.stats import CacheStats
+
+
+# Отличает отсутствие ключа от закэшированного None (negative caching)
+MISSING: Any = object()
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+
+@dataclass
+class TTLCache(Generic[KT, VT]):
+    """LRU кэш в памяти воркера с временем жизни у каждого значения.
+
+    Read-through загрузка оборачивается в begin_load/finish_load: если
+    за время загрузки ключ записали или удалили, прочитанное до этого
+    значение в кэш не попадает.
+    """
+
+    maxsize: int = 10_000
+    ttl: float = 60.0
+
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    _items: OrderedDict[KT, tuple[float, VT]] = field(default_factory=OrderedDict, init=False)
+    # Для ключей, которые сейчас загружаются: число загрузок и номер версии,
+    # растущий при каждой записи и удалении
+    _loads: dict[KT, int] = field(default_factory=dict, init=False)
+    _generations: dict[KT, int] = field(default_factory=dict, init=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(items=len(self._items), hits=self.hits, misses=self.misses)
+
+    def get(self, key: KT) -> VT:
+        """Значение по ключу или MISSING, если его нет или оно устарело."""
+        item = self._items.get(key)
+
+        if item is None or item[0] < time.monotonic():
+            if item is not None:
+                del self._items[key]
+            self.misses += 1
+            return MISSING
+
+        self.hits += 1
+        self._items.move_to_end(key)
+        return item[1]
+
+    def begin_load(self, key: KT) -> int:
+        """Отмечает начало загрузки ключа и возвращает номер версии для finish_load."""
+        self._loads[key] = self._loads.get(key, 0) + 1
+        return self._generations.get(key, 0)
+
+    def finish_load(self, key: KT, generation: int, value: VT = MISSING, ttl: float | None = None) -> bool:
+        """Завершает загрузку и кладет value, если ключ с begin_load не менялся.
+
+        Без value (загрузка не удалась) только снимает отметку. Возвращает,
+        попало ли значение в кэш.
+        """
+        is_current = self._generations.get(key, 0) == generation
+
+        self._loads[key] -= 1
+        if not self._loads[key]:
+            del self._loads[key]
+            self._generations.pop(key, None)
+
+        if value is MISSING or not is_current:
+            return False
+
+        self._store(key, value, ttl)
+        return True
+
+    def set(self, key: KT, value: VT, ttl: float | None = None) -> None:
+        self._bump_generation(key)
+        self._store(key, value, ttl)
+
+    def delete(self, key: KT) -> None:
+        self._bump_generation(key)
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        for key in self._loads:
+            self._bump_generation(key)
+        self._items.clear()
+
+    def _bump_generation(self, key: KT) -> None:
+        if key in self._loads:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _store(self, key: KT, value: VT, ttl: float | None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
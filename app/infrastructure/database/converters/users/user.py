@@ -15,6 +15,7 @@ def user_entity_to_model(entity: UserEntity) -> UserModel:
         name=entity.name.as_generic_type(),
         last_online_at=entity.last_online_at,
         avatar_path=entity.avatar_path,
+        avatar_thumbnails=entity.avatar_thumbnails,
         created_at=entity.created_at,
         updated_at=entity.updated_at,
     )
@@ -28,6 +29,7 @@ def user_model_to_entity(model: UserModel) -> UserEntity:
         name=UserNameValueObject(value=model.name),
         last_online_at=model.last_online_at,
         avatar_path=model.avatar_path,
+        avatar_thumbnails=dict(model.avatar_thumbnails or {}),
         created_at=model.created_at,
         updated_at=model.updated_at,
     )
@@ -0,0 +1,14 @@
+from infrastructure.database.indexes.mongo import (
+    CHATS_INDEXES,
+    MESSAGES_INDEXES,
+    MongoDBIndexManager,
+    MongoIndexSpec,
+)
+
+
+__all__ = [
+    "CHATS_INDEXES",
+    "MESSAGES_INDEXES",
+    "MongoDBIndexManager",
+    "MongoIndexSpec",
+]
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from domain.base.exceptions import ApplicationException
+
+
+@dataclass(eq=False)
+class MongoIndexConflictException(ApplicationException):
+    collection_name: str
+    index_name: str
+    reason: str
+
+    @property
+    def message(self) -> str:
+        return f"Index '{self.index_name}' on collection '{self.collection_name}' conflicts with existing one: {self.reason}"
@@ -0,0 +1,123 @@
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Mapping,
+    Sequence,
+)
+
+from infrastructure.database.indexes.exceptions import MongoIndexConflictException
+from motor.core import AgnosticClient
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    IndexModel,
+)
+from pymongo.errors import OperationFailure
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MongoIndexSpec:
+    name: str
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+
+    def to_index_model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, unique=self.unique)
+
+    def matches(self, index_info: Mapping[str, Any]) -> bool:
+        return self.has_same_keys(index_info) and bool(index_info.get("unique", False)) == self.unique
+
+    def has_same_keys(self, index_info: Mapping[str, Any]) -> bool:
+        keys = [
+            (field, direction if isinstance(direction, str) else int(direction))
+            for field, direction in index_info["key"]
+        ]
+        return keys == list(self.keys)
+
+
+CHATS_INDEXES: tuple[MongoIndexSpec, ...] = (
+    MongoIndexSpec(name="oid_unique", keys=(("oid", ASCENDING),), unique=True),
+    MongoIndexSpec(name="title_unique", keys=(("title", ASCENDING),), unique=True),
+)
+
+MESSAGES_INDEXES: tuple[MongoIndexSpec, ...] = (
+    MongoIndexSpec(name="oid_unique", keys=(("oid", ASCENDING),), unique=True),
+    MongoIndexSpec(
+        name="chat_id_created_at_oid",
+        keys=(("chat_id", ASCENDING), ("created_at", DESCENDING), ("oid", DESCENDING)),
+    ),
+)
+
+
+@dataclass
+class MongoDBIndexManager:
+    """Идемпотентно создает индексы коллекций при старте приложения."""
+
+    mongo_db_client: AgnosticClient
+    mongo_db_database_name: str
+    indexes: Mapping[str, Sequence[MongoIndexSpec]]
+
+    async def ensure_indexes(self) -> list[str]:
+        """Создает недостающие индексы и возвращает их список в формате
+        collection.index.
+
+        Бросает MongoIndexConflictException, если существующий индекс
+        не совпадает с ожидаемым.
+        """
+        created = []
+
+        for collection_name, specs in self.indexes.items():
+            collection = self.mongo_db_client[self.mongo_db_database_name][collection_name]
+            existing = await collection.index_information()
+
+            missing = [spec for spec in specs if not self._is_present(collection_name, spec, existing)]
+            if not missing:
+                continue
+
+            try:
+                await collection.create_indexes([spec.to_index_model() for spec in missing])
+            except OperationFailure as error:
+                raise MongoIndexConflictException(
+                    collection_name=collection_name,
+                    index_name=", ".join(spec.name for spec in missing),
+                    reason=str(error),
+                )
+
+            for spec in missing:
+                logger.info("Created MongoDB index %s on collection %s", spec.name, collection_name)
+                created.append(f"{collection_name}.{spec.name}")
+
+        return created
+
+    @staticmethod
+    def _is_present(
+        collection_name: str,
+        spec: MongoIndexSpec,
+        existing: Mapping[str, Mapping[str, Any]],
+    ) -> bool:
+        if spec.name in existing:
+            if not spec.matches(existing[spec.name]):
+                raise MongoIndexConflictException(
+                    collection_name=collection_name,
+                    index_name=spec.name,
+                    reason=f"existing definition is {dict(existing[spec.name])}",
+                )
+            return True
+
+        for name, index_info in existing.items():
+            if not spec.has_same_keys(index_info):
+                continue
+
+            if not spec.matches(index_info):
+                raise MongoIndexConflictException(
+                    collection_name=collection_name,
+                    index_name=spec.name,
+                    reason=f"index '{name}' has the same keys but different options",
+                )
+            return True
+
+        return False
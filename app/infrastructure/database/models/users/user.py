@@ -5,7 +5,9 @@ from infrastructure.database.models.base import TimedBaseModel
 from sqlalchemy import (
     DateTime,
     String,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -24,3 +26,9 @@ class UserModel(TimedBaseModel):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     last_online_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     avatar_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    avatar_thumbnails: Mapped[dict[str, str]] = mapped_column(
+        JSONB,
+        nullable=False,
+        default=dict,
+        server_default=text("'{}'::jsonb"),
+    )
@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from infrastructure.cache.ttl import (
+    MISSING,
+    TTLCache,
+)
+
+from domain.chats.entities.chats import ChatEntity
+from domain.chats.interfaces.repository import BaseChatsRepository
+
+
+@dataclass
+class CachedChatsRepository(BaseChatsRepository):
+    """Read-through кэш чатов по oid.
+
+    Отсутствующие чаты тоже кэшируются (как None) на более короткий
+    negative_ttl. Удаление и создание через этот воркер сразу обновляют
+    кэш, изменения через другие воркеры видны не позже чем через TTL.
+    """
+
+    repository: BaseChatsRepository
+    cache: TTLCache[str, ChatEntity | None]
+    negative_ttl: float = 5.0
+
+    async def get_chat_by_oid(self, oid: str) -> ChatEntity | None:
+        chat = self.cache.get(oid)
+        if chat is not MISSING:
+            return chat
+
+        # Удаление или создание чата во время загрузки не даст положить в кэш устаревший результат
+        generation = self.cache.begin_load(oid)
+        try:
+            chat = await self.repository.get_chat_by_oid(oid)
+        except Exception:
+            self.cache.finish_load(oid, generation)
+            raise
+
+        self.cache.finish_load(oid, generation, chat, ttl=None if chat else self.negative_ttl)
+
+        return chat
+
+    async def check_chat_exists_by_title(self, title: str) -> bool:
+        return await self.repository.check_chat_exists_by_title(title)
+
+    async def add_chat(self, chat: ChatEntity) -> None:
+        await self.repository.add_chat(chat)
+        self.cache.set(str(chat.oid), chat)
+
+    async def delete_chat_by_oid(self, chat_oid: str) -> None:
+        await self.repository.delete_chat_by_oid(chat_oid)
+        self.cache.delete(chat_oid)
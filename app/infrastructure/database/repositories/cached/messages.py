@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Iterable,
+)
+from uuid import UUID
+
+from infrastructure.cache.recent_messages import RecentMessagesCache
+
+from domain.chats.entities.messages import MessageEntity
+from domain.chats.filters.messages import GetMessagesFilters
+from domain.chats.interfaces.repository import BaseMessagesRepository
+
+
+@dataclass
+class CachedMessagesRepository(BaseMessagesRepository):
+    """Декоратор репозитория сообщений: первые страницы горячих чатов
+    отдаются из RecentMessagesCache, записи проходят в кэш сразу.
+    """
+
+    repository: BaseMessagesRepository
+    cache: RecentMessagesCache
+
+    async def add_message(self, message: MessageEntity) -> None:
+        await self.repository.add_message(message)
+        self.cache.add(message)
+
+    async def add_messages(self, messages: Iterable[MessageEntity]) -> None:
+        messages = list(messages)
+        await self.repository.add_messages(messages)
+
+        # Импорт пишет много сообщений разом, дешевле перечитать чат при следующем запросе
+        for chat_id in {message.chat_id for message in messages}:
+            self.cache.invalidate(chat_id)
+
+    async def get_messages(
+        self,
+        chat_id: UUID,
+        filters: GetMessagesFilters,
+    ) -> tuple[Iterable[MessageEntity], int | None]:
+        if filters.is_cursor_mode:
+            return await self.repository.get_messages(chat_id, filters)
+
+        end = filters.offset + filters.limit
+        cached = self.cache.get(chat_id, end=end)
+        if cached is None:
+            # Глубокие страницы длинных чатов в кэш не помещаются
+            if end > self.cache.per_chat_limit:
+                return await self.repository.get_messages(chat_id, filters)
+
+            cached = await self._load(chat_id)
+
+        messages, total = cached
+        return messages[filters.offset : end], total if filters.with_total else None
+
+    def iterate_messages(self, chat_id: UUID, batch_size: int) -> AsyncIterator[MessageEntity]:
+        return self.repository.iterate_messages(chat_id, batch_size)
+
+    async def _load(self, chat_id: UUID) -> tuple[list[MessageEntity], int]:
+        generation = self.cache.start_load(chat_id)
+
+        try:
+            messages, total = await self.repository.get_messages(
+                chat_id,
+                GetMessagesFilters(limit=self.cache.per_chat_limit, with_total=True),
+            )
+        except Exception:
+            self.cache.finish_load(chat_id, generation)
+            raise
+
+        messages = list(messages)
+        self.cache.finish_load(chat_id, generation, messages, total)
+
+        return messages, total
@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from infrastructure.cache.ttl import (
+    MISSING,
+    TTLCache,
+)
+
+from domain.users.entities import UserEntity
+from domain.users.interfaces.repository import BaseUserRepository
+
+
+@dataclass
+class CachedUserRepository(BaseUserRepository):
+    """Кэш пользователей по id для частых запросов вроде /users/me.
+
+    get_by_email не кэшируется: он нужен для входа, где хэш пароля должен
+    быть свежим. Изменения через этот воркер сбрасывают запись сразу,
+    через другие - видны не позже чем через TTL кэша.
+    """
+
+    repository: BaseUserRepository
+    cache: TTLCache[UUID, UserEntity]
+
+    async def add(self, user: UserEntity) -> None:
+        await self.repository.add(user)
+        self.cache.delete(user.oid)
+
+    async def get_by_id(self, user_id: UUID) -> UserEntity | None:
+        user = self.cache.get(user_id)
+        if user is not MISSING:
+            return user
+
+        # Изменение во время загрузки не даст положить в кэш пользователя, прочитанного до него
+        generation = self.cache.begin_load(user_id)
+        try:
+            user = await self.repository.get_by_id(user_id)
+        except Exception:
+            self.cache.finish_load(user_id, generation)
+            raise
+
+        self.cache.finish_load(user_id, generation, MISSING if user is None else user)
+
+        return user
+
+    async def get_by_email(self, email: str) -> UserEntity | None:
+        return await self.repository.get_by_email(email)
+
+    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> tuple[str | None, dict[str, str]]:
+        previous = await self.repository.update_avatar_path(user_id, avatar_path)
+        self.cache.delete(user_id)
+        return previous
+
+    async def update_avatar_thumbnails(self, user_id: UUID, avatar_path: str, thumbnails: dict[str, str]) -> bool:
+        updated = await self.repository.update_avatar_thumbnails(user_id, avatar_path, thumbnails)
+        self.cache.delete(user_id)
+        return updated
+
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None:
+        await self.repository.update_hashed_password(user_id, hashed_password)
+        self.cache.delete(user_id)
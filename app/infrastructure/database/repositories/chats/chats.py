@@ -5,8 +5,10 @@ from infrastructure.database.converters.chats.chats import (
     chat_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoDBRepository
+from pymongo.errors import DuplicateKeyError
 
 from domain.chats.entities.chats import ChatEntity
+from domain.chats.exceptions.chats import ChatAlreadyExistsException
 from domain.chats.interfaces.repository import BaseChatsRepository
 
 
@@ -24,7 +26,13 @@ class MongoDBChatsRepository(BaseChatsRepository, BaseMongoDBRepository):
         return bool(await self._collection.find_one(filter={"title": title}))
 
     async def add_chat(self, chat: ChatEntity) -> None:
-        await self._collection.insert_one(chat_entity_to_document(chat))
+        try:
+            await self._collection.insert_one(
+                {**chat_entity_to_document(chat), "messages_count": 0},
+            )
+        except DuplicateKeyError:
+            # Гонка между check_chat_exists_by_title и вставкой ловится уникальным индексом
+            raise ChatAlreadyExistsException(title=chat.title.as_generic_type())
 
     async def delete_chat_by_oid(self, chat_oid: str) -> None:
         await self._collection.delete_one(filter={"oid": chat_oid})
@@ -1,5 +1,10 @@
+import asyncio
 from dataclasses import dataclass
-from typing import Iterable
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+)
 from uuid import UUID
 
 from infrastructure.database.converters.chats.chats import (
@@ -7,28 +12,140 @@ from infrastructure.database.converters.chats.chats import (
     message_entity_to_document,
 )
 from infrastructure.database.repositories.base.mongo import BaseMongoDBRepository
+from infrastructure.database.repositories.chats.write_buffer import (
+    MongoDBMessagesWriteBuffer,
+    update_messages_counts,
+)
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+)
+from pymongo.errors import BulkWriteError
 
 from domain.chats.entities.messages import MessageEntity
-from domain.chats.filters.messages import GetMessagesFilters
+from domain.chats.filters.messages import (
+    GetMessagesFilters,
+    MessagesCursor,
+)
 from domain.chats.interfaces.repository import BaseMessagesRepository
 
 
+def _build_cursor_filter(cursor: MessagesCursor, operator: str) -> dict[str, Any]:
+    # (created_at, oid) строго меньше/больше курсора; oid разрешает коллизии по времени
+    return {
+        "$or": [
+            {"created_at": {operator: cursor.created_at}},
+            {"created_at": cursor.created_at, "oid": {operator: str(cursor.oid)}},
+        ],
+    }
+
+
 @dataclass
 class MongoDBMessagesRepository(BaseMessagesRepository, BaseMongoDBRepository):
+    mongo_db_chats_collection_name: str
+
+    @property
+    def _chats_collection(self):
+        return self.mongo_db_client[self.mongo_db_database_name][self.mongo_db_chats_collection_name]
+
     async def add_message(self, message: MessageEntity) -> None:
-        await self._collection.insert_one(message_entity_to_document(message))
+        document = message_entity_to_document(message)
+        await self._collection.insert_one(document)
+        await update_messages_counts(self._chats_collection, [document])
+
+    async def add_messages(self, messages: Iterable[MessageEntity]) -> None:
+        documents = [message_entity_to_document(message) for message in messages]
+        if not documents:
+            return
+
+        try:
+            await self._collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            # Вставленные до ошибки сообщения все равно должны попасть в счетчик
+            failed = {error["index"] for error in exc.details.get("writeErrors", [])}
+            inserted = [document for index, document in enumerate(documents) if index not in failed]
+            await update_messages_counts(self._chats_collection, inserted)
+            raise
+
+        await update_messages_counts(self._chats_collection, documents)
 
     async def get_messages(
         self,
         chat_id: UUID,
         filters: GetMessagesFilters,
-    ) -> tuple[Iterable[MessageEntity], int]:
+    ) -> tuple[Iterable[MessageEntity], int | None]:
+        if not filters.with_total:
+            return await self._find_messages(chat_id, filters), None
+
+        messages, total = await asyncio.gather(
+            self._find_messages(chat_id, filters),
+            self._get_messages_count(chat_id),
+        )
+        return messages, total
+
+    async def iterate_messages(self, chat_id: UUID, batch_size: int) -> AsyncIterator[MessageEntity]:
+        cursor = (
+            self._collection.find({"chat_id": str(chat_id)})
+            .sort([("created_at", ASCENDING), ("oid", ASCENDING)])
+            .batch_size(batch_size)
+        )
+
+        async for document in cursor:
+            yield message_document_to_entity(document)
+
+    async def _get_messages_count(self, chat_id: UUID) -> int:
+        chat_document = await self._chats_collection.find_one(
+            filter={"oid": str(chat_id)},
+            projection={"messages_count": 1},
+        )
+        if chat_document and "messages_count" in chat_document:
+            return chat_document["messages_count"]
+
+        # Чаты без счетчика (созданные до его появления или сброшенные после ошибки $inc)
+        # считаем один раз и сохраняем. Пока поля нет, $inc эти чаты пропускает
+        total = await self._collection.count_documents({"chat_id": str(chat_id)})
+        if chat_document:
+            await self._chats_collection.update_one(
+                filter={"oid": str(chat_id), "messages_count": {"$exists": False}},
+                update={"$set": {"messages_count": total}},
+            )
+
+        return total
+
+    async def _find_messages(
+        self,
+        chat_id: UUID,
+        filters: GetMessagesFilters,
+    ) -> list[MessageEntity]:
         find = {"chat_id": str(chat_id)}
+        direction = DESCENDING
+
+        if filters.before:
+            find.update(_build_cursor_filter(filters.before, "$lt"))
+        elif filters.after:
+            find.update(_build_cursor_filter(filters.after, "$gt"))
+            direction = ASCENDING
+
+        cursor = self._collection.find(find).sort([("created_at", direction), ("oid", direction)])
 
-        cursor = self._collection.find(find).limit(filters.limit).skip(filters.offset)
+        if not filters.is_cursor_mode:
+            cursor = cursor.skip(filters.offset)
+
+        cursor = cursor.limit(filters.limit)
 
         messages = [message_document_to_entity(message) async for message in cursor]
 
-        total = await self._collection.count_documents(find)
+        if direction == ASCENDING:
+            messages.reverse()
 
-        return messages, total
+        return messages
+
+
+@dataclass
+class BufferedMongoDBMessagesRepository(MongoDBMessagesRepository):
+    """Пишет сообщения через общий group-commit буфер, чтение - как у базового репозитория."""
+
+    write_buffer: MongoDBMessagesWriteBuffer
+
+    async def add_message(self, message: MessageEntity) -> None:
+        await self.write_buffer.add(message_entity_to_document(message))
@@ -0,0 +1,159 @@
+import asyncio
+import logging
+from collections import Counter
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    Iterable,
+)
+
+from motor.core import AgnosticClient
+from pymongo import UpdateOne
+from pymongo.errors import (
+    BulkWriteError,
+    DuplicateKeyError,
+    PyMongoError,
+    WriteError,
+)
+
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+def build_messages_count_updates(documents: Iterable[dict[str, Any]]) -> list[UpdateOne]:
+    # Один $inc на чат вместо update_one на каждое сообщение. Чаты без счетчика
+    # (созданные до его появления) не трогаем: $inc создал бы поле с неполным
+    # значением, и пересчет при чтении total уже не запустился бы
+    counts = Counter(document["chat_id"] for document in documents)
+    return [
+        UpdateOne({"oid": chat_id, "messages_count": {"$exists": True}}, {"$inc": {"messages_count": count}})
+        for chat_id, count in counts.items()
+    ]
+
+
+async def update_messages_counts(chats_collection, documents: Iterable[dict[str, Any]]) -> None:
+    """Увеличивает messages_count чатов на число записанных сообщений.
+
+    Сообщения к этому моменту уже записаны, поэтому ошибка не
+    пробрасывается: счетчики затронутых чатов удаляются, и следующее
+    чтение total пересчитает их по коллекции сообщений.
+    """
+    documents = list(documents)
+    updates = build_messages_count_updates(documents)
+    if not updates:
+        return
+
+    try:
+        await chats_collection.bulk_write(updates, ordered=False)
+    except PyMongoError:
+        chat_ids = sorted({document["chat_id"] for document in documents})
+        logger.exception("Failed to update messages_count of chats %s, resetting the counters", chat_ids)
+        try:
+            await chats_collection.update_many(
+                {"oid": {"$in": chat_ids}},
+                {"$unset": {"messages_count": ""}},
+            )
+        except PyMongoError:
+            logger.exception("Failed to reset messages_count of chats %s", chat_ids)
+
+
+@dataclass
+class MongoDBMessagesWriteBuffer:
+    """Group commit для вставки сообщений.
+
+    Документы копятся max_delay секунд или до max_size штук и пишутся одним
+    неупорядоченным insert_many. Вызывающий ждет, пока его пачка не запишется.
+    Пачки пишутся строго по очереди, поэтому сообщения одного чата не
+    обгоняют друг друга.
+    """
+
+    mongo_db_client: AgnosticClient
+    mongo_db_database_name: str
+    mongo_db_collection_name: str
+    mongo_db_chats_collection_name: str
+    max_delay: float = 0.005
+    max_size: int = 500
+
+    _pending: list[tuple[dict[str, Any], asyncio.Future]] = field(default_factory=list, init=False)
+    _flush_timer: asyncio.TimerHandle | None = field(default=None, init=False)
+    _flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _flush_tasks: set[asyncio.Task] = field(default_factory=set, init=False)
+
+    @property
+    def _collection(self):
+        return self.mongo_db_client[self.mongo_db_database_name][self.mongo_db_collection_name]
+
+    @property
+    def _chats_collection(self):
+        return self.mongo_db_client[self.mongo_db_database_name][self.mongo_db_chats_collection_name]
+
+    async def add(self, document: dict[str, Any]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((document, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush_pending()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush_pending)
+
+        await future
+
+    async def close(self) -> None:
+        """Дописывает накопленные документы и дожидается всех пачек."""
+        self._flush_pending()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        async with self._flush_lock:
+            try:
+                errors = await self._write(batch)
+            except Exception as exc:
+                errors = dict.fromkeys(range(len(batch)), exc)
+
+        for index, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+
+            if index in errors:
+                future.set_exception(errors[index])
+            else:
+                future.set_result(None)
+
+    async def _write(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> dict[int, Exception]:
+        documents = [document for document, _ in batch]
+        errors: dict[int, Exception] = {}
+
+        try:
+            await self._collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                error_class = DuplicateKeyError if error.get("code") == DUPLICATE_KEY_ERROR_CODE else WriteError
+                errors[error["index"]] = error_class(error.get("errmsg"), error.get("code"), error)
+
+        # Сообщения уже записаны: исход пачки определяется только вставкой,
+        # сбой обновления счетчиков логируется внутри и не валит вызывающих
+        await update_messages_counts(
+            self._chats_collection,
+            (document for index, document in enumerate(documents) if index not in errors),
+        )
+
+        return errors
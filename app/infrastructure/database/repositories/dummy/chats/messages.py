@@ -2,7 +2,10 @@ from dataclasses import (
     dataclass,
     field,
 )
-from typing import Iterable
+from typing import (
+    AsyncIterator,
+    Iterable,
+)
 from uuid import UUID
 
 from domain.chats.entities.messages import MessageEntity
@@ -10,6 +13,10 @@ from domain.chats.filters.messages import GetMessagesFilters
 from domain.chats.interfaces.repository import BaseMessagesRepository
 
 
+def _sort_key(message: MessageEntity) -> tuple:
+    return message.created_at, str(message.oid)
+
+
 @dataclass
 class DummyInMemoryMessagesRepository(BaseMessagesRepository):
     _saved_messages: list[MessageEntity] = field(default_factory=list, kw_only=True)
@@ -17,21 +24,40 @@ class DummyInMemoryMessagesRepository(BaseMessagesRepository):
     async def add_message(self, message: MessageEntity) -> None:
         self._saved_messages.append(message)
 
+    async def add_messages(self, messages: Iterable[MessageEntity]) -> None:
+        self._saved_messages.extend(messages)
+
     async def get_messages(
         self,
         chat_id: UUID,
         filters: GetMessagesFilters,
-    ) -> tuple[Iterable[MessageEntity], int]:
+    ) -> tuple[Iterable[MessageEntity], int | None]:
         filtered_messages = [message for message in self._saved_messages if message.chat_id == chat_id]
 
-        total = len(filtered_messages)
+        total = len(filtered_messages) if filters.with_total else None
 
         sorted_messages = sorted(
             filtered_messages,
-            key=lambda m: m.created_at,
+            key=_sort_key,
             reverse=True,
         )
 
+        if filters.before:
+            before_key = (filters.before.created_at, str(filters.before.oid))
+            older_messages = [message for message in sorted_messages if _sort_key(message) < before_key]
+            return older_messages[: filters.limit], total
+
+        if filters.after:
+            after_key = (filters.after.created_at, str(filters.after.oid))
+            newer_messages = [message for message in sorted_messages if _sort_key(message) > after_key]
+            return newer_messages[-filters.limit :], total
+
         paginated_messages = sorted_messages[filters.offset : filters.offset + filters.limit]
 
         return paginated_messages, total
+
+    async def iterate_messages(self, chat_id: UUID, batch_size: int) -> AsyncIterator[MessageEntity]:
+        filtered_messages = [message for message in self._saved_messages if message.chat_id == chat_id]
+
+        for message in sorted(filtered_messages, key=_sort_key):
+            yield message
@@ -28,8 +28,26 @@ class DummyInMemoryUserRepository(BaseUserRepository):
         except StopIteration:
             return None
 
-    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> None:
+    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> tuple[str | None, dict[str, str]]:
         for user in self._saved_users:
             if user.oid == user_id:
+                previous = user.avatar_path, user.avatar_thumbnails
                 user.avatar_path = avatar_path
+                user.avatar_thumbnails = {}
+                return previous
+
+        return None, {}
+
+    async def update_avatar_thumbnails(self, user_id: UUID, avatar_path: str, thumbnails: dict[str, str]) -> bool:
+        for user in self._saved_users:
+            if user.oid == user_id and user.avatar_path == avatar_path:
+                user.avatar_thumbnails = dict(thumbnails)
+                return True
+
+        return False
+
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None:
+        for user in self._saved_users:
+            if user.oid == user_id:
+                user.hashed_password = hashed_password
                 return
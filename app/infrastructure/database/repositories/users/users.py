@@ -41,8 +41,44 @@ class SQLAlchemyUserRepository(BaseUserRepository):
             result = res.scalar_one_or_none()
             return user_model_to_entity(result) if result else None
 
-    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> None:
+    async def update_avatar_path(self, user_id: UUID, avatar_path: str | None) -> tuple[str | None, dict[str, str]]:
         async with self.database.get_session() as session:
-            stmt = update(UserModel).where(UserModel.oid == user_id).values(avatar_path=avatar_path)
+            # RETURNING отдает новые значения, старые берем из заблокированной строки в FROM
+            previous = (
+                select(UserModel.oid, UserModel.avatar_path, UserModel.avatar_thumbnails)
+                .where(UserModel.oid == user_id)
+                .with_for_update()
+                .subquery()
+            )
+            stmt = (
+                update(UserModel)
+                .where(UserModel.oid == previous.c.oid)
+                .values(avatar_path=avatar_path, avatar_thumbnails={})
+                .returning(previous.c.avatar_path, previous.c.avatar_thumbnails)
+            )
+            row = (await session.execute(stmt)).one_or_none()
+            await session.commit()
+
+        if row is None:
+            return None, {}
+
+        return row.avatar_path, row.avatar_thumbnails or {}
+
+    async def update_avatar_thumbnails(self, user_id: UUID, avatar_path: str, thumbnails: dict[str, str]) -> bool:
+        async with self.database.get_session() as session:
+            # Условие на avatar_path не дает записать миниатюры поверх нового аватара
+            stmt = (
+                update(UserModel)
+                .where(UserModel.oid == user_id, UserModel.avatar_path == avatar_path)
+                .values(avatar_thumbnails=thumbnails)
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+
+        return result.rowcount > 0
+
+    async def update_hashed_password(self, user_id: UUID, hashed_password: str) -> None:
+        async with self.database.get_session() as session:
+            stmt = update(UserModel).where(UserModel.oid == user_id).values(hashed_password=hashed_password)
             await session.execute(stmt)
             await session.commit()
@@ -0,0 +1,13 @@
+from domain.users.interfaces import BaseThumbnailGenerator
+
+
+class DummyThumbnailGenerator(BaseThumbnailGenerator):
+    """Thumbnail generator for testing: labels the source bytes with the size name."""
+
+    file_extension = "jpg"
+
+    def __init__(self, sizes: tuple[int, ...] = (64, 128)) -> None:
+        self.sizes = sizes
+
+    async def generate(self, content: bytes) -> dict[str, bytes]:
+        return {str(size): f"{size}:".encode() + content for size in self.sizes}
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import (
+    dataclass,
+    field,
+)
+from io import BytesIO
+
+from PIL import (
+    Image,
+    ImageOps,
+)
+
+from domain.users.interfaces import BaseThumbnailGenerator
+
+
+logger = logging.getLogger(__name__)
+
+# Изображения больше этого числа пикселей не декодируем: 5MiB PNG может развернуться в гигабайты
+MAX_SOURCE_PIXELS = 50_000_000
+
+
+def render_thumbnails(content: bytes, sizes: tuple[int, ...], quality: int) -> dict[str, bytes]:
+    """Квадратные JPEG миниатюры каждого размера. Выполняется в дочернем процессе."""
+    with Image.open(BytesIO(content)) as image:
+        if image.width * image.height > MAX_SOURCE_PIXELS:
+            raise ValueError(f"Image is too large: {image.width}x{image.height}")
+
+        # JPEG декодер сразу уменьшает изображение в 2-8 раз, не доходя до полного размера
+        image.draft("RGB", (max(sizes), max(sizes)))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+
+        thumbnails = {}
+        for size in sizes:
+            thumbnail = ImageOps.fit(image, (size, size), method=Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            thumbnail.save(buffer, format="JPEG", quality=quality, optimize=True, progressive=True)
+            thumbnails[str(size)] = buffer.getvalue()
+
+    return thumbnails
+
+
+@dataclass
+class PillowThumbnailGenerator(BaseThumbnailGenerator):
+    """Миниатюры через Pillow в пуле процессов.
+
+    Декодирование и ресайз держат GIL, поэтому нужны процессы, а не потоки.
+    Пул создается при первом изображении и использует spawn: fork процесса
+    с уже запущенными потоками (bcrypt, драйверы БД) небезопасен.
+    Одновременно в пуле не больше 2 * max_workers изображений, остальные
+    ждут, чтобы всплеск загрузок не копил исходники в памяти очереди.
+    """
+
+    sizes: tuple[int, ...] = (64, 128, 256)
+    quality: int = 80
+    max_workers: int = 2
+
+    _executor: ProcessPoolExecutor | None = field(default=None, init=False)
+    _semaphore: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(2 * self.max_workers)
+
+    @property
+    def file_extension(self) -> str:
+        return "jpg"
+
+    async def generate(self, content: bytes) -> dict[str, bytes]:
+        async with self._semaphore:
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(),
+                    render_thumbnails,
+                    content,
+                    self.sizes,
+                    self.quality,
+                )
+            except BrokenProcessPool:
+                # Процесс упал (например, OOM killer), следующий вызов создаст новый пул
+                logger.exception("Thumbnail process pool is broken, recreating it")
+                await self.close()
+                return {}
+            except (OSError, ValueError, Image.DecompressionBombError) as exc:
+                logger.info("Skipping thumbnails for unsupported image: %s", exc)
+                return {}
+
+    async def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        return self._executor
@@ -0,0 +1,79 @@
+import time
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    Iterable,
+)
+
+from infrastructure.cache.ttl import (
+    MISSING,
+    TTLCache,
+)
+
+from domain.base.file_storage import BaseFileStorage
+
+
+@dataclass
+class CachedFileStorage(BaseFileStorage):
+    """Кэш presigned URL по пути файла.
+
+    Подписанная ссылка переиспользуется, пока до ее истечения остается
+    больше safety_margin секунд, чтобы клиент успел ей воспользоваться.
+    Ссылки с другим expiration подписываются заново. Загрузка и удаление
+    через этот воркер сбрасывают ссылку на файл.
+    """
+
+    storage: BaseFileStorage
+    cache: TTLCache[str, tuple[int, str]]
+    safety_margin: float = 300.0
+
+    async def upload_file(self, content: AsyncIterable[bytes], file_path: str) -> None:
+        await self.storage.upload_file(content, file_path)
+        self.cache.delete(file_path)
+
+    async def read_file(self, file_path: str) -> bytes | None:
+        return await self.storage.read_file(file_path)
+
+    async def delete_file(self, file_path: str) -> None:
+        await self.storage.delete_file(file_path)
+        self.cache.delete(file_path)
+
+    async def get_file_url(self, file_path: str, expiration: int = 3600) -> str | None:
+        urls = await self.get_file_urls([file_path], expiration)
+        return urls[file_path]
+
+    async def get_file_urls(self, file_paths: Iterable[str], expiration: int = 3600) -> dict[str, str | None]:
+        urls: dict[str, str | None] = {}
+        missing: list[str] = []
+
+        for file_path in dict.fromkeys(file_paths):
+            cached = self.cache.get(file_path)
+            if cached is not MISSING and cached[0] == expiration:
+                urls[file_path] = cached[1]
+            else:
+                missing.append(file_path)
+
+        if not missing:
+            return urls
+
+        # Загрузка или удаление файла во время подписи не даст закэшировать ссылку на старый файл
+        generations = {file_path: self.cache.begin_load(file_path) for file_path in missing}
+        started_at = time.monotonic()
+        try:
+            signed = await self.storage.get_file_urls(missing, expiration)
+        except Exception:
+            for file_path, generation in generations.items():
+                self.cache.finish_load(file_path, generation)
+            raise
+
+        # Отсчет ведем от начала подписи, чтобы не переоценить оставшееся время жизни ссылки
+        ttl = expiration - self.safety_margin - (time.monotonic() - started_at)
+        for file_path, generation in generations.items():
+            url = signed.get(file_path)
+            if url is not None and ttl > 0:
+                self.cache.finish_load(file_path, generation, (expiration, url), ttl=ttl)
+            else:
+                self.cache.finish_load(file_path, generation)
+
+        urls.update(signed)
+        return urls
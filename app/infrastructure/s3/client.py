@@ -1,76 +1,245 @@
 """S3 client for MinIO integration."""
 
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from collections import Counter
+from contextlib import AsyncExitStack
+from typing import AsyncIterable
 
 import aioboto3
+from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 
 from settings.config import Config
 
 
+logger = logging.getLogger(__name__)
+
+# S3 minimum size for every multipart upload part except the last one
+MULTIPART_PART_SIZE = 5 * 1024 * 1024
+
+
 class S3Client:
-    """Async S3 client wrapper for MinIO."""
+    """Async S3 client wrapper for MinIO.
+
+    Holds a single long-lived aiobotocore client (and its HTTP connection pool),
+    opened by start() and released by close(). The bucket is provisioned once per
+    process; every S3 call is counted in operation_counts.
+    """
 
     def __init__(self, config: Config) -> None:
         self.config = config
         self.session = aioboto3.Session()
+        self._client = None
+        self._exit_stack: AsyncExitStack | None = None
+        self._start_lock = asyncio.Lock()
+        self._bucket_ready = False
+        self._bucket_lock = asyncio.Lock()
+        self.operation_counts: Counter[str] = Counter()
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    @property
+    def is_bucket_ready(self) -> bool:
+        return self._bucket_ready
+
+    async def start(self) -> None:
+        """Open the shared client. Safe to call more than once."""
+        async with self._start_lock:
+            if self._client is not None:
+                return
+
+            exit_stack = AsyncExitStack()
+            self._client = await exit_stack.enter_async_context(
+                self.session.client(
+                    "s3",
+                    endpoint_url=self.config.s3_endpoint_url,
+                    aws_access_key_id=self.config.s3_access_key_id,
+                    aws_secret_access_key=self.config.s3_secret_access_key,
+                    region_name=self.config.s3_region,
+                    use_ssl=self.config.s3_use_ssl,
+                    config=AioConfig(max_pool_connections=self.config.s3_max_pool_connections),
+                ),
+            )
+            self._exit_stack = exit_stack
+
+    async def close(self) -> None:
+        """Close the shared client and its connection pool."""
+        async with self._start_lock:
+            if self._exit_stack is None:
+                return
+
+            exit_stack, self._exit_stack, self._client = self._exit_stack, None, None
+            await exit_stack.aclose()
 
-    @asynccontextmanager
     async def get_client(self):
-        async with self.session.client(
-            "s3",
-            endpoint_url=self.config.s3_endpoint_url,
-            aws_access_key_id=self.config.s3_access_key_id,
-            aws_secret_access_key=self.config.s3_secret_access_key,
-            region_name=self.config.s3_region,
-            use_ssl=self.config.s3_use_ssl,
-        ) as client:
-            yield client
-
-    async def create_bucket_if_not_exists(self) -> None:
-        """Create bucket if it doesn't exist."""
-        async with self.get_client() as client:
+        # Outside of the app lifespan (scripts, shell) the client is opened on first use
+        if self._client is None:
+            await self.start()
+
+        return self._client
+
+    async def ensure_bucket(self) -> None:
+        """Create the bucket if it doesn't exist. Only the first successful call talks to S3."""
+        if self._bucket_ready:
+            return
+
+        async with self._bucket_lock:
+            if self._bucket_ready:
+                return
+
+            client = await self.get_client()
             try:
+                self.operation_counts["head_bucket"] += 1
                 await client.head_bucket(Bucket=self.config.s3_bucket_name)
             except ClientError:
+                self.operation_counts["create_bucket"] += 1
                 await client.create_bucket(Bucket=self.config.s3_bucket_name)
 
+            self._bucket_ready = True
+
     async def upload_file(self, file_path: str, object_name: str) -> None:
-        async with self.get_client() as client:
-            await self.create_bucket_if_not_exists()
-            await client.upload_file(file_path, self.config.s3_bucket_name, object_name)
+        client = await self.get_client()
+        await self.ensure_bucket()
+        self.operation_counts["upload_file"] += 1
+        await client.upload_file(file_path, self.config.s3_bucket_name, object_name)
 
     async def upload_fileobj(self, file_obj, object_name: str) -> None:
-        async with self.get_client() as client:
-            await self.create_bucket_if_not_exists()
-            await client.upload_fileobj(file_obj, self.config.s3_bucket_name, object_name)
+        client = await self.get_client()
+        await self.ensure_bucket()
+        self.operation_counts["upload_fileobj"] += 1
+        await client.upload_fileobj(file_obj, self.config.s3_bucket_name, object_name)
+
+    async def upload_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        object_name: str,
+        part_size: int = MULTIPART_PART_SIZE,
+    ) -> None:
+        """Upload an async byte stream holding at most one part in memory.
+
+        A stream shorter than part_size goes up as a single put_object; a longer one
+        becomes a multipart upload that is aborted if the stream or a part upload fails.
+        """
+        client = await self.get_client()
+        await self.ensure_bucket()
+
+        buffer = bytearray()
+        upload_id: str | None = None
+        parts: list[dict] = []
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                while len(buffer) >= part_size:
+                    if upload_id is None:
+                        self.operation_counts["create_multipart_upload"] += 1
+                        response = await client.create_multipart_upload(
+                            Bucket=self.config.s3_bucket_name,
+                            Key=object_name,
+                        )
+                        upload_id = response["UploadId"]
+
+                    parts.append(await self._upload_part(client, object_name, upload_id, parts, buffer[:part_size]))
+                    del buffer[:part_size]
+
+            if upload_id is None:
+                self.operation_counts["put_object"] += 1
+                await client.put_object(Bucket=self.config.s3_bucket_name, Key=object_name, Body=bytes(buffer))
+                return
+
+            if buffer:
+                parts.append(await self._upload_part(client, object_name, upload_id, parts, buffer))
+
+            self.operation_counts["complete_multipart_upload"] += 1
+            await client.complete_multipart_upload(
+                Bucket=self.config.s3_bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            if upload_id is not None:
+                await self._abort_multipart_upload(client, object_name, upload_id)
+            raise
+
+    async def _abort_multipart_upload(self, client, object_name: str, upload_id: str) -> None:
+        # Otherwise the uploaded parts stay in the bucket and keep taking space
+        self.operation_counts["abort_multipart_upload"] += 1
+        try:
+            await client.abort_multipart_upload(
+                Bucket=self.config.s3_bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+            )
+        except Exception:
+            logger.warning("Failed to abort multipart upload %s of %s", upload_id, object_name, exc_info=True)
+
+    async def _upload_part(
+        self,
+        client,
+        object_name: str,
+        upload_id: str,
+        parts: list[dict],
+        body: bytes | bytearray,
+    ) -> dict:
+        part_number = len(parts) + 1
+        self.operation_counts["upload_part"] += 1
+        response = await client.upload_part(
+            Bucket=self.config.s3_bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=bytes(body),
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
 
     async def download_file(self, object_name: str, file_path: str) -> None:
-        async with self.get_client() as client:
-            await client.download_file(self.config.s3_bucket_name, object_name, file_path)
+        client = await self.get_client()
+        self.operation_counts["download_file"] += 1
+        await client.download_file(self.config.s3_bucket_name, object_name, file_path)
 
     async def download_fileobj(self, object_name: str, file_obj) -> None:
-        async with self.get_client() as client:
-            await client.download_fileobj(self.config.s3_bucket_name, object_name, file_obj)
+        client = await self.get_client()
+        self.operation_counts["download_fileobj"] += 1
+        await client.download_fileobj(self.config.s3_bucket_name, object_name, file_obj)
 
     async def delete_file(self, object_name: str) -> None:
-        async with self.get_client() as client:
-            await client.delete_object(Bucket=self.config.s3_bucket_name, Key=object_name)
+        client = await self.get_client()
+        self.operation_counts["delete_object"] += 1
+        await client.delete_object(Bucket=self.config.s3_bucket_name, Key=object_name)
 
     async def get_presigned_url(self, object_name: str, expiration: int = 3600) -> str:
-        async with self.get_client() as client:
-            return await client.generate_presigned_url(
+        client = await self.get_client()
+        self.operation_counts["generate_presigned_url"] += 1
+        return await client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.config.s3_bucket_name, "Key": object_name},
+            ExpiresIn=expiration,
+        )
+
+    async def get_presigned_urls(self, object_names: list[str], expiration: int = 3600) -> dict[str, str]:
+        """Sign several objects with the shared client. Signing is local, no request per URL."""
+        client = await self.get_client()
+        self.operation_counts["generate_presigned_url"] += len(object_names)
+        return {
+            object_name: await client.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.config.s3_bucket_name, "Key": object_name},
                 ExpiresIn=expiration,
             )
+            for object_name in object_names
+        }
 
     async def list_objects(self, prefix: str = "") -> list[str]:
-        async with self.get_client() as client:
-            response = await client.list_objects_v2(
-                Bucket=self.config.s3_bucket_name,
-                Prefix=prefix,
-            )
-            if "Contents" not in response:
-                return []
-            return [obj["Key"] for obj in response["Contents"]]
+        client = await self.get_client()
+        self.operation_counts["list_objects_v2"] += 1
+        response = await client.list_objects_v2(
+            Bucket=self.config.s3_bucket_name,
+            Prefix=prefix,
+        )
+        if "Contents" not in response:
+            return []
+        return [obj["Key"] for obj in response["Contents"]]
@@ -1,4 +1,4 @@
-from io import BytesIO
+from typing import AsyncIterable
 
 from domain.base.file_storage import BaseFileStorage
 
@@ -9,9 +9,12 @@ class DummyFileStorage(BaseFileStorage):
     def __init__(self) -> None:
         self._files: dict[str, bytes] = {}
 
-    async def upload_file(self, file_obj: BytesIO, file_path: str) -> None:
-        file_obj.seek(0)
-        self._files[file_path] = file_obj.read()
+    async def upload_file(self, content: AsyncIterable[bytes], file_path: str) -> None:
+        # Файл попадает в хранилище только если поток дочитан без ошибок
+        self._files[file_path] = b"".join([chunk async for chunk in content])
+
+    async def read_file(self, file_path: str) -> bytes | None:
+        return self._files.get(file_path)
 
     async def delete_file(self, file_path: str) -> None:
         self._files.pop(file_path, None)
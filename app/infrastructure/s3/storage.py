@@ -1,7 +1,12 @@
 """S3 implementation of file storage interface."""
 
 from io import BytesIO
+from typing import (
+    AsyncIterable,
+    Iterable,
+)
 
+from botocore.exceptions import ClientError
 from infrastructure.s3.client import S3Client
 
 from domain.base.file_storage import BaseFileStorage
@@ -13,8 +18,19 @@ class S3FileStorage(BaseFileStorage):
     def __init__(self, s3_client: S3Client) -> None:
         self.s3_client = s3_client
 
-    async def upload_file(self, file_obj: BytesIO, file_path: str) -> None:
-        await self.s3_client.upload_fileobj(file_obj, file_path)
+    async def upload_file(self, content: AsyncIterable[bytes], file_path: str) -> None:
+        await self.s3_client.upload_stream(content, file_path)
+
+    async def read_file(self, file_path: str) -> bytes | None:
+        file_obj = BytesIO()
+        try:
+            await self.s3_client.download_fileobj(file_path, file_obj)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+        return file_obj.getvalue()
 
     async def delete_file(self, file_path: str) -> None:
         await self.s3_client.delete_file(file_path)
@@ -24,3 +40,10 @@ class S3FileStorage(BaseFileStorage):
             return await self.s3_client.get_presigned_url(file_path, expiration)
         except Exception:
             return None
+
+    async def get_file_urls(self, file_paths: Iterable[str], expiration: int = 3600) -> dict[str, str | None]:
+        file_paths = list(dict.fromkeys(file_paths))
+        try:
+            return await self.s3_client.get_presigned_urls(file_paths, expiration)
+        except Exception:
+            return dict.fromkeys(file_paths)
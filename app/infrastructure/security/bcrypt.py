@@ -0,0 +1,117 @@
+import asyncio
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import bcrypt
+
+from domain.users.exceptions import PasswordHasherBusyException
+from domain.users.interfaces import BasePasswordHasher
+
+
+logger = logging.getLogger(__name__)
+
+# Сколько раз хэшируем при калибровке; берется лучшее время, чтобы не учитывать шум
+CALIBRATION_ATTEMPTS = 3
+
+
+@dataclass
+class BcryptPasswordHasher(BasePasswordHasher):
+    """bcrypt в отдельном пуле потоков, чтобы не блокировать event loop.
+
+    bcrypt отпускает GIL на время хэширования, поэтому потоков достаточно.
+    Одновременно выполняется или ждет очереди не больше max_concurrency
+    операций; запрос, не дождавшийся места за acquire_timeout секунд,
+    получает PasswordHasherBusyException вместо бесконечной очереди.
+
+    Если задан latency_budget (секунды), calibrate() подбирает rounds так,
+    чтобы один хэш укладывался в бюджет на текущем железе, в пределах
+    [min_rounds, max_rounds]. Стоимость хранится в самом хэше bcrypt
+    ($2b$<rounds>$...), поэтому старые хэши распознаются без миграции.
+    """
+
+    rounds: int = 8
+    max_workers: int = 4
+    max_concurrency: int = 16
+    acquire_timeout: float = 1.0
+    latency_budget: float | None = None
+    min_rounds: int = 8
+    max_rounds: int = 14
+
+    _executor: ThreadPoolExecutor = field(init=False)
+    _semaphore: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    async def hash_password(self, password: str) -> str:
+        hashed_password = await self._run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds))
+        return hashed_password.decode("utf-8")
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        return await self._run(bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # Повышаем стоимость слабых хэшей, а понижаем только выше max_rounds:
+        # воркеры калибруются независимо, и сравнение на равенство гоняло бы
+        # хэш туда-обратно между воркерами с соседними rounds
+        try:
+            cost = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return False
+
+        return cost < self.rounds or cost > self.max_rounds
+
+    async def calibrate(self) -> None:
+        if self.latency_budget is None:
+            return
+
+        elapsed = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._measure,
+            self.min_rounds,
+        )
+
+        # Каждый следующий round удваивает время хэширования
+        extra_rounds = math.floor(math.log2(self.latency_budget / elapsed)) if elapsed < self.latency_budget else 0
+        self.rounds = max(self.min_rounds, min(self.max_rounds, self.min_rounds + extra_rounds))
+
+        logger.info(
+            "Calibrated bcrypt cost: %s rounds (%.1f ms at %s rounds, budget %.1f ms)",
+            self.rounds,
+            elapsed * 1000,
+            self.min_rounds,
+            self.latency_budget * 1000,
+        )
+
+    async def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func, *args):
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PasswordHasherBusyException()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._semaphore.release()
+
+    @staticmethod
+    def _measure(rounds: int) -> float:
+        salt = bcrypt.gensalt(rounds=rounds)
+        best = math.inf
+
+        for _ in range(CALIBRATION_ATTEMPTS):
+            started_at = time.perf_counter()
+            bcrypt.hashpw(b"calibration-password", salt)
+            best = min(best, time.perf_counter() - started_at)
+
+        return best
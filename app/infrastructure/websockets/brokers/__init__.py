@@ -0,0 +1,10 @@
+from infrastructure.websockets.brokers.base import BaseMessageBroker
+from infrastructure.websockets.brokers.memory import InMemoryMessageBroker
+from infrastructure.websockets.brokers.unix import UnixSocketMessageBroker
+
+
+__all__ = [
+    "BaseMessageBroker",
+    "InMemoryMessageBroker",
+    "UnixSocketMessageBroker",
+]
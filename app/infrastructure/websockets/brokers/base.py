@@ -0,0 +1,36 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+
+EventHandler = Callable[[str, bytes], Awaitable[None]]
+
+
+@dataclass
+class BaseMessageBroker(ABC):
+    """Доставляет событие чата всем воркерам, включая опубликовавший."""
+
+    _handlers: list[EventHandler] = field(default_factory=list, kw_only=True)
+
+    def subscribe(self, handler: EventHandler) -> None:
+        self._handlers.append(handler)
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    @abstractmethod
+    async def publish(self, key: str, payload: bytes) -> None: ...
+
+    async def _dispatch(self, key: str, payload: bytes) -> None:
+        for handler in self._handlers:
+            await handler(key, payload)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from infrastructure.websockets.brokers.base import BaseMessageBroker
+
+
+@dataclass
+class InMemoryMessageBroker(BaseMessageBroker):
+    """Брокер для одного процесса: публикация сразу доставляется
+    подписчикам."""
+
+    async def publish(self, key: str, payload: bytes) -> None:
+        await self._dispatch(key, payload)
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import os
+import socket
+from dataclasses import (
+    dataclass,
+    field,
+)
+from uuid import uuid4
+
+from infrastructure.websockets.brokers.base import BaseMessageBroker
+
+
+logger = logging.getLogger(__name__)
+
+MAX_DATAGRAM_SIZE = 256 * 1024
+KEY_SEPARATOR = b"\n"
+
+
+@dataclass
+class UnixSocketMessageBroker(BaseMessageBroker):
+    """Брокер между воркерами одной машины через UNIX datagram сокеты.
+
+    Каждый воркер биндит свой сокет в общей директории, публикация
+    рассылает датаграмму всем сокетам директории (включая свой).
+    Сокеты завершившихся воркеров удаляются при первой неудачной
+    отправке.
+    """
+
+    socket_dir: str
+
+    _socket: socket.socket | None = field(default=None, init=False)
+    _socket_path: str | None = field(default=None, init=False)
+    _reader_task: asyncio.Task | None = field(default=None, init=False)
+
+    async def start(self) -> None:
+        if self._socket is not None:
+            return
+
+        os.makedirs(self.socket_dir, exist_ok=True)
+        self._socket_path = os.path.join(self.socket_dir, f"{os.getpid()}-{uuid4().hex[:8]}.sock")
+
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        # Дефолтный SO_SNDBUF (~208KiB) меньше MAX_DATAGRAM_SIZE: датаграмма
+        # у границы лимита иначе упала бы с EMSGSIZE
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 2 * MAX_DATAGRAM_SIZE)
+        self._socket.bind(self._socket_path)
+        self._socket.setblocking(False)
+
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def stop(self) -> None:
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+        if self._socket_path is not None:
+            self._unlink(self._socket_path)
+            self._socket_path = None
+
+    async def publish(self, key: str, payload: bytes) -> None:
+        if self._socket is None:
+            # Брокер не запущен (например, в тестах без lifespan) - доставляем локально
+            await self._dispatch(key, payload)
+            return
+
+        frame = key.encode("utf-8") + KEY_SEPARATOR + payload
+
+        if len(frame) > MAX_DATAGRAM_SIZE:
+            # Такая датаграмма не пройдёт через сокет: другие воркеры событие
+            # не получат, но локальные подключения - получат
+            logger.error(
+                "WebSocket broker event of %d bytes exceeds datagram limit, delivered locally only", len(frame)
+            )
+            await self._dispatch(key, payload)
+            return
+
+        for peer_path in self._get_peer_paths():
+            try:
+                self._socket.sendto(frame, peer_path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._unlink(peer_path)
+            except BlockingIOError:
+                logger.warning("WebSocket broker peer %s is not reading, event dropped", peer_path)
+            except OSError:
+                logger.exception("Failed to send WebSocket broker event to peer %s", peer_path)
+
+    def _get_peer_paths(self) -> list[str]:
+        return [os.path.join(self.socket_dir, name) for name in os.listdir(self.socket_dir) if name.endswith(".sock")]
+
+    async def _read_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            frame = await loop.sock_recv(self._socket, MAX_DATAGRAM_SIZE)
+            key, _, payload = frame.partition(KEY_SEPARATOR)
+
+            try:
+                await self._dispatch(key.decode("utf-8"), payload)
+            except Exception:
+                logger.exception("Failed to dispatch WebSocket broker event")
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
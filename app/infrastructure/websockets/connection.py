@@ -0,0 +1,132 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import StrEnum
+from typing import Callable
+
+from fastapi import (
+    status,
+    WebSocket,
+)
+
+from infrastructure.websockets.envelope import BroadcastEnvelope
+
+
+RESYNC_ENVELOPE = BroadcastEnvelope.from_data({"type": "resync"})
+PING_ENVELOPE = BroadcastEnvelope.from_data({"type": "ping"})
+
+
+class OverflowPolicy(StrEnum):
+    # Выбросить самый старый кадр из очереди
+    DROP_OLDEST = "drop_oldest"
+    # Отключить клиента, который не успевает читать
+    DISCONNECT = "disconnect"
+    # Заменить всю очередь одним кадром resync: клиент сам дочитает историю
+    COALESCE = "coalesce"
+
+
+@dataclass(eq=False)
+class WebSocketConnection:
+    """Соединение с ограниченной исходящей очередью и собственной задачей-
+    писателем."""
+
+    websocket: WebSocket
+    key: str
+    on_close: Callable[["WebSocketConnection"], None]
+    max_queue_size: int = 256
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+    send_timeout: float = 5.0
+    binary: bool = False
+    last_seen_at: float = field(default_factory=time.monotonic)
+    last_ping_at: float = field(default_factory=time.monotonic)
+
+    _queue: deque[BroadcastEnvelope] = field(default_factory=deque, init=False)
+    _has_frames: asyncio.Event = field(default_factory=asyncio.Event, init=False)
+    _writer_task: asyncio.Task | None = field(default=None, init=False)
+    _close_task: asyncio.Task | None = field(default=None, init=False)
+    _closed: bool = field(default=False, init=False)
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def touch(self) -> None:
+        """Отмечает, что соединение живо: от клиента пришел кадр.
+
+        Успешная отправка живость не подтверждает - у полуоткрытого
+        соединения запись в буфер сокета проходит без ошибки.
+        """
+        self.last_seen_at = time.monotonic()
+
+    def ping(self) -> None:
+        self.last_ping_at = time.monotonic()
+        self.enqueue(PING_ENVELOPE)
+
+    def start(self) -> None:
+        self._writer_task = asyncio.create_task(self._write_loop())
+
+    def enqueue(self, envelope: BroadcastEnvelope) -> bool:
+        """Ставит событие в очередь без ожидания; False - соединение закрыто."""
+        if self._closed:
+            return False
+
+        if len(self._queue) >= self.max_queue_size:
+            if self.overflow_policy == OverflowPolicy.DISCONNECT:
+                self._close_task = asyncio.create_task(self.close(code=status.WS_1013_TRY_AGAIN_LATER))
+                return False
+
+            if self.overflow_policy == OverflowPolicy.COALESCE:
+                self._queue.clear()
+                self._queue.append(RESYNC_ENVELOPE)
+            else:
+                self._queue.popleft()
+
+        self._queue.append(envelope)
+        self._has_frames.set()
+        return True
+
+    async def close(self, code: int | None = None) -> None:
+        """Останавливает писателя и снимает соединение с учета.
+
+        Если передан code, закрывает и сам WebSocket.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.clear()
+        self.on_close(self)
+
+        if self._writer_task is not None and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+
+        if code is not None:
+            try:
+                await asyncio.wait_for(self.websocket.close(code=code), timeout=self.send_timeout)
+            except Exception:
+                pass
+
+    async def _send(self, envelope: BroadcastEnvelope) -> None:
+        if self.binary:
+            await self.websocket.send_bytes(envelope.payload)
+        else:
+            await self.websocket.send_text(envelope.text)
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                await self._has_frames.wait()
+
+                while self._queue:
+                    await asyncio.wait_for(self._send(self._queue.popleft()), timeout=self.send_timeout)
+
+                self._has_frames.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Отправка не прошла или не уложилась в send_timeout
+            await self.close(code=status.WS_1013_TRY_AGAIN_LATER)
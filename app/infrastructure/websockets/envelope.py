@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import (
+    Any,
+    Mapping,
+)
+
+import orjson
+
+
+def dumps(data: Mapping[str, Any]) -> bytes:
+    return orjson.dumps(data)
+
+
+@dataclass(frozen=True)
+class BroadcastEnvelope:
+    """Событие, сериализованное один раз в неизменяемые байты.
+
+    Один и тот же объект передается всем подписчикам и воркерам:
+    бинарным клиентам уходит payload как есть, текстовым - строка,
+    декодированная один раз на событие.
+    """
+
+    payload: bytes
+
+    @classmethod
+    def from_data(cls, data: Mapping[str, Any]) -> "BroadcastEnvelope":
+        return cls(payload=dumps(data))
+
+    @cached_property
+    def text(self) -> str:
+        return self.payload.decode("utf-8")
+
+    def with_fields(self, fields: Mapping[str, Any]) -> "BroadcastEnvelope":
+        """Добавляет поля верхнего уровня, не пересериализуя исходный
+        payload."""
+        if not fields:
+            return self
+
+        header = dumps(fields)
+        if self.payload == b"{}":
+            return BroadcastEnvelope(payload=header)
+
+        return BroadcastEnvelope(payload=header[:-1] + b"," + self.payload[1:])
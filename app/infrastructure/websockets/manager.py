@@ -1,55 +1,264 @@
-import json
+import asyncio
+import logging
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
-from collections import defaultdict
 from dataclasses import (
     dataclass,
     field,
 )
 from typing import Any
 
-from fastapi import WebSocket
+from fastapi import (
+    status,
+    WebSocket,
+)
+
+from infrastructure.websockets.brokers.base import BaseMessageBroker
+from infrastructure.websockets.connection import (
+    OverflowPolicy,
+    RESYNC_ENVELOPE,
+    WebSocketConnection,
+)
+from infrastructure.websockets.envelope import BroadcastEnvelope
+from infrastructure.websockets.replay import ChatEventReplayBuffer
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class BaseConnectionManager(ABC):
-    connections_map: dict[str, list[WebSocket]] = field(
-        default_factory=lambda: defaultdict(list),
+    # key -> {id(websocket): connection}; WebSocket в Starlette - Mapping и не хешируется.
+    # Пустые ключи удаляются, как только отключается последний клиент.
+    connections_map: dict[str, dict[int, WebSocketConnection]] = field(
+        default_factory=dict,
         kw_only=True,
     )
+    _total_connections: int = field(default=0, kw_only=True)
+    _reaped_connections: int = field(default=0, kw_only=True)
+
+    @property
+    def total_connections(self) -> int:
+        return self._total_connections
+
+    @property
+    def reaped_connections(self) -> int:
+        """Сколько мертвых соединений закрыл reaper за время работы."""
+        return self._reaped_connections
+
+    def count_connections(self, key: str) -> int:
+        return len(self.connections_map.get(key, ()))
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
 
     @abstractmethod
-    async def accept_connection(self, websocket: WebSocket, key: str): ...
+    async def accept_connection(
+        self,
+        websocket: WebSocket,
+        key: str,
+        binary: bool = False,
+        last_seq: int | None = None,
+        epoch: str | None = None,
+    ) -> bool:
+        """Регистрирует соединение.
+
+        Если передан last_seq, сначала ставит в очередь пропущенные
+        события. Когда разрыв нельзя восстановить из памяти, первым
+        кадром ставит resync и возвращает False.
+        """
 
     @abstractmethod
     async def remove_connection(self, websocket: WebSocket, key: str): ...
 
     @abstractmethod
-    async def send_json_to_all(self, key: str, data: dict[str, Any]): ...
+    async def send_to_connection(self, websocket: WebSocket, key: str, envelope: BroadcastEnvelope): ...
+
+    @abstractmethod
+    async def touch_connection(self, websocket: WebSocket, key: str): ...
+
+    @abstractmethod
+    async def broadcast(self, key: str, envelope: BroadcastEnvelope): ...
+
+    async def send_json_to_all(self, key: str, data: dict[str, Any]):
+        """Отправляет JSON данные всем подключенным клиентам по ключу."""
+        await self.broadcast(key, BroadcastEnvelope.from_data(data))
 
 
 @dataclass
 class ConnectionManager(BaseConnectionManager):
-    async def accept_connection(self, websocket: WebSocket, key: str):
-        # WebSocket уже принят в endpoint, просто добавляем в список
-        self.connections_map[key].append(websocket)
+    send_timeout: float = field(default=5.0, kw_only=True)
+    max_queue_size: int = field(default=256, kw_only=True)
+    overflow_policy: OverflowPolicy = field(default=OverflowPolicy.DROP_OLDEST, kw_only=True)
+    replay_buffer: ChatEventReplayBuffer = field(default_factory=ChatEventReplayBuffer, kw_only=True)
+    heartbeat_interval: float = field(default=20.0, kw_only=True)
+    heartbeat_timeout: float = field(default=60.0, kw_only=True)
 
-    async def remove_connection(self, websocket: WebSocket, key: str):
-        if websocket in self.connections_map[key]:
-            self.connections_map[key].remove(websocket)
+    _reaper_task: asyncio.Task | None = field(default=None, init=False)
 
-    async def send_json_to_all(self, key: str, data: dict[str, Any]):
-        """Отправляет JSON данные всем подключенным клиентам по ключу."""
-        message = json.dumps(data)
-        disconnected = []
-        for websocket in self.connections_map[key]:
+    async def start(self) -> None:
+        if self._reaper_task is None:
+            self._reaper_task = asyncio.create_task(self._reap_loop())
+
+    async def stop(self) -> None:
+        if self._reaper_task is not None:
+            self._reaper_task.cancel()
+            try:
+                await self._reaper_task
+            except asyncio.CancelledError:
+                pass
+            self._reaper_task = None
+
+        for connections in list(self.connections_map.values()):
+            for connection in list(connections.values()):
+                await connection.close(code=status.WS_1001_GOING_AWAY)
+
+    async def reap(self) -> int:
+        """Закрывает соединения без входящих кадров дольше heartbeat_timeout
+        и пингует молчащие дольше heartbeat_interval.
+
+        Возвращает число закрытых соединений.
+        """
+        now = time.monotonic()
+        dead_connections = []
+
+        for connections in self.connections_map.values():
+            for connection in connections.values():
+                if now - connection.last_seen_at > self.heartbeat_timeout:
+                    dead_connections.append(connection)
+                elif min(now - connection.last_seen_at, now - connection.last_ping_at) >= self.heartbeat_interval:
+                    connection.ping()
+
+        # Закрываем параллельно: у полуоткрытых соединений close ждет до send_timeout
+        await asyncio.gather(
+            *(connection.close(code=status.WS_1001_GOING_AWAY) for connection in dead_connections),
+        )
+        self._reaped_connections += len(dead_connections)
+
+        return len(dead_connections)
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval / 2)
             try:
-                await websocket.send_text(message)
+                reaped = await self.reap()
             except Exception:
-                disconnected.append(websocket)
+                logger.exception("Failed to reap WebSocket connections")
+                continue
+
+            if reaped:
+                logger.info("Reaped %s dead WebSocket connections", reaped)
+
+    async def accept_connection(
+        self,
+        websocket: WebSocket,
+        key: str,
+        binary: bool = False,
+        last_seq: int | None = None,
+        epoch: str | None = None,
+    ) -> bool:
+        connections = self.connections_map.setdefault(key, {})
+        if id(websocket) in connections:
+            return True
+
+        # WebSocket уже принят в endpoint, заводим для него очередь и писателя
+        connection = WebSocketConnection(
+            websocket=websocket,
+            key=key,
+            on_close=self._discard,
+            max_queue_size=self.max_queue_size,
+            overflow_policy=self.overflow_policy,
+            send_timeout=self.send_timeout,
+            binary=binary,
+        )
+        connections[id(websocket)] = connection
+        self._total_connections += 1
+
+        # Пропущенные события ставятся в очередь до любых новых: между чтением
+        # буфера и регистрацией нет await, поэтому события не теряются
+        missed_events = []
+        if last_seq is not None:
+            missed_events = self.replay_buffer.get_events_since(key, last_seq, epoch)
+
+        # Разрыв больше буфера (или другой воркер): клиент сам дочитывает пропущенное через REST,
+        # а resync встает в очередь раньше любого живого события
+        for envelope in [RESYNC_ENVELOPE] if missed_events is None else missed_events:
+            connection.enqueue(envelope)
+
+        connection.start()
+
+        return missed_events is not None
+
+    async def remove_connection(self, websocket: WebSocket, key: str):
+        connection = self.connections_map.get(key, {}).get(id(websocket))
+        if connection is not None:
+            await connection.close()
+
+    async def send_to_connection(self, websocket: WebSocket, key: str, envelope: BroadcastEnvelope):
+        connection = self.connections_map.get(key, {}).get(id(websocket))
+        if connection is not None:
+            connection.enqueue(envelope)
+
+    async def touch_connection(self, websocket: WebSocket, key: str):
+        connection = self.connections_map.get(key, {}).get(id(websocket))
+        if connection is not None:
+            connection.touch()
+
+    async def broadcast(self, key: str, envelope: BroadcastEnvelope):
+        await self._broadcast_to_local(key, envelope)
+
+    async def _broadcast_to_local(self, key: str, envelope: BroadcastEnvelope):
+        """Ставит событие в очереди клиентов, подключенных к текущему
+        процессу.
+
+        Отправкой занимаются писатели соединений, поэтому рассылка не
+        ждет медленных клиентов. Событие нумеруется и сохраняется в
+        буфере повторной доставки, даже если локальных клиентов нет.
+        """
+        envelope = self.replay_buffer.append(key, envelope)
+
+        connections = self.connections_map.get(key)
+        if not connections:
+            return
+
+        for connection in tuple(connections.values()):
+            connection.enqueue(envelope)
+
+    def _discard(self, connection: WebSocketConnection) -> None:
+        connections = self.connections_map.get(connection.key)
+        if connections is None or connections.pop(id(connection.websocket), None) is None:
+            return
+
+        self._total_connections -= 1
+        if not connections:
+            del self.connections_map[connection.key]
+
+
+@dataclass
+class BrokerConnectionManager(ConnectionManager):
+    """Публикует событие через брокер один раз, а каждый воркер доставляет
+    его своим локальным соединениям."""
+
+    broker: BaseMessageBroker
+
+    def __post_init__(self):
+        self.broker.subscribe(self._on_broker_event)
+
+    async def start(self) -> None:
+        await self.broker.start()
+        await super().start()
+
+    async def stop(self) -> None:
+        await self.broker.stop()
+        await super().stop()
+
+    async def broadcast(self, key: str, envelope: BroadcastEnvelope):
+        await self.broker.publish(key, envelope.payload)
 
-        # Удаляем отключенные соединения
-        for websocket in disconnected:
-            await self.remove_connection(websocket, key)
+    async def _on_broker_event(self, key: str, payload: bytes) -> None:
+        # Байты из брокера уже сериализованы - повторно не кодируем
+        await self._broadcast_to_local(key, BroadcastEnvelope(payload=payload))
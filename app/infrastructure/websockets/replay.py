@@ -0,0 +1,86 @@
+from collections import (
+    deque,
+    OrderedDict,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from uuid import uuid4
+
+from infrastructure.websockets.envelope import BroadcastEnvelope
+
+
+@dataclass
+class _ChatEvents:
+    # Все события чата с seq > known_from лежат в events
+    known_from: int
+    events: deque[tuple[int, BroadcastEnvelope]] = field(default_factory=deque)
+
+
+@dataclass
+class ChatEventReplayBuffer:
+    """Кольцевой буфер последних событий каждого чата для повторной
+    доставки после переподключения.
+
+    Номера событий монотонно растут в пределах воркера (epoch), поэтому
+    переподключение к другому воркеру или после рестарта определяется по
+    несовпадению epoch. Число чатов ограничено max_chats (LRU).
+    """
+
+    size: int = 256
+    max_chats: int = 10_000
+    epoch: str = field(default_factory=lambda: uuid4().hex[:12])
+
+    _last_seq: int = field(default=0, init=False)
+    # Максимальный seq среди событий вытесненных чатов
+    _floor: int = field(default=0, init=False)
+    _chats: OrderedDict[str, _ChatEvents] = field(default_factory=OrderedDict, init=False)
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    def append(self, key: str, envelope: BroadcastEnvelope) -> BroadcastEnvelope:
+        """Присваивает событию номер, сохраняет его и возвращает событие с
+        полями seq и epoch."""
+        self._last_seq += 1
+        seq = self._last_seq
+
+        chat = self._chats.get(key)
+        if chat is None:
+            chat = self._chats[key] = _ChatEvents(known_from=self._floor)
+            self._evict_chats()
+        else:
+            self._chats.move_to_end(key)
+
+        if len(chat.events) >= self.size:
+            chat.known_from, _ = chat.events.popleft()
+
+        sequenced = envelope.with_fields({"seq": seq, "epoch": self.epoch})
+        chat.events.append((seq, sequenced))
+
+        return sequenced
+
+    def get_events_since(self, key: str, last_seq: int, epoch: str | None) -> list[BroadcastEnvelope] | None:
+        """Возвращает события чата после last_seq.
+
+        None означает, что разрыв нельзя восстановить из памяти.
+        """
+        if epoch != self.epoch or last_seq > self._last_seq:
+            return None
+
+        chat = self._chats.get(key)
+        if chat is None:
+            return [] if last_seq >= self._floor else None
+
+        if last_seq < chat.known_from:
+            return None
+
+        return [envelope for seq, envelope in chat.events if seq > last_seq]
+
+    def _evict_chats(self) -> None:
+        while len(self._chats) > self.max_chats:
+            _, evicted = self._chats.popitem(last=False)
+            if evicted.events:
+                self._floor = max(self._floor, evicted.events[-1][0])
@@ -1,4 +1,9 @@
+from typing import (
+    Any,
+    TypeVar,
+)
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 from fastapi import (
     Depends,
@@ -9,7 +14,59 @@ from fastapi import (
 )
 from fastapi.websockets import WebSocket
 
+from infrastructure.cache.stats import CacheRegistry
+from infrastructure.s3.client import S3Client
+from infrastructure.websockets.manager import BaseConnectionManager
 from presentation.api.auth import auth_service
+from punq import Container
+
+from application.container import init_container
+from application.mediator import Mediator
+from domain.users.interfaces import BasePasswordHasher
+
+
+TService = TypeVar("TService")
+
+# Сервисы, уже разрешенные из контейнера: граф punq обходится один раз на контейнер,
+# а не на каждый запрос. Ключ слабый, чтобы тестовые контейнеры не копились
+_resolved_services: WeakKeyDictionary[Container, dict[type, Any]] = WeakKeyDictionary()
+
+
+async def get_container() -> Container:
+    """Dependency для получения контейнера.
+
+    Асинхронная, потому что синхронные dependencies FastAPI запускает в пуле потоков.
+    """
+    return init_container()
+
+
+def resolve_cached(container: Container, service: type[TService]) -> TService:
+    """Только для singleton-регистраций: результат переиспользуется во всех запросах."""
+    services = _resolved_services.setdefault(container, {})
+    if service not in services:
+        services[service] = container.resolve(service)
+
+    return services[service]
+
+
+async def get_mediator(container: Container = Depends(get_container)) -> Mediator:
+    return resolve_cached(container, Mediator)
+
+
+async def get_connection_manager(container: Container = Depends(get_container)) -> BaseConnectionManager:
+    return resolve_cached(container, BaseConnectionManager)
+
+
+async def get_password_hasher(container: Container = Depends(get_container)) -> BasePasswordHasher:
+    return resolve_cached(container, BasePasswordHasher)
+
+
+async def get_cache_registry(container: Container = Depends(get_container)) -> CacheRegistry:
+    return resolve_cached(container, CacheRegistry)
+
+
+async def get_s3_client(container: Container = Depends(get_container)) -> S3Client:
+    return resolve_cached(container, S3Client)
 
 
 async def get_refresh_token_payload(
@@ -23,7 +23,9 @@ from domain.chats.exceptions.chats import (
     ChatNotFoundException,
 )
 from domain.users.exceptions import (
+    AvatarTooLargeException,
     InvalidCredentialsException,
+    PasswordHasherBusyException,
     UserAlreadyExistsException,
     UserException,
     UserNotFoundException,
@@ -42,6 +44,10 @@ async def application_exception_handler(
                 status_code = status.HTTP_401_UNAUTHORIZED
             elif isinstance(exc, UserAlreadyExistsException):
                 status_code = status.HTTP_409_CONFLICT
+            elif isinstance(exc, AvatarTooLargeException):
+                status_code = status.HTTP_413_CONTENT_TOO_LARGE
+            elif isinstance(exc, PasswordHasherBusyException):
+                status_code = status.HTTP_503_SERVICE_UNAVAILABLE
             else:
                 status_code = status.HTTP_400_BAD_REQUEST
         elif isinstance(exc, ChatException):
@@ -1,11 +1,23 @@
 from fastapi import (
     APIRouter,
+    Depends,
     status,
 )
 
+from infrastructure.cache.stats import CacheRegistry
+from infrastructure.s3.client import S3Client
+from infrastructure.websockets.manager import BaseConnectionManager
+from presentation.api.dependencies import (
+    get_cache_registry,
+    get_connection_manager,
+    get_s3_client,
+)
 from presentation.api.schemas import (
     ApiResponse,
+    CacheStatsResponseSchema,
     PingResponseSchema,
+    S3StatsResponseSchema,
+    WebSocketStatsResponseSchema,
 )
 
 
@@ -20,3 +32,47 @@ async def get_status() -> ApiResponse[PingResponseSchema]:
     return ApiResponse[PingResponseSchema](
         data=PingResponseSchema(result=True),
     )
+
+
+@healthcheck_router.get("/caches", status_code=status.HTTP_200_OK)
+async def get_caches_stats(
+    cache_registry: CacheRegistry = Depends(get_cache_registry),
+) -> ApiResponse[dict[str, CacheStatsResponseSchema]]:
+    """Статистика включенных кэшей этого воркера (для подбора их размеров)."""
+    return ApiResponse[dict[str, CacheStatsResponseSchema]](
+        data={
+            name: CacheStatsResponseSchema(
+                items=stats.items,
+                hits=stats.hits,
+                misses=stats.misses,
+                hit_ratio=stats.hit_ratio,
+            )
+            for name, stats in cache_registry.get_stats().items()
+        },
+    )
+
+
+@healthcheck_router.get("/s3", status_code=status.HTTP_200_OK)
+async def get_s3_stats(
+    s3_client: S3Client = Depends(get_s3_client),
+) -> ApiResponse[S3StatsResponseSchema]:
+    """Число запросов к S3 этого воркера по операциям."""
+    return ApiResponse[S3StatsResponseSchema](
+        data=S3StatsResponseSchema(
+            bucket_ready=s3_client.is_bucket_ready,
+            operations=dict(s3_client.operation_counts),
+        ),
+    )
+
+
+@healthcheck_router.get("/websockets", status_code=status.HTTP_200_OK)
+async def get_websockets_stats(
+    connection_manager: BaseConnectionManager = Depends(get_connection_manager),
+) -> ApiResponse[WebSocketStatsResponseSchema]:
+    """Число WebSocket соединений этого воркера и закрытых reaper'ом."""
+    return ApiResponse[WebSocketStatsResponseSchema](
+        data=WebSocketStatsResponseSchema(
+            connections=connection_manager.total_connections,
+            reaped_connections=connection_manager.reaped_connections,
+        ),
+    )
@@ -1,9 +1,69 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from infrastructure.database.indexes.mongo import MongoDBIndexManager
+from infrastructure.database.repositories.chats.write_buffer import MongoDBMessagesWriteBuffer
+from infrastructure.s3.client import S3Client
+from infrastructure.websockets.manager import BaseConnectionManager
+from presentation.api.dependencies import resolve_cached
 from presentation.api.exceptions import setup_exception_handlers
 from presentation.api.healthcheck import healthcheck_router
 from presentation.api.v1 import v1_router
 
+from application.container import init_container
+from application.mediator import Mediator
+from domain.users.interfaces import (
+    BasePasswordHasher,
+    BaseThumbnailGenerator,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = init_container()
+
+    index_manager: MongoDBIndexManager = container.resolve(MongoDBIndexManager)
+    created_indexes = await index_manager.ensure_indexes()
+    logger.info("MongoDB indexes ensured, created: %s", created_indexes or "none")
+
+    password_hasher: BasePasswordHasher = container.resolve(BasePasswordHasher)
+    await password_hasher.calibrate()
+
+    s3_client: S3Client = container.resolve(S3Client)
+    await s3_client.start()
+    try:
+        await s3_client.ensure_bucket()
+    except Exception:
+        # Без S3 приложение все равно поднимается, бакет создастся при первой загрузке
+        logger.warning("S3 bucket provisioning failed, will retry on first upload", exc_info=True)
+
+    connection_manager: BaseConnectionManager = resolve_cached(container, BaseConnectionManager)
+    await connection_manager.start()
+
+    # Граф медиатора со всеми обработчиками собирается один раз при старте,
+    # запросы получают готовый объект через get_mediator
+    resolve_cached(container, Mediator)
+
+    yield
+
+    await connection_manager.stop()
+
+    # Дописываем сообщения, которые еще лежат в буфере group commit
+    write_buffer: MongoDBMessagesWriteBuffer = container.resolve(MongoDBMessagesWriteBuffer)
+    await write_buffer.close()
+
+    await password_hasher.close()
+
+    thumbnail_generator: BaseThumbnailGenerator = container.resolve(BaseThumbnailGenerator)
+    await thumbnail_generator.close()
+
+    await s3_client.close()
+
 
 def create_app() -> FastAPI:
     app = FastAPI(
@@ -11,6 +71,7 @@ def create_app() -> FastAPI:
         description="A RESTful API for chat applications, offering authentication, user management, and more.",
         docs_url="/api/docs",
         debug=True,
+        lifespan=lifespan,
     )
 
     setup_exception_handlers(app)
@@ -19,6 +19,23 @@ class PingResponseSchema(BaseModel):
     result: bool
 
 
+class CacheStatsResponseSchema(BaseModel):
+    items: int
+    hits: int
+    misses: int
+    hit_ratio: float
+
+
+class S3StatsResponseSchema(BaseModel):
+    bucket_ready: bool
+    operations: dict[str, int]
+
+
+class WebSocketStatsResponseSchema(BaseModel):
+    connections: int
+    reaped_connections: int
+
+
 class ListPaginatedResponse(BaseModel, Generic[TListItem]):
     items: list[TListItem]
     pagination: PaginationOut
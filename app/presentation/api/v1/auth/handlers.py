@@ -1,12 +1,17 @@
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Response,
     status,
 )
 
 from presentation.api.auth import auth_service
-from presentation.api.dependencies import get_refresh_token_payload
+from presentation.api.dependencies import (
+    get_mediator,
+    get_password_hasher,
+    get_refresh_token_payload,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
@@ -19,10 +24,13 @@ from presentation.api.v1.auth.schemas import (
     UserResponseSchema,
 )
 
-from application.container import init_container
 from application.mediator import Mediator
-from application.users.commands import CreateUserCommand
+from application.users.commands import (
+    CreateUserCommand,
+    RehashPasswordCommand,
+)
 from application.users.queries import AuthenticateUserQuery
+from domain.users.interfaces import BasePasswordHasher
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -41,10 +49,9 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 )
 async def register(
     request: RegisterRequestSchema,
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[UserResponseSchema]:
     """Регистрация нового пользователя."""
-    mediator: Mediator = container.resolve(Mediator)
     command = CreateUserCommand(
         email=request.email,
         password=request.password,
@@ -72,10 +79,11 @@ async def register(
 async def login(
     request: LoginRequestSchema,
     response: Response,
-    container=Depends(init_container),
+    background_tasks: BackgroundTasks,
+    mediator: Mediator = Depends(get_mediator),
+    password_hasher: BasePasswordHasher = Depends(get_password_hasher),
 ) -> ApiResponse[TokenResponseSchema]:
     """Аутентификация пользователя и получение токенов."""
-    mediator: Mediator = container.resolve(Mediator)
 
     query = AuthenticateUserQuery(
         email=request.email,
@@ -84,6 +92,13 @@ async def login(
 
     user = await mediator.handle_query(query)
 
+    # Хэш с устаревшей стоимостью пересчитывается после ответа, не задерживая вход
+    if password_hasher.needs_rehash(user.hashed_password):
+        background_tasks.add_task(
+            mediator.handle_command,
+            RehashPasswordCommand(user_id=user.oid, password=request.password),
+        )
+
     # Создаем токены, используя ID пользователя
     user_id = str(user.oid)
     access_token = auth_service.create_access_token(uid=user_id)
@@ -1,36 +1,52 @@
+from typing import Literal
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Query,
+    Request,
     status,
 )
+from fastapi.responses import StreamingResponse
 
 from infrastructure.websockets.manager import BaseConnectionManager
-from presentation.api.dependencies import get_current_user_id
+from presentation.api.dependencies import (
+    get_connection_manager,
+    get_current_user_id,
+    get_mediator,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
 )
 from presentation.api.v1.chats.schemas import (
+    BulkCreateMessagesResponseSchema,
     ChatResponseSchema,
     CreateChatRequestSchema,
     CreateMessageRequestSchema,
     MessageResponseSchema,
     MessagesListResponseSchema,
 )
+from presentation.api.v1.chats.streaming import (
+    gzip_chunks,
+    iter_ndjson_bulk_messages,
+    iter_ndjson_messages,
+)
+from presentation.api.v1.chats.websockets.events import build_new_message_envelope
 
 from application.chats.commands import (
+    BulkCreateMessagesCommand,
     CreateChatCommand,
     CreateMessageCommand,
     DeleteChatCommand,
 )
 from application.chats.queries import (
+    ExportMessagesQuery,
     GetChatByIdQuery,
     GetMessagesQuery,
 )
-from application.container import init_container
 from application.mediator import Mediator
 
 
@@ -51,10 +67,9 @@ router = APIRouter(prefix="/chats", tags=["chats"])
 async def create_chat(
     request: CreateChatRequestSchema,
     owner_id: UUID = Depends(get_current_user_id),
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[ChatResponseSchema]:
     """Создание нового чата."""
-    mediator: Mediator = container.resolve(Mediator)
     command = CreateChatCommand(
         title=request.title,
         owner_id=owner_id,
@@ -78,10 +93,9 @@ async def create_chat(
 )
 async def get_chat_by_id(
     chat_id: UUID,
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[ChatResponseSchema]:
     """Получение чата по ID."""
-    mediator: Mediator = container.resolve(Mediator)
 
     query = GetChatByIdQuery(chat_id=chat_id)
     chat = await mediator.handle_query(query)
@@ -101,10 +115,9 @@ async def get_chat_by_id(
 )
 async def delete_chat(
     chat_id: UUID,
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> None:
     """Удаление чата по ID."""
-    mediator: Mediator = container.resolve(Mediator)
 
     command = DeleteChatCommand(chat_id=chat_id)
     await mediator.handle_command(command)
@@ -123,11 +136,12 @@ async def delete_chat(
 async def create_message(
     chat_id: UUID,
     request: CreateMessageRequestSchema,
+    background_tasks: BackgroundTasks,
     sender_id: UUID = Depends(get_current_user_id),
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
+    connection_manager: BaseConnectionManager = Depends(get_connection_manager),
 ) -> ApiResponse[MessageResponseSchema]:
     """Создание нового сообщения в чате."""
-    mediator: Mediator = container.resolve(Mediator)
     command = CreateMessageCommand(
         chat_id=chat_id,
         sender_id=sender_id,
@@ -138,47 +152,120 @@ async def create_message(
     message_response = MessageResponseSchema.from_entity(message)
 
     # Отправляем уведомление всем подключенным к чату клиентам через WebSocket
-    connection_manager: BaseConnectionManager = container.resolve(BaseConnectionManager)
-    await connection_manager.send_json_to_all(
-        key=str(chat_id),
-        data={
-            "type": "new_message",
-            "message": message_response.model_dump(mode="json"),
-        },
-    )
+    # уже после ответа, чтобы медленные клиенты не задерживали REST запрос
+    envelope = build_new_message_envelope(message_response)
+    background_tasks.add_task(connection_manager.broadcast, key=str(chat_id), envelope=envelope)
 
     return ApiResponse[MessageResponseSchema](
         data=message_response,
     )
 
 
+@router.post(
+    "/{chat_id}/messages/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ApiResponse[BulkCreateMessagesResponseSchema],
+    responses={
+        status.HTTP_201_CREATED: {"model": ApiResponse[BulkCreateMessagesResponseSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponseSchema},
+        status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
+    },
+)
+async def bulk_create_messages(
+    chat_id: UUID,
+    request: Request,
+    sender_id: UUID = Depends(get_current_user_id),
+    mediator: Mediator = Depends(get_mediator),
+) -> ApiResponse[BulkCreateMessagesResponseSchema]:
+    """Импорт сообщений потоком NDJSON: по одному {"content": "...", "created_at": "..."} на строку.
+
+    Тело читается по мере поступления и пишется чанками, поэтому весь импорт
+    не держится в памяти. Уведомления по WebSocket для импорта не рассылаются.
+    """
+    command = BulkCreateMessagesCommand(
+        chat_id=chat_id,
+        sender_id=sender_id,
+        messages=iter_ndjson_bulk_messages(request.stream()),
+    )
+
+    created, *_ = await mediator.handle_command(command)
+
+    return ApiResponse[BulkCreateMessagesResponseSchema](
+        data=BulkCreateMessagesResponseSchema(created=created),
+    )
+
+
 @router.get(
     "/{chat_id}/messages",
     status_code=status.HTTP_200_OK,
     response_model=ApiResponse[MessagesListResponseSchema],
     responses={
         status.HTTP_200_OK: {"model": ApiResponse[MessagesListResponseSchema]},
+        status.HTTP_400_BAD_REQUEST: {"model": ErrorResponseSchema},
     },
 )
 async def get_messages(
     chat_id: UUID,
     limit: int = Query(default=10, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    container=Depends(init_container),
+    before: str | None = Query(default=None, description="Курсор: сообщения старше указанного"),
+    after: str | None = Query(default=None, description="Курсор: сообщения новее указанного"),
+    with_total: bool = Query(default=True, description="Считать ли общее количество сообщений"),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[MessagesListResponseSchema]:
-    """Получение сообщений чата с пагинацией."""
-    mediator: Mediator = container.resolve(Mediator)
+    """Получение сообщений чата с пагинацией (offset или курсор)."""
 
     query = GetMessagesQuery(
         chat_id=chat_id,
         limit=limit,
         offset=offset,
+        before=before,
+        after=after,
+        with_total=with_total,
     )
     messages, total = await mediator.handle_query(query)
 
     return ApiResponse[MessagesListResponseSchema](
-        data=MessagesListResponseSchema(
-            items=[MessageResponseSchema.from_entity(msg) for msg in messages],
-            total=total,
-        ),
+        data=MessagesListResponseSchema.from_entities(messages, total=total),
+    )
+
+
+@router.get(
+    "/{chat_id}/messages/export",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_user_id)],
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "application/gzip": {}},
+        },
+        status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponseSchema},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorResponseSchema},
+    },
+)
+async def export_messages(
+    chat_id: UUID,
+    export_format: Literal["ndjson", "gzip"] = Query(default="ndjson", alias="format"),
+    batch_size: int = Query(default=1000, ge=1, le=10000, description="Размер пачки курсора MongoDB"),
+    mediator: Mediator = Depends(get_mediator),
+) -> StreamingResponse:
+    """Потоковый экспорт всей истории чата (от старых сообщений к новым).
+
+    Сообщения читаются курсором и сериализуются по мере отправки,
+    поэтому память не зависит от размера чата.
+    """
+    messages = await mediator.handle_query(ExportMessagesQuery(chat_id=chat_id, batch_size=batch_size))
+
+    content = iter_ndjson_messages(messages)
+    if export_format == "gzip":
+        return StreamingResponse(
+            gzip_chunks(content),
+            media_type="application/gzip",
+            headers={"Content-Disposition": f'attachment; filename="chat-{chat_id}.ndjson.gz"'},
+        )
+
+    return StreamingResponse(
+        content,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="chat-{chat_id}.ndjson"'},
     )
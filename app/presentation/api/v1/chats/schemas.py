@@ -1,10 +1,12 @@
 from datetime import datetime
+from typing import Iterable
 from uuid import UUID
 
 from pydantic import BaseModel
 
 from domain.chats.entities.chats import ChatEntity
 from domain.chats.entities.messages import MessageEntity
+from domain.chats.filters.messages import MessagesCursor
 
 
 class ChatResponseSchema(BaseModel):
@@ -53,6 +55,34 @@ class CreateMessageRequestSchema(BaseModel):
     content: str
 
 
+class BulkCreateMessageLineSchema(BaseModel):
+    content: str
+    # Время сообщения в переносимой истории (ISO 8601)
+    created_at: datetime | None = None
+
+
+class BulkCreateMessagesResponseSchema(BaseModel):
+    created: int
+
+
 class MessagesListResponseSchema(BaseModel):
     items: list[MessageResponseSchema]
-    total: int
+    total: int | None
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+    @classmethod
+    def from_entities(
+        cls,
+        entities: Iterable[MessageEntity],
+        total: int | None,
+    ) -> "MessagesListResponseSchema":
+        messages = list(entities)
+
+        # next_cursor ведет к более старым сообщениям (before), prev_cursor - к более новым (after)
+        return cls(
+            items=[MessageResponseSchema.from_entity(message) for message in messages],
+            total=total,
+            next_cursor=MessagesCursor.from_entity(messages[-1]).encode() if messages else None,
+            prev_cursor=MessagesCursor.from_entity(messages[0]).encode() if messages else None,
+        )
@@ -0,0 +1,90 @@
+import zlib
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+)
+
+from fastapi.exceptions import RequestValidationError
+
+from presentation.api.v1.chats.schemas import (
+    BulkCreateMessageLineSchema,
+    MessageResponseSchema,
+)
+from pydantic import ValidationError
+
+from application.chats.commands import BulkMessageData
+from domain.chats.entities.messages import MessageEntity
+
+
+# Строка NDJSON не может быть длиннее: сообщение ограничено 4096 символами,
+# а без лимита клиент без переводов строк заставил бы держать весь поток в памяти
+MAX_NDJSON_LINE_SIZE = 64 * 1024
+
+# Экспорт отдается кусками такого размера, а не по сообщению на кадр ASGI
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# wbits=31 - формат gzip (заголовок и CRC), а не голый zlib
+GZIP_WBITS = 31
+
+
+def _line_error(line_number: int, message: str, error_type: str) -> RequestValidationError:
+    return RequestValidationError([{"loc": ("body", line_number), "msg": message, "type": error_type}])
+
+
+def _parse_message(line: bytes, line_number: int) -> BulkMessageData:
+    try:
+        message = BulkCreateMessageLineSchema.model_validate_json(line)
+    except ValidationError as exc:
+        error = exc.errors()[0]
+        raise _line_error(line_number, error["msg"], error["type"])
+
+    return BulkMessageData(content=message.content, line_number=line_number, created_at=message.created_at)
+
+
+async def iter_ndjson_bulk_messages(chunks: AsyncIterable[bytes]) -> AsyncIterator[BulkMessageData]:
+    """Построчно разбирает поток NDJSON вида {"content": "...", "created_at": "..."} по мере
+    чтения тела запроса."""
+    buffer = b""
+    line_number = 0
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield _parse_message(line, line_number)
+
+        if len(buffer) > MAX_NDJSON_LINE_SIZE:
+            raise _line_error(line_number + 1, "Line is too long", "line_too_long")
+
+    if buffer.strip():
+        yield _parse_message(buffer, line_number + 1)
+
+
+async def iter_ndjson_messages(messages: AsyncIterable[MessageEntity]) -> AsyncIterator[bytes]:
+    """Лениво сериализует сообщения в NDJSON, по одному на строку."""
+    chunk = bytearray()
+
+    async for message in messages:
+        chunk += MessageResponseSchema.from_entity(message).model_dump_json().encode()
+        chunk += b"\n"
+
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield bytes(chunk)
+            chunk.clear()
+
+    if chunk:
+        yield bytes(chunk)
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
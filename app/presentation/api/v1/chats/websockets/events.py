@@ -0,0 +1,34 @@
+from typing import Any
+
+from infrastructure.websockets.envelope import BroadcastEnvelope
+from presentation.api.v1.chats.schemas import MessageResponseSchema
+
+
+def build_new_message_envelope(message: MessageResponseSchema) -> BroadcastEnvelope:
+    """Событие о новом сообщении, общее для REST и WebSocket."""
+    return BroadcastEnvelope.from_data(
+        {
+            "type": "new_message",
+            "message": message.model_dump(mode="json"),
+        },
+    )
+
+
+def build_ack_envelope(request_id: str | None, message: MessageResponseSchema) -> BroadcastEnvelope:
+    return BroadcastEnvelope.from_data(
+        {
+            "type": "ack",
+            "request_id": request_id,
+            "message": message.model_dump(mode="json"),
+        },
+    )
+
+
+def build_error_envelope(request_id: str | None, errors: list[dict[str, Any]]) -> BroadcastEnvelope:
+    return BroadcastEnvelope.from_data(
+        {
+            "type": "error",
+            "request_id": request_id,
+            "errors": errors,
+        },
+    )
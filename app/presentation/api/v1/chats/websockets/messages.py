@@ -1,3 +1,4 @@
+import json
 from uuid import UUID
 
 from fastapi import (
@@ -8,9 +9,23 @@ from fastapi.routing import APIRouter
 from fastapi.websockets import WebSocket
 
 from infrastructure.websockets.manager import BaseConnectionManager
-from presentation.api.dependencies import get_current_user_id_from_websocket
+from presentation.api.dependencies import (
+    get_connection_manager,
+    get_current_user_id_from_websocket,
+    get_mediator,
+)
+from presentation.api.v1.chats.schemas import MessageResponseSchema
+from presentation.api.v1.chats.websockets.events import (
+    build_ack_envelope,
+    build_error_envelope,
+    build_new_message_envelope,
+)
+from presentation.api.v1.chats.websockets.schemas import WebSocketCreateMessageSchema
+from pydantic import ValidationError
 
-from application.container import init_container
+from application.chats.commands import CreateMessageCommand
+from application.mediator import Mediator
+from domain.base.exceptions import ApplicationException
 
 
 router = APIRouter(
@@ -18,25 +33,102 @@ router = APIRouter(
     tags=["chats"],
 )
 
+# Клиенты, запросившие этот subprotocol, получают события бинарными кадрами
+BINARY_SUBPROTOCOL = "chat.binary"
+
+
+async def _handle_create_message(
+    mediator: Mediator,
+    connection_manager: BaseConnectionManager,
+    websocket: WebSocket,
+    chat_oid: str,
+    user_id: UUID,
+    frame: dict,
+) -> None:
+    """Сохраняет сообщение из кадра create_message, отвечает ack/error и рассылает его в чат."""
+    request_id = frame.get("request_id") if isinstance(frame.get("request_id"), str) else None
+
+    try:
+        payload = WebSocketCreateMessageSchema.model_validate(frame)
+        chat_id = UUID(chat_oid)
+    except ValidationError as exc:
+        errors = [{"message": error["msg"], "type": "ValidationError"} for error in exc.errors()]
+        envelope = build_error_envelope(request_id, errors)
+        await connection_manager.send_to_connection(websocket=websocket, key=chat_oid, envelope=envelope)
+        return
+    except ValueError:
+        envelope = build_error_envelope(request_id, [{"message": "Invalid chat id", "type": "ValueError"}])
+        await connection_manager.send_to_connection(websocket=websocket, key=chat_oid, envelope=envelope)
+        return
+
+    try:
+        message, *_ = await mediator.handle_command(
+            CreateMessageCommand(chat_id=chat_id, sender_id=user_id, content=payload.content),
+        )
+    except ApplicationException as exc:
+        envelope = build_error_envelope(request_id, [{"message": exc.message, "type": exc.__class__.__name__}])
+        await connection_manager.send_to_connection(websocket=websocket, key=chat_oid, envelope=envelope)
+        return
+
+    message_response = MessageResponseSchema.from_entity(message)
+    await connection_manager.send_to_connection(
+        websocket=websocket,
+        key=chat_oid,
+        envelope=build_ack_envelope(request_id, message_response),
+    )
+    await connection_manager.broadcast(key=chat_oid, envelope=build_new_message_envelope(message_response))
+
 
 @router.websocket("/{chat_oid}")
 async def websocket_endpoint(
     chat_oid: str,
     websocket: WebSocket,
+    last_seq: int | None = None,
+    epoch: str | None = None,
     user_id: UUID = Depends(get_current_user_id_from_websocket),
+    mediator: Mediator = Depends(get_mediator),
+    connection_manager: BaseConnectionManager = Depends(get_connection_manager),
 ):
-    """WebSocket endpoint для чата с авторизацией."""
-    # Принимаем соединение после успешной авторизации через dependency
-    await websocket.accept()
+    """WebSocket endpoint для чата с авторизацией.
 
-    container = init_container()
-    connection_manager: BaseConnectionManager = container.resolve(BaseConnectionManager)
-    await connection_manager.accept_connection(websocket=websocket, key=chat_oid)
+    При переподключении клиент передает seq и epoch последнего
+    полученного события, и пропущенные события досылаются из памяти.
+    Если их там уже нет, первым приходит кадр resync, и клиент
+    дочитывает пропущенное через REST.
+
+    Кадр {"type": "create_message", "content": ..., "request_id": ...}
+    сохраняет сообщение без отдельного HTTP запроса: отправитель получает
+    ack (или error) с тем же request_id, а чат - событие new_message.
+    """
+    # Принимаем соединение после успешной авторизации через dependency
+    binary = BINARY_SUBPROTOCOL in websocket.scope.get("subprotocols", [])
+    await websocket.accept(subprotocol=BINARY_SUBPROTOCOL if binary else None)
 
     await websocket.send_text(f"You are now connected! User ID: {user_id}")
 
+    # После регистрации в WebSocket пишет только писатель соединения
+    await connection_manager.accept_connection(
+        websocket=websocket,
+        key=chat_oid,
+        binary=binary,
+        last_seq=last_seq,
+        epoch=epoch,
+    )
+
     try:
         while True:
-            await websocket.receive_text()
+            # Любой входящий кадр (в том числе {"type": "pong"}) подтверждает, что клиент жив
+            text = await websocket.receive_text()
+            await connection_manager.touch_connection(websocket=websocket, key=chat_oid)
+
+            try:
+                frame = json.loads(text)
+            except ValueError:
+                continue
+
+            if isinstance(frame, dict) and frame.get("type") == "create_message":
+                await _handle_create_message(mediator, connection_manager, websocket, chat_oid, user_id, frame)
     except WebSocketDisconnect:
+        pass
+    finally:
         await connection_manager.remove_connection(websocket=websocket, key=chat_oid)
@@ -0,0 +1,10 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class WebSocketCreateMessageSchema(BaseModel):
+    type: Literal["create_message"]
+    content: str
+    # Клиентский идентификатор кадра, возвращается в ack/error
+    request_id: str | None = None
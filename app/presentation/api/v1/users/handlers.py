@@ -1,28 +1,108 @@
-from io import BytesIO
+from typing import (
+    AsyncIterator,
+    Callable,
+    Coroutine,
+)
 from uuid import UUID
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
+    Request,
+    Response,
     status,
     UploadFile,
 )
+from fastapi.routing import APIRoute
+from starlette.exceptions import HTTPException
+from starlette.types import (
+    Message,
+    Receive,
+)
 
-from presentation.api.dependencies import get_current_user_id
+from presentation.api.dependencies import (
+    get_current_user_id,
+    get_mediator,
+)
 from presentation.api.schemas import (
     ApiResponse,
     ErrorResponseSchema,
 )
 from presentation.api.v1.users.schemas import UserResponseSchema
 
-from application.container import init_container
 from application.mediator import Mediator
-from application.users.commands import UploadAvatarCommand
+from application.users.commands import (
+    GenerateAvatarThumbnailsCommand,
+    UploadAvatarCommand,
+)
 from application.users.queries import GetUserByIdQuery
+from domain.users.exceptions import AvatarTooLargeException
+from domain.users.services.users import MAX_AVATAR_SIZE
+
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Запас на границы и заголовки частей multipart поверх самого файла
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def _limit_receive(receive: Receive, max_size: int) -> Receive:
+    received = 0
+
+    async def limited_receive() -> Message:
+        nonlocal received
+        message = await receive()
+
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_size:
+                raise AvatarTooLargeException(max_size=MAX_AVATAR_SIZE)
+
+        return message
+
+    return limited_receive
 
 
-router = APIRouter(prefix="/users", tags=["users"])
+class LimitedBodyRoute(APIRoute):
+    """Отклоняет тело больше аватара до того, как FastAPI разберет форму.
+
+    Иначе Starlette сначала целиком сохранит загрузку во временный файл,
+    и ограничение MAX_AVATAR_SIZE сработает только после этого.
+    Content-Length проверяется сразу, тело без него (chunked) - по мере
+    чтения.
+    """
+
+    max_body_size = MAX_AVATAR_SIZE + MULTIPART_OVERHEAD
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        route_handler = super().get_route_handler()
+        max_body_size = self.max_body_size
+
+        async def limited_route_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length", "")
+            if content_length.isdigit() and int(content_length) > max_body_size:
+                raise AvatarTooLargeException(max_size=MAX_AVATAR_SIZE)
+
+            try:
+                return await route_handler(Request(request.scope, _limit_receive(request.receive, max_body_size)))
+            except HTTPException as exc:
+                # Ошибки чтения тела FastAPI заворачивает в 400
+                if isinstance(exc.__cause__, AvatarTooLargeException):
+                    raise exc.__cause__
+                raise
+
+        return limited_route_handler
+
+
+router = APIRouter(prefix="/users", tags=["users"], route_class=LimitedBodyRoute)
+
+
+async def _iter_upload_file(file: UploadFile) -> AsyncIterator[bytes]:
+    # Starlette держит в памяти не больше 1MiB загрузки, остальное лежит во временном файле
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
 
 
 @router.get(
@@ -36,10 +116,9 @@ router = APIRouter(prefix="/users", tags=["users"])
 )
 async def get_current_user(
     user_id: UUID = Depends(get_current_user_id),
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[UserResponseSchema]:
     """Получение информации о текущем пользователе."""
-    mediator: Mediator = container.resolve(Mediator)
 
     query = GetUserByIdQuery(user_id=user_id)
     user = await mediator.handle_query(query)
@@ -57,30 +136,33 @@ async def get_current_user(
         status.HTTP_200_OK: {"model": ApiResponse[UserResponseSchema]},
         status.HTTP_401_UNAUTHORIZED: {"model": ErrorResponseSchema},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorResponseSchema},
+        status.HTTP_413_CONTENT_TOO_LARGE: {"model": ErrorResponseSchema},
         status.HTTP_422_UNPROCESSABLE_CONTENT: {"model": ErrorResponseSchema},
     },
 )
 async def upload_avatar(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     user_id: UUID = Depends(get_current_user_id),
-    container=Depends(init_container),
+    mediator: Mediator = Depends(get_mediator),
 ) -> ApiResponse[UserResponseSchema]:
     """Загрузка аватара пользователя."""
-    mediator: Mediator = container.resolve(Mediator)
-
-    # Read file content into BytesIO
-    file_content = await file.read()
-    file_obj = BytesIO(file_content)
-    file_obj.seek(0)  # Reset file pointer to beginning
 
+    # Файл читается частями и сразу уходит в хранилище, целиком в памяти он не собирается
     command = UploadAvatarCommand(
         user_id=user_id,
-        file_obj=file_obj,
+        content=_iter_upload_file(file),
         filename=file.filename or "avatar",
     )
 
     user, *_ = await mediator.handle_command(command)
 
+    # Миниатюры считаются в пуле процессов после ответа и не задерживают загрузку
+    background_tasks.add_task(
+        mediator.handle_command,
+        GenerateAvatarThumbnailsCommand(user_id=user.oid, avatar_path=user.avatar_path),
+    )
+
     return ApiResponse[UserResponseSchema](
         data=UserResponseSchema.from_entity(user),
     )
@@ -11,6 +11,7 @@ class UserResponseSchema(BaseModel):
     email: str
     name: str
     avatar_url: Optional[str] = None
+    avatar_thumbnail_urls: dict[str, str] = {}
 
     @classmethod
     def from_entity(cls, entity: UserEntity) -> "UserResponseSchema":
@@ -19,4 +20,5 @@ class UserResponseSchema(BaseModel):
             email=entity.email.as_generic_type(),
             name=entity.name.as_generic_type(),
             avatar_url=entity.avatar_path,
+            avatar_thumbnail_urls=entity.avatar_thumbnails,
         )
@@ -0,0 +1,81 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class CacheConfig(BaseSettings):
+    """In-process cache configuration settings."""
+
+    messages_cache_enabled: bool = Field(
+        default=False,
+        alias="MESSAGES_CACHE_ENABLED",
+    )
+
+    messages_cache_per_chat: int = Field(
+        default=100,
+        alias="MESSAGES_CACHE_PER_CHAT",
+    )
+
+    messages_cache_max_chats: int = Field(
+        default=1000,
+        alias="MESSAGES_CACHE_MAX_CHATS",
+    )
+
+    messages_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        alias="MESSAGES_CACHE_MAX_BYTES",
+    )
+
+    messages_cache_ttl: float = Field(
+        default=30.0,
+        alias="MESSAGES_CACHE_TTL",
+    )
+
+    chats_cache_enabled: bool = Field(
+        default=False,
+        alias="CHATS_CACHE_ENABLED",
+    )
+
+    chats_cache_max_size: int = Field(
+        default=10_000,
+        alias="CHATS_CACHE_MAX_SIZE",
+    )
+
+    chats_cache_ttl: float = Field(
+        default=60.0,
+        alias="CHATS_CACHE_TTL",
+    )
+
+    chats_cache_negative_ttl: float = Field(
+        default=5.0,
+        alias="CHATS_CACHE_NEGATIVE_TTL",
+    )
+
+    users_cache_enabled: bool = Field(
+        default=False,
+        alias="USERS_CACHE_ENABLED",
+    )
+
+    users_cache_max_size: int = Field(
+        default=10_000,
+        alias="USERS_CACHE_MAX_SIZE",
+    )
+
+    users_cache_ttl: float = Field(
+        default=30.0,
+        alias="USERS_CACHE_TTL",
+    )
+
+    file_urls_cache_enabled: bool = Field(
+        default=False,
+        alias="FILE_URLS_CACHE_ENABLED",
+    )
+
+    file_urls_cache_max_size: int = Field(
+        default=50_000,
+        alias="FILE_URLS_CACHE_MAX_SIZE",
+    )
+
+    file_urls_cache_safety_margin: float = Field(
+        default=300.0,
+        alias="FILE_URLS_CACHE_SAFETY_MARGIN",
+    )
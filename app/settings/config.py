@@ -1,12 +1,24 @@
 from pydantic import Field
 from pydantic_settings import SettingsConfigDict
 
+from settings.cache import CacheConfig
+from settings.images import ThumbnailConfig
 from settings.mongo import MongoConfig
 from settings.postgres import PostgresConfig
 from settings.s3 import S3Config
+from settings.security import PasswordHasherConfig
+from settings.websockets import WebSocketConfig
 
 
-class Config(PostgresConfig, S3Config, MongoConfig):
+class Config(
+    PostgresConfig,
+    S3Config,
+    MongoConfig,
+    WebSocketConfig,
+    CacheConfig,
+    PasswordHasherConfig,
+    ThumbnailConfig,
+):
     """Main application configuration."""
 
     jwt_secret_key: str = Field(
@@ -0,0 +1,21 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class ThumbnailConfig(BaseSettings):
+    """Avatar thumbnail generation settings."""
+
+    avatar_thumbnail_sizes: tuple[int, ...] = Field(
+        default=(64, 128, 256),
+        alias="AVATAR_THUMBNAIL_SIZES",
+    )
+
+    avatar_thumbnail_quality: int = Field(
+        default=80,
+        alias="AVATAR_THUMBNAIL_QUALITY",
+    )
+
+    avatar_thumbnail_workers: int = Field(
+        default=2,
+        alias="AVATAR_THUMBNAIL_WORKERS",
+    )
@@ -42,6 +42,19 @@ class MongoConfig(BaseSettings):
         alias="MONGODB_MESSAGE_COLLECTION",
     )
 
+    mongodb_write_buffer_enabled: bool = Field(
+        default=False,
+        alias="MONGODB_WRITE_BUFFER_ENABLED",
+    )
+    mongodb_write_buffer_max_delay_ms: float = Field(
+        default=5.0,
+        alias="MONGODB_WRITE_BUFFER_MAX_DELAY_MS",
+    )
+    mongodb_write_buffer_max_size: int = Field(
+        default=500,
+        alias="MONGODB_WRITE_BUFFER_MAX_SIZE",
+    )
+
     @computed_field
     @property
     def mongodb_connection_uri(self) -> str:
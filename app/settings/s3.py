@@ -35,6 +35,11 @@ class S3Config(BaseSettings):
         alias="S3_USE_SSL",
     )
 
+    s3_max_pool_connections: int = Field(
+        default=10,
+        alias="S3_MAX_POOL_CONNECTIONS",
+    )
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
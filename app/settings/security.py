@@ -0,0 +1,41 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class PasswordHasherConfig(BaseSettings):
+    """Password hashing configuration settings."""
+
+    password_hasher_rounds: int = Field(
+        default=8,
+        alias="PASSWORD_HASHER_ROUNDS",
+    )
+
+    password_hasher_workers: int = Field(
+        default=4,
+        alias="PASSWORD_HASHER_WORKERS",
+    )
+
+    password_hasher_max_concurrency: int = Field(
+        default=16,
+        alias="PASSWORD_HASHER_MAX_CONCURRENCY",
+    )
+
+    password_hasher_acquire_timeout: float = Field(
+        default=1.0,
+        alias="PASSWORD_HASHER_ACQUIRE_TIMEOUT",
+    )
+
+    password_hasher_latency_budget_ms: float | None = Field(
+        default=None,
+        alias="PASSWORD_HASHER_LATENCY_BUDGET_MS",
+    )
+
+    password_hasher_min_rounds: int = Field(
+        default=8,
+        alias="PASSWORD_HASHER_MIN_ROUNDS",
+    )
+
+    password_hasher_max_rounds: int = Field(
+        default=14,
+        alias="PASSWORD_HASHER_MAX_ROUNDS",
+    )
@@ -0,0 +1,53 @@
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class WebSocketConfig(BaseSettings):
+    """WebSocket fan-out configuration settings."""
+
+    websocket_broker: Literal["memory", "unix"] = Field(
+        default="memory",
+        alias="WEBSOCKET_BROKER",
+    )
+
+    websocket_broker_socket_dir: str = Field(
+        default="/tmp/chat-ws-broker",
+        alias="WEBSOCKET_BROKER_SOCKET_DIR",
+    )
+
+    websocket_send_timeout: float = Field(
+        default=5.0,
+        alias="WEBSOCKET_SEND_TIMEOUT",
+    )
+
+    websocket_queue_size: int = Field(
+        default=256,
+        alias="WEBSOCKET_QUEUE_SIZE",
+    )
+
+    websocket_overflow_policy: Literal["drop_oldest", "disconnect", "coalesce"] = Field(
+        default="drop_oldest",
+        alias="WEBSOCKET_OVERFLOW_POLICY",
+    )
+
+    websocket_replay_buffer_size: int = Field(
+        default=256,
+        alias="WEBSOCKET_REPLAY_BUFFER_SIZE",
+    )
+
+    websocket_replay_max_chats: int = Field(
+        default=10_000,
+        alias="WEBSOCKET_REPLAY_MAX_CHATS",
+    )
+
+    websocket_heartbeat_interval: float = Field(
+        default=20.0,
+        alias="WEBSOCKET_HEARTBEAT_INTERVAL",
+    )
+
+    websocket_heartbeat_timeout: float = Field(
+        default=60.0,
+        alias="WEBSOCKET_HEARTBEAT_TIMEOUT",
+    )
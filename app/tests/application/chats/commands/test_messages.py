@@ -1,15 +1,30 @@
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
 from uuid import uuid4
 
 import pytest
 from faker import Faker
-
-from application.chats.commands import CreateMessageCommand
+from punq import Container
+
+from application.chats.commands import (
+    BulkCreateMessagesCommand,
+    BulkCreateMessagesCommandHandler,
+    BulkMessageData,
+    CreateMessageCommand,
+    CreateMessageCommandHandler,
+)
+from application.chats.queries import GetMessagesQuery
 from application.mediator import Mediator
 from domain.chats.entities.messages import MessageEntity
 from domain.chats.exceptions.messages import (
     EmptyMessageContentException,
+    InvalidBulkMessageException,
     MessageContentTooLongException,
 )
+from domain.chats.interfaces.repository import BaseMessagesRepository
 
 
 @pytest.mark.asyncio
@@ -85,3 +100,122 @@ async def test_create_message_command_content_too_long(mediator: Mediator):
 
     assert exc_info.value.content_length == len(content)
     assert exc_info.value.max_length == 4096
+
+
+async def _iterate(contents: list[str], created_at: list[datetime | None] | None = None):
+    for index, content in enumerate(contents):
+        yield BulkMessageData(
+            content=content,
+            line_number=index + 1,
+            created_at=created_at[index] if created_at else None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_success(
+    mediator: Mediator,
+    faker: Faker,
+):
+    chat_id = uuid4()
+    contents = [faker.text(max_nb_chars=50) for _ in range(5)]
+    started_at = datetime.now() - timedelta(days=1)
+    created_at = [started_at + timedelta(minutes=index) for index in range(len(contents))]
+
+    created, *_ = await mediator.handle_command(
+        BulkCreateMessagesCommand(chat_id=chat_id, sender_id=uuid4(), messages=_iterate(contents, created_at)),
+    )
+
+    assert created == len(contents)
+
+    messages, total = await mediator.handle_query(GetMessagesQuery(chat_id=chat_id, limit=100))
+    assert total == len(contents)
+    # Сообщения отдаются от новых к старым
+    assert [message.content.as_generic_type() for message in messages] == contents[::-1]
+    assert [message.created_at for message in messages] == created_at[::-1]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_never_dates_messages_in_the_future(container: Container):
+    messages_repository = container.resolve(BaseMessagesRepository)
+    handler = BulkCreateMessagesCommandHandler(messages_repository=messages_repository, chunk_size=50)
+    chat_id = uuid4()
+    contents = [f"Message {index}" for index in range(120)]
+
+    await handler.handle(BulkCreateMessagesCommand(chat_id=chat_id, sender_id=uuid4(), messages=_iterate(contents)))
+    imported_at = datetime.now()
+
+    # Сообщение, отправленное после импорта, остается самым новым
+    await CreateMessageCommandHandler(messages_repository=messages_repository).handle(
+        CreateMessageCommand(chat_id=chat_id, sender_id=uuid4(), content="live"),
+    )
+    messages = [message async for message in messages_repository.iterate_messages(chat_id, batch_size=100)]
+
+    assert all(message.created_at <= imported_at for message in messages[:-1])
+    assert messages[-1].content.as_generic_type() == "live"
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_rejects_future_created_at(mediator: Mediator):
+    chat_id = uuid4()
+    created_at = [None, datetime.now() + timedelta(hours=1)]
+
+    with pytest.raises(InvalidBulkMessageException) as exc_info:
+        await mediator.handle_command(
+            BulkCreateMessagesCommand(chat_id=chat_id, sender_id=uuid4(), messages=_iterate(["ok", "ok"], created_at)),
+        )
+
+    assert exc_info.value.line_number == 2
+    _, total = await mediator.handle_query(GetMessagesQuery(chat_id=chat_id))
+    assert total == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_converts_aware_created_at(container: Container):
+    messages_repository = container.resolve(BaseMessagesRepository)
+    handler = BulkCreateMessagesCommandHandler(messages_repository=messages_repository)
+    chat_id = uuid4()
+    created_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+    await handler.handle(
+        BulkCreateMessagesCommand(chat_id=chat_id, sender_id=uuid4(), messages=_iterate(["old"], [created_at])),
+    )
+
+    (message,) = [message async for message in messages_repository.iterate_messages(chat_id, batch_size=10)]
+    assert message.created_at == created_at.astimezone().replace(tzinfo=None)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_inserts_in_chunks(container: Container):
+    messages_repository = container.resolve(BaseMessagesRepository)
+    handler = BulkCreateMessagesCommandHandler(messages_repository=messages_repository, chunk_size=2)
+    chunk_sizes = []
+    add_messages = messages_repository.add_messages
+
+    async def spy_add_messages(messages):
+        chunk_sizes.append(len(messages))
+        await add_messages(messages)
+
+    messages_repository.add_messages = spy_add_messages
+
+    created = await handler.handle(
+        BulkCreateMessagesCommand(chat_id=uuid4(), sender_id=uuid4(), messages=_iterate(["a", "b", "c", "d", "e"])),
+    )
+
+    assert created == 5
+    assert chunk_sizes == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_command_invalid_content(mediator: Mediator):
+    chat_id = uuid4()
+
+    with pytest.raises(InvalidBulkMessageException) as exc_info:
+        await mediator.handle_command(
+            BulkCreateMessagesCommand(chat_id=chat_id, sender_id=uuid4(), messages=_iterate(["ok", "   ", "ok"])),
+        )
+
+    assert exc_info.value.line_number == 2
+
+    # Чанк с невалидным сообщением не записывается целиком
+    _, total = await mediator.handle_query(GetMessagesQuery(chat_id=chat_id))
+    assert total == 0
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import uuid4
 
 import pytest
@@ -7,8 +8,17 @@ from application.chats.commands import (
     CreateChatCommand,
     CreateMessageCommand,
 )
-from application.chats.queries import GetMessagesQuery
+from application.chats.queries import (
+    ExportMessagesQuery,
+    GetMessagesQuery,
+)
 from application.mediator import Mediator
+from domain.chats.exceptions.chats import ChatNotFoundException
+from domain.chats.exceptions.messages import (
+    AmbiguousMessagesCursorException,
+    InvalidMessagesCursorException,
+)
+from domain.chats.filters.messages import MessagesCursor
 
 
 @pytest.mark.asyncio
@@ -158,3 +168,121 @@ async def test_get_messages_query_different_chats(
     assert len(list(chat1_messages)) == 2
     assert chat2_total == 1
     assert len(list(chat2_messages)) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_messages_query_cursor_pagination(
+    mediator: Mediator,
+    faker: Faker,
+):
+    owner_id = uuid4()
+    chat_result, *_ = await mediator.handle_command(
+        CreateChatCommand(title=faker.text(max_nb_chars=50), owner_id=owner_id),
+    )
+    chat_id = chat_result.oid
+
+    sender_id = uuid4()
+    for _ in range(7):
+        await mediator.handle_command(
+            CreateMessageCommand(
+                chat_id=chat_id,
+                sender_id=sender_id,
+                content=faker.text(max_nb_chars=50),
+            ),
+        )
+
+    all_messages, _ = await mediator.handle_query(
+        GetMessagesQuery(chat_id=chat_id, limit=10),
+    )
+    all_messages = list(all_messages)
+
+    collected = []
+    before = None
+    while True:
+        page, total = await mediator.handle_query(
+            GetMessagesQuery(chat_id=chat_id, limit=3, before=before),
+        )
+        page = list(page)
+        if not page:
+            break
+
+        assert total == 7
+        collected.extend(page)
+        before = MessagesCursor.from_entity(page[-1]).encode()
+
+    assert [message.oid for message in collected] == [message.oid for message in all_messages]
+
+    newer_page, _ = await mediator.handle_query(
+        GetMessagesQuery(
+            chat_id=chat_id,
+            limit=2,
+            after=MessagesCursor.from_entity(all_messages[4]).encode(),
+        ),
+    )
+
+    assert [message.oid for message in newer_page] == [message.oid for message in all_messages[2:4]]
+
+
+@pytest.mark.asyncio
+async def test_get_messages_query_invalid_cursor(mediator: Mediator):
+    with pytest.raises(InvalidMessagesCursorException):
+        await mediator.handle_query(
+            GetMessagesQuery(chat_id=uuid4(), before="not-a-cursor"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_messages_query_both_cursors(mediator: Mediator):
+    cursor = MessagesCursor(created_at=datetime.now(), oid=uuid4()).encode()
+
+    with pytest.raises(AmbiguousMessagesCursorException):
+        await mediator.handle_query(
+            GetMessagesQuery(chat_id=uuid4(), before=cursor, after=cursor),
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_messages_query_without_total(
+    mediator: Mediator,
+    faker: Faker,
+):
+    chat_result, *_ = await mediator.handle_command(
+        CreateChatCommand(title=faker.text(max_nb_chars=50), owner_id=uuid4()),
+    )
+
+    await mediator.handle_command(
+        CreateMessageCommand(
+            chat_id=chat_result.oid,
+            sender_id=uuid4(),
+            content=faker.text(max_nb_chars=50),
+        ),
+    )
+
+    messages, total = await mediator.handle_query(
+        GetMessagesQuery(chat_id=chat_result.oid, with_total=False),
+    )
+
+    assert total is None
+    assert len(list(messages)) == 1
+
+
+@pytest.mark.asyncio
+async def test_export_messages_query_streams_oldest_first(mediator: Mediator, faker: Faker):
+    chat, *_ = await mediator.handle_command(
+        CreateChatCommand(title=faker.text(max_nb_chars=20), owner_id=uuid4()),
+    )
+    contents = [f"Message {index}" for index in range(5)]
+    for content in contents:
+        await mediator.handle_command(
+            CreateMessageCommand(chat_id=chat.oid, sender_id=uuid4(), content=content),
+        )
+
+    messages = await mediator.handle_query(ExportMessagesQuery(chat_id=chat.oid, batch_size=2))
+
+    assert [message.content.as_generic_type() async for message in messages] == contents
+
+
+@pytest.mark.asyncio
+async def test_export_messages_query_chat_not_found(mediator: Mediator):
+    with pytest.raises(ChatNotFoundException):
+        await mediator.handle_query(ExportMessagesQuery(chat_id=uuid4()))
@@ -1,9 +1,16 @@
 import pytest
 from faker import Faker
+from punq import Container
 
 from application.mediator import Mediator
-from application.users.commands import CreateUserCommand
+from application.users.commands import (
+    CreateUserCommand,
+    GenerateAvatarThumbnailsCommand,
+    RehashPasswordCommand,
+    UploadAvatarCommand,
+)
 from application.users.queries import GetUserByIdQuery
+from domain.base.file_storage import BaseFileStorage
 from domain.users.entities import UserEntity
 from domain.users.exceptions.users import (
     EmptyEmailException,
@@ -13,6 +20,7 @@ from domain.users.exceptions.users import (
     PasswordTooShortException,
     UserAlreadyExistsException,
 )
+from domain.users.interfaces import BasePasswordHasher
 
 
 @pytest.mark.asyncio
@@ -138,3 +146,155 @@ async def test_create_user_command_duplicate_email(
         )
 
     assert exc_info.value.email == email
+
+
+@pytest.mark.asyncio
+async def test_rehash_password_command_upgrades_outdated_hash(
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    password = faker.password(length=12)
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=faker.email(), password=password, name=faker.name()),
+    )
+    password_hasher: BasePasswordHasher = container.resolve(BasePasswordHasher)
+
+    not_outdated, *_ = await mediator.handle_command(RehashPasswordCommand(user_id=user.oid, password=password))
+    password_hasher.rounds = 9
+    wrong_password, *_ = await mediator.handle_command(
+        RehashPasswordCommand(user_id=user.oid, password="wrong-password1"),
+    )
+    rehashed, *_ = await mediator.handle_command(RehashPasswordCommand(user_id=user.oid, password=password))
+
+    assert (not_outdated, wrong_password, rehashed) == (False, False, True)
+
+    updated_user = await mediator.handle_query(GetUserByIdQuery(user_id=user.oid))
+    assert updated_user.hashed_password.startswith("$2b$09$")
+    assert await password_hasher.verify_password(password, updated_user.hashed_password)
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_generate_avatar_thumbnails_command_stores_thumbnails_beside_avatar(
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=faker.email(), password=faker.password(length=12), name=faker.name()),
+    )
+    user, *_ = await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"ava", b"tar"), filename="me.png"),
+    )
+
+    thumbnails, *_ = await mediator.handle_command(
+        GenerateAvatarThumbnailsCommand(user_id=user.oid, avatar_path=user.avatar_path),
+    )
+
+    avatar_stem = user.avatar_path.rsplit(".", 1)[0]
+    assert thumbnails == {"64": f"{avatar_stem}_64.jpg", "128": f"{avatar_stem}_128.jpg"}
+
+    file_storage: BaseFileStorage = container.resolve(BaseFileStorage)
+    assert await file_storage.read_file(thumbnails["64"]) == b"64:avatar"
+
+    updated_user = await mediator.handle_query(GetUserByIdQuery(user_id=user.oid))
+    assert updated_user.avatar_thumbnails == thumbnails
+
+
+@pytest.mark.asyncio
+async def test_generate_avatar_thumbnails_command_skips_replaced_avatar(
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=faker.email(), password=faker.password(length=12), name=faker.name()),
+    )
+    old_user, *_ = await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"old"), filename="old.png"),
+    )
+    old_avatar_path = old_user.avatar_path
+    await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"new"), filename="new.png"),
+    )
+    # Задача миниатюр успела прочитать старый аватар до его удаления
+    file_storage: BaseFileStorage = container.resolve(BaseFileStorage)
+    await file_storage.upload_file(iter_chunks(b"old"), old_avatar_path)
+
+    thumbnails, *_ = await mediator.handle_command(
+        GenerateAvatarThumbnailsCommand(user_id=user.oid, avatar_path=old_avatar_path),
+    )
+
+    assert thumbnails == {}
+
+    avatar_stem = old_avatar_path.rsplit(".", 1)[0]
+    assert await file_storage.read_file(f"{avatar_stem}_64.jpg") is None
+
+    updated_user = await mediator.handle_query(GetUserByIdQuery(user_id=user.oid))
+    assert updated_user.avatar_thumbnails == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_command_deletes_previous_avatar_files(
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=faker.email(), password=faker.password(length=12), name=faker.name()),
+    )
+    old_user, *_ = await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"old"), filename="old.png"),
+    )
+    old_avatar_path = old_user.avatar_path
+    old_thumbnails, *_ = await mediator.handle_command(
+        GenerateAvatarThumbnailsCommand(user_id=user.oid, avatar_path=old_avatar_path),
+    )
+
+    new_user, *_ = await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"new"), filename="new.png"),
+    )
+
+    file_storage: BaseFileStorage = container.resolve(BaseFileStorage)
+    for file_path in [old_avatar_path, *old_thumbnails.values()]:
+        assert await file_storage.read_file(file_path) is None
+    assert await file_storage.read_file(new_user.avatar_path) == b"new"
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_command_deletes_thumbnails_recorded_during_upload(
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=faker.email(), password=faker.password(length=12), name=faker.name()),
+    )
+    old_user, *_ = await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=iter_chunks(b"old"), filename="old.png"),
+    )
+    old_avatar_path = old_user.avatar_path
+    old_thumbnails = {}
+
+    async def content_racing_thumbnails():
+        # Задача миниатюр старого аватара завершается, пока новый еще загружается
+        thumbnails, *_ = await mediator.handle_command(
+            GenerateAvatarThumbnailsCommand(user_id=user.oid, avatar_path=old_avatar_path),
+        )
+        old_thumbnails.update(thumbnails)
+        yield b"new"
+
+    await mediator.handle_command(
+        UploadAvatarCommand(user_id=user.oid, content=content_racing_thumbnails(), filename="new.png"),
+    )
+
+    assert old_thumbnails
+
+    file_storage: BaseFileStorage = container.resolve(BaseFileStorage)
+    for file_path in [old_avatar_path, *old_thumbnails.values()]:
+        assert await file_storage.read_file(file_path) is None
@@ -1,6 +1,7 @@
 from infrastructure.database.repositories.dummy.chats.chats import DummyInMemoryChatsRepository
 from infrastructure.database.repositories.dummy.chats.messages import DummyInMemoryMessagesRepository
 from infrastructure.database.repositories.dummy.users.users import DummyInMemoryUserRepository
+from infrastructure.images.dummy import DummyThumbnailGenerator
 from infrastructure.s3.dummy import DummyFileStorage
 from punq import (
     Container,
@@ -13,6 +14,7 @@ from domain.chats.interfaces.repository import (
     BaseChatsRepository,
     BaseMessagesRepository,
 )
+from domain.users.interfaces import BaseThumbnailGenerator
 from domain.users.interfaces.repository import BaseUserRepository
 
 
@@ -45,4 +47,10 @@ def init_dummy_container() -> Container:
         scope=Scope.singleton,
     )
 
+    container.register(
+        BaseThumbnailGenerator,
+        DummyThumbnailGenerator,
+        scope=Scope.singleton,
+    )
+
     return container
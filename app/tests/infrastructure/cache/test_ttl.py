@@ -0,0 +1,55 @@
+from infrastructure.cache.ttl import (
+    MISSING,
+    TTLCache,
+)
+
+
+def test_ttl_cache_returns_missing_for_absent_and_expired_keys():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("fresh", 1)
+    cache.set("expired", 2, ttl=-1)
+
+    assert cache.get("fresh") == 1
+    assert cache.get("expired") is MISSING
+    assert cache.get("absent") is MISSING
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(cache) == 1
+
+
+def test_ttl_cache_keeps_cached_none():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("negative", None)
+
+    assert cache.get("negative") is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+
+    cache.set("third", 3)
+
+    assert cache.get("second") is MISSING
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+
+
+def test_ttl_cache_drops_load_racing_write_or_delete():
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    deleted = cache.begin_load("deleted")
+    cache.delete("deleted")
+    written = cache.begin_load("written")
+    cache.set("written", "fresh")
+    untouched = cache.begin_load("untouched")
+
+    assert not cache.finish_load("deleted", deleted, "stale")
+    assert not cache.finish_load("written", written, "stale")
+    assert cache.finish_load("untouched", untouched, "loaded")
+
+    assert cache.get("deleted") is MISSING
+    assert cache.get("written") == "fresh"
+    assert cache.get("untouched") == "loaded"
+    assert cache._loads == cache._generations == {}
@@ -0,0 +1,92 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from infrastructure.cache.ttl import TTLCache
+from infrastructure.database.repositories.cached.chats import CachedChatsRepository
+from infrastructure.database.repositories.dummy.chats.chats import DummyInMemoryChatsRepository
+
+from domain.chats.entities.chats import ChatEntity
+from domain.chats.value_objects.chats import ChatTitleValueObject
+
+
+class CountingChatsRepository(DummyInMemoryChatsRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_chat_calls = 0
+        # Если задано, чтение ждет события уже после обращения к "базе"
+        self.get_chat_gate: asyncio.Event | None = None
+
+    async def get_chat_by_oid(self, oid):
+        self.get_chat_calls += 1
+        chat = await super().get_chat_by_oid(oid)
+        if self.get_chat_gate is not None:
+            await self.get_chat_gate.wait()
+        return chat
+
+
+@pytest.fixture
+def inner() -> CountingChatsRepository:
+    return CountingChatsRepository()
+
+
+@pytest.fixture
+def repository(inner) -> CachedChatsRepository:
+    return CachedChatsRepository(repository=inner, cache=TTLCache(maxsize=100, ttl=60))
+
+
+def make_chat() -> ChatEntity:
+    return ChatEntity(owner_id=uuid4(), title=ChatTitleValueObject(value=f"Chat {uuid4()}"))
+
+
+@pytest.mark.asyncio
+async def test_get_chat_is_read_through(repository, inner):
+    chat = make_chat()
+    await inner.add_chat(chat)
+
+    first = await repository.get_chat_by_oid(str(chat.oid))
+    second = await repository.get_chat_by_oid(str(chat.oid))
+
+    assert first is second is not None
+    assert inner.get_chat_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_chat_is_cached_negatively(repository, inner):
+    oid = str(uuid4())
+
+    assert await repository.get_chat_by_oid(oid) is None
+    assert await repository.get_chat_by_oid(oid) is None
+    assert inner.get_chat_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_and_add_populates(repository, inner):
+    chat = make_chat()
+    await repository.add_chat(chat)
+
+    assert await repository.get_chat_by_oid(str(chat.oid)) is chat
+    assert inner.get_chat_calls == 0
+
+    await repository.delete_chat_by_oid(str(chat.oid))
+
+    assert await repository.get_chat_by_oid(str(chat.oid)) is None
+    assert inner.get_chat_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_load_racing_delete_is_not_cached(repository, inner):
+    chat = make_chat()
+    await inner.add_chat(chat)
+    inner.get_chat_gate = asyncio.Event()
+
+    # Загрузка прочитала чат до удаления и ждет
+    load = asyncio.create_task(repository.get_chat_by_oid(str(chat.oid)))
+    await asyncio.sleep(0)
+    await repository.delete_chat_by_oid(str(chat.oid))
+    inner.get_chat_gate.set()
+    await load
+
+    inner.get_chat_gate = None
+    assert await repository.get_chat_by_oid(str(chat.oid)) is None
+    assert inner.get_chat_calls == 2
@@ -0,0 +1,135 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from infrastructure.cache.recent_messages import RecentMessagesCache
+from infrastructure.database.repositories.cached.messages import CachedMessagesRepository
+from infrastructure.database.repositories.dummy.chats.messages import DummyInMemoryMessagesRepository
+
+from domain.chats.entities.messages import MessageEntity
+from domain.chats.filters.messages import (
+    GetMessagesFilters,
+    MessagesCursor,
+)
+from domain.chats.value_objects.messages import MessageContentValueObject
+
+
+class CountingMessagesRepository(DummyInMemoryMessagesRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_messages_calls = 0
+        self.gate: asyncio.Event | None = None
+
+    async def get_messages(self, chat_id, filters):
+        self.get_messages_calls += 1
+        result = await super().get_messages(chat_id, filters)
+        if self.gate is not None:
+            await self.gate.wait()
+        return result
+
+
+def make_message(chat_id, content: str = "Hello") -> MessageEntity:
+    return MessageEntity(chat_id=chat_id, sender_id=uuid4(), content=MessageContentValueObject(value=content))
+
+
+@pytest.fixture
+def inner() -> CountingMessagesRepository:
+    return CountingMessagesRepository()
+
+
+@pytest.fixture
+def cache() -> RecentMessagesCache:
+    return RecentMessagesCache(per_chat_limit=5)
+
+
+@pytest.fixture
+def repository(inner, cache) -> CachedMessagesRepository:
+    return CachedMessagesRepository(repository=inner, cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_first_page_is_served_from_cache(repository, inner, cache):
+    chat_id = uuid4()
+    for index in range(3):
+        await inner.add_message(make_message(chat_id, f"Message {index}"))
+
+    first, first_total = await repository.get_messages(chat_id, GetMessagesFilters(limit=2))
+    second, second_total = await repository.get_messages(chat_id, GetMessagesFilters(limit=2, offset=1))
+
+    assert inner.get_messages_calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert [message.content.as_generic_type() for message in first] == ["Message 2", "Message 1"]
+    assert [message.content.as_generic_type() for message in second] == ["Message 1", "Message 0"]
+    assert first_total == second_total == 3
+
+
+@pytest.mark.asyncio
+async def test_add_message_writes_through(repository, inner):
+    chat_id = uuid4()
+    await repository.get_messages(chat_id, GetMessagesFilters(limit=5))
+
+    message = make_message(chat_id)
+    await repository.add_message(message)
+    messages, total = await repository.get_messages(chat_id, GetMessagesFilters(limit=5))
+
+    assert inner.get_messages_calls == 1
+    assert list(messages) == [message]
+    assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_pages_beyond_cache_and_cursors_bypass_cache(repository, inner):
+    chat_id = uuid4()
+    message = make_message(chat_id)
+    await repository.add_message(message)
+
+    await repository.get_messages(chat_id, GetMessagesFilters(limit=10))
+    await repository.get_messages(chat_id, GetMessagesFilters(before=MessagesCursor.from_entity(message)))
+
+    assert inner.get_messages_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_load_racing_with_write_is_not_cached(repository, inner):
+    chat_id = uuid4()
+    inner.gate = asyncio.Event()
+
+    load = asyncio.create_task(repository.get_messages(chat_id, GetMessagesFilters(limit=5)))
+    await asyncio.sleep(0)
+    inner.gate.set()
+    inner.gate = None
+    await repository.add_message(make_message(chat_id))
+    await load
+
+    messages, total = await repository.get_messages(chat_id, GetMessagesFilters(limit=5))
+
+    assert inner.get_messages_calls == 2
+    assert total == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_respects_memory_cap(inner):
+    cache = RecentMessagesCache(per_chat_limit=5, max_bytes=2000)
+    repository = CachedMessagesRepository(repository=inner, cache=cache)
+    first_chat, second_chat = uuid4(), uuid4()
+    await inner.add_message(make_message(first_chat, "x" * 500))
+    await inner.add_message(make_message(second_chat, "y" * 500))
+
+    await repository.get_messages(first_chat, GetMessagesFilters(limit=5))
+    await repository.get_messages(second_chat, GetMessagesFilters(limit=5))
+    await repository.get_messages(first_chat, GetMessagesFilters(limit=5))
+
+    assert cache.size <= cache.max_bytes
+    assert inner.get_messages_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_invalidates_chat(repository, inner):
+    chat_id = uuid4()
+    await repository.get_messages(chat_id, GetMessagesFilters(limit=5))
+
+    await repository.add_messages([make_message(chat_id), make_message(chat_id)])
+    _, total = await repository.get_messages(chat_id, GetMessagesFilters(limit=5))
+
+    assert inner.get_messages_calls == 2
+    assert total == 2
@@ -0,0 +1,118 @@
+import asyncio
+from dataclasses import replace
+from uuid import uuid4
+
+import pytest
+from infrastructure.cache.ttl import (
+    MISSING,
+    TTLCache,
+)
+from infrastructure.database.repositories.cached.users import CachedUserRepository
+from infrastructure.database.repositories.dummy.users.users import DummyInMemoryUserRepository
+
+from domain.users.entities import UserEntity
+from domain.users.value_objects import (
+    EmailValueObject,
+    UserNameValueObject,
+)
+
+
+class CountingUserRepository(DummyInMemoryUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+        # Если задано, чтение ждет события уже после обращения к "базе"
+        self.get_by_id_gate: asyncio.Event | None = None
+
+    async def get_by_id(self, user_id):
+        self.get_by_id_calls += 1
+        user = await super().get_by_id(user_id)
+        user = replace(user) if user else None
+        if self.get_by_id_gate is not None:
+            await self.get_by_id_gate.wait()
+        # Как и настоящий репозиторий, отдаем новый объект на каждый запрос
+        return user
+
+
+@pytest.fixture
+def inner() -> CountingUserRepository:
+    return CountingUserRepository()
+
+
+@pytest.fixture
+def cache() -> TTLCache:
+    return TTLCache(maxsize=100, ttl=60)
+
+
+@pytest.fixture
+def repository(inner, cache) -> CachedUserRepository:
+    return CachedUserRepository(repository=inner, cache=cache)
+
+
+def make_user() -> UserEntity:
+    return UserEntity(
+        email=EmailValueObject(value=f"{uuid4().hex}@example.com"),
+        hashed_password="hashed",
+        name=UserNameValueObject(value="Cached User"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_cached(repository, inner, cache):
+    user = make_user()
+    await repository.add(user)
+
+    await repository.get_by_id(user.oid)
+    await repository.get_by_id(user.oid)
+
+    assert inner.get_by_id_calls == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_path_invalidates_user(repository, inner):
+    user = make_user()
+    await repository.add(user)
+    await repository.get_by_id(user.oid)
+
+    await repository.update_avatar_path(user.oid, "avatars/new.png")
+    updated = await repository.get_by_id(user.oid)
+
+    assert inner.get_by_id_calls == 2
+    assert updated.avatar_path == "avatars/new.png"
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(repository, inner):
+    user_id = uuid4()
+
+    assert await repository.get_by_id(user_id) is None
+    assert await repository.get_by_id(user_id) is None
+    assert inner.get_by_id_calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "update",
+    [
+        lambda repository, user_id: repository.update_avatar_path(user_id, "avatars/new.png"),
+        lambda repository, user_id: repository.update_hashed_password(user_id, "new-hashed"),
+        lambda repository, user_id: repository.update_avatar_thumbnails(user_id, "avatars/old.png", {"64": "t.png"}),
+    ],
+    ids=["avatar_path", "hashed_password", "avatar_thumbnails"],
+)
+async def test_load_racing_update_is_not_cached(repository, inner, cache, update):
+    user = make_user()
+    user.avatar_path = "avatars/old.png"
+    await repository.add(user)
+    inner.get_by_id_gate = asyncio.Event()
+
+    # Загрузка прочитала пользователя до изменения и ждет
+    load = asyncio.create_task(repository.get_by_id(user.oid))
+    await asyncio.sleep(0)
+    await update(repository, user.oid)
+    inner.get_by_id_gate.set()
+    await load
+
+    assert cache.get(user.oid) is MISSING
+    assert len(cache) == 0
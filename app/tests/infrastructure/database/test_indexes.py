@@ -0,0 +1,127 @@
+import pytest
+from infrastructure.database.indexes import (
+    MongoDBIndexManager,
+    MongoIndexSpec,
+)
+from infrastructure.database.indexes.exceptions import MongoIndexConflictException
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+)
+from pymongo.errors import OperationFailure
+
+
+class FakeCollection:
+    def __init__(self, indexes: dict[str, dict] | None = None):
+        self.indexes = {"_id_": {"key": [("_id", 1)], "v": 2}, **(indexes or {})}
+        self.create_calls: list[list[str]] = []
+        self.create_error: OperationFailure | None = None
+
+    async def index_information(self) -> dict[str, dict]:
+        return {name: dict(info) for name, info in self.indexes.items()}
+
+    async def create_indexes(self, models) -> list[str]:
+        if self.create_error is not None:
+            raise self.create_error
+
+        names = []
+        for model in models:
+            document = model.document
+            self.indexes[document["name"]] = {
+                "key": list(document["key"].items()),
+                "v": 2,
+                **({"unique": True} if document.get("unique") else {}),
+            }
+            names.append(document["name"])
+
+        self.create_calls.append(names)
+        return names
+
+
+SPECS = (
+    MongoIndexSpec(name="oid_unique", keys=(("oid", ASCENDING),), unique=True),
+    MongoIndexSpec(name="chat_id_created_at", keys=(("chat_id", ASCENDING), ("created_at", DESCENDING))),
+)
+
+
+def make_manager(collection: FakeCollection) -> MongoDBIndexManager:
+    return MongoDBIndexManager(
+        mongo_db_client={"db": {"message": collection}},
+        mongo_db_database_name="db",
+        indexes={"message": SPECS},
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_creates_missing_indexes():
+    collection = FakeCollection()
+
+    created = await make_manager(collection).ensure_indexes()
+
+    assert created == ["message.oid_unique", "message.chat_id_created_at"]
+    assert collection.create_calls == [["oid_unique", "chat_id_created_at"]]
+    assert collection.indexes["oid_unique"] == {"key": [("oid", 1)], "v": 2, "unique": True}
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_is_idempotent():
+    collection = FakeCollection()
+    manager = make_manager(collection)
+
+    await manager.ensure_indexes()
+    created = await manager.ensure_indexes()
+
+    assert created == []
+    assert len(collection.create_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_reports_only_created_indexes():
+    collection = FakeCollection(indexes={"oid_unique": {"key": [("oid", 1)], "unique": True, "v": 2}})
+
+    created = await make_manager(collection).ensure_indexes()
+
+    assert created == ["message.chat_id_created_at"]
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_accepts_same_index_under_other_name():
+    collection = FakeCollection(indexes={"oid_1": {"key": [("oid", 1.0)], "unique": True, "v": 2}})
+
+    created = await make_manager(collection).ensure_indexes()
+
+    assert created == ["message.chat_id_created_at"]
+    assert "oid_unique" not in collection.indexes
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_conflicting_index_with_same_name():
+    collection = FakeCollection(indexes={"oid_unique": {"key": [("oid", 1)], "v": 2}})
+
+    with pytest.raises(MongoIndexConflictException) as exc_info:
+        await make_manager(collection).ensure_indexes()
+
+    assert exc_info.value.index_name == "oid_unique"
+    assert collection.create_calls == []
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_conflicting_index_with_same_keys():
+    collection = FakeCollection(indexes={"oid_1": {"key": [("oid", 1)], "v": 2}})
+
+    with pytest.raises(MongoIndexConflictException) as exc_info:
+        await make_manager(collection).ensure_indexes()
+
+    assert "oid_1" in exc_info.value.reason
+
+
+@pytest.mark.asyncio
+async def test_ensure_indexes_wraps_create_failure():
+    collection = FakeCollection()
+    collection.create_error = OperationFailure("Index already exists with a different name", code=85)
+
+    with pytest.raises(MongoIndexConflictException) as exc_info:
+        await make_manager(collection).ensure_indexes()
+
+    assert exc_info.value.collection_name == "message"
+    assert exc_info.value.index_name == "oid_unique, chat_id_created_at"
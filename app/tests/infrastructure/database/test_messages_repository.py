@@ -0,0 +1,205 @@
+from uuid import (
+    UUID,
+    uuid4,
+)
+
+import pytest
+from infrastructure.database.converters.chats.chats import message_entity_to_document
+from infrastructure.database.repositories.chats.messages import MongoDBMessagesRepository
+from pymongo.errors import (
+    BulkWriteError,
+    ConnectionFailure,
+)
+
+from domain.chats.entities.messages import MessageEntity
+from domain.chats.filters.messages import GetMessagesFilters
+from domain.chats.value_objects.messages import MessageContentValueObject
+
+
+def matches(document: dict, filter: dict) -> bool:
+    for key, condition in filter.items():
+        if isinstance(condition, dict) and "$exists" in condition:
+            if (key in document) != condition["$exists"]:
+                return False
+        elif isinstance(condition, dict) and "$in" in condition:
+            if document.get(key) not in condition["$in"]:
+                return False
+        elif document.get(key) != condition:
+            return False
+
+    return True
+
+
+def apply_update(document: dict, update: dict) -> None:
+    for key, value in update.get("$inc", {}).items():
+        document[key] = document.get(key, 0) + value
+    for key, value in update.get("$set", {}).items():
+        document[key] = value
+    for key in update.get("$unset", {}):
+        document.pop(key, None)
+
+
+class FakeCursor:
+    def __init__(self, documents: list[dict]):
+        self.documents = documents
+
+    def sort(self, keys):
+        for key, direction in reversed(keys):
+            self.documents.sort(key=lambda document: document[key], reverse=direction < 0)
+        return self
+
+    def skip(self, count: int):
+        self.documents = self.documents[count:]
+        return self
+
+    def limit(self, count: int):
+        self.documents = self.documents[:count]
+        return self
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self.documents:
+            yield document
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents: list[dict] = []
+        self.bulk_write_error: Exception | None = None
+
+    async def insert_one(self, document: dict) -> None:
+        self.documents.append(dict(document))
+
+    async def insert_many(self, documents: list[dict], ordered: bool = True) -> None:
+        existing = {document["oid"] for document in self.documents}
+        write_errors = []
+        for index, document in enumerate(documents):
+            if document["oid"] in existing:
+                write_errors.append({"index": index, "code": 11000, "errmsg": "duplicate key"})
+            else:
+                self.documents.append(dict(document))
+
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+    async def find_one(self, filter: dict, projection: dict | None = None) -> dict | None:
+        return next((dict(document) for document in self.documents if matches(document, filter)), None)
+
+    def find(self, filter: dict) -> FakeCursor:
+        return FakeCursor([dict(document) for document in self.documents if matches(document, filter)])
+
+    async def count_documents(self, filter: dict) -> int:
+        return sum(1 for document in self.documents if matches(document, filter))
+
+    async def update_one(self, filter: dict, update: dict) -> None:
+        document = next((document for document in self.documents if matches(document, filter)), None)
+        if document is not None:
+            apply_update(document, update)
+
+    async def update_many(self, filter: dict, update: dict) -> None:
+        for document in self.documents:
+            if matches(document, filter):
+                apply_update(document, update)
+
+    async def bulk_write(self, requests, ordered: bool = True) -> None:
+        if self.bulk_write_error is not None:
+            raise self.bulk_write_error
+
+        for request in requests:
+            await self.update_one(request._filter, request._doc)
+
+
+@pytest.fixture
+def collections() -> dict[str, FakeCollection]:
+    return {"message": FakeCollection(), "chat": FakeCollection()}
+
+
+@pytest.fixture
+def repository(collections) -> MongoDBMessagesRepository:
+    return MongoDBMessagesRepository(
+        mongo_db_client={"db": collections},
+        mongo_db_database_name="db",
+        mongo_db_collection_name="message",
+        mongo_db_chats_collection_name="chat",
+    )
+
+
+def make_chat(collections, **fields) -> str:
+    chat_id = str(uuid4())
+    collections["chat"].documents.append({"oid": chat_id, **fields})
+    return chat_id
+
+
+def make_message(chat_id: str) -> MessageEntity:
+    return MessageEntity(
+        chat_id=UUID(chat_id),
+        sender_id=uuid4(),
+        content=MessageContentValueObject(value="hello"),
+    )
+
+
+async def get_total(repository: MongoDBMessagesRepository, chat_id: str) -> int:
+    _, total = await repository.get_messages(UUID(chat_id), GetMessagesFilters(limit=1))
+    return total
+
+
+def get_counter(collections, chat_id: str) -> int | None:
+    chat = next(chat for chat in collections["chat"].documents if chat["oid"] == chat_id)
+    return chat.get("messages_count")
+
+
+@pytest.mark.asyncio
+async def test_add_message_increments_counter(repository, collections):
+    chat_id = make_chat(collections, messages_count=0)
+
+    await repository.add_message(make_message(chat_id))
+    await repository.add_messages([make_message(chat_id), make_message(chat_id)])
+
+    assert get_counter(collections, chat_id) == 3
+    assert await get_total(repository, chat_id) == 3
+
+
+@pytest.mark.asyncio
+async def test_legacy_chat_counter_is_backfilled_on_read(repository, collections):
+    chat_id = make_chat(collections)
+    collections["message"].documents.extend(message_entity_to_document(make_message(chat_id)) for _ in range(5))
+
+    await repository.add_message(make_message(chat_id))
+
+    # $inc не создает поле с неполным значением
+    assert get_counter(collections, chat_id) is None
+    assert await get_total(repository, chat_id) == 6
+    assert get_counter(collections, chat_id) == 6
+
+    await repository.add_message(make_message(chat_id))
+
+    assert await get_total(repository, chat_id) == 7
+
+
+@pytest.mark.asyncio
+async def test_failed_counter_update_resets_counter(repository, collections):
+    chat_id = make_chat(collections, messages_count=0)
+    await repository.add_message(make_message(chat_id))
+    collections["chat"].bulk_write_error = ConnectionFailure("connection lost")
+
+    await repository.add_message(make_message(chat_id))
+
+    assert len(collections["message"].documents) == 2
+    assert get_counter(collections, chat_id) is None
+
+    collections["chat"].bulk_write_error = None
+    assert await get_total(repository, chat_id) == 2
+
+
+@pytest.mark.asyncio
+async def test_partially_failed_bulk_insert_counts_inserted_messages(repository, collections):
+    chat_id = make_chat(collections, messages_count=0)
+    duplicate = make_message(chat_id)
+    await repository.add_message(duplicate)
+
+    with pytest.raises(BulkWriteError):
+        await repository.add_messages([make_message(chat_id), duplicate, make_message(chat_id)])
+
+    assert get_counter(collections, chat_id) == 3
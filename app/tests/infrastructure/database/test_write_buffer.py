@@ -0,0 +1,129 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from infrastructure.database.repositories.chats.write_buffer import MongoDBMessagesWriteBuffer
+from pymongo.errors import (
+    BulkWriteError,
+    DuplicateKeyError,
+    PyMongoError,
+)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.insert_calls: list[list[dict]] = []
+        self.bulk_write_calls: list[list] = []
+        self.update_many_calls: list[tuple[dict, dict]] = []
+        self.duplicate_oids: set[str] = set()
+        self.fail_bulk_write = False
+
+    async def insert_many(self, documents, ordered=True):
+        await asyncio.sleep(0)
+        self.insert_calls.append(list(documents))
+
+        write_errors = [
+            {"index": index, "code": 11000, "errmsg": "duplicate key"}
+            for index, document in enumerate(documents)
+            if document["oid"] in self.duplicate_oids
+        ]
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+
+    async def bulk_write(self, requests, ordered=True):
+        self.bulk_write_calls.append(list(requests))
+        if self.fail_bulk_write:
+            raise PyMongoError("chats collection is unavailable")
+
+    async def update_many(self, filter, update):
+        self.update_many_calls.append((filter, update))
+
+
+@pytest.fixture
+def collections() -> dict[str, FakeCollection]:
+    return {"message": FakeCollection(), "chat": FakeCollection()}
+
+
+@pytest.fixture
+def write_buffer(collections) -> MongoDBMessagesWriteBuffer:
+    return MongoDBMessagesWriteBuffer(
+        mongo_db_client={"db": collections},
+        mongo_db_database_name="db",
+        mongo_db_collection_name="message",
+        mongo_db_chats_collection_name="chat",
+        max_delay=0.01,
+        max_size=100,
+    )
+
+
+def make_document(chat_id: str) -> dict:
+    return {"oid": str(uuid4()), "chat_id": chat_id}
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_groups_concurrent_inserts(write_buffer, collections):
+    first_chat, second_chat = str(uuid4()), str(uuid4())
+    documents = [make_document(first_chat) for _ in range(3)] + [make_document(second_chat) for _ in range(2)]
+
+    await asyncio.gather(*(write_buffer.add(document) for document in documents))
+
+    assert collections["message"].insert_calls == [documents]
+    (updates,) = collections["chat"].bulk_write_calls
+    counts = {update._filter["oid"]: update._doc["$inc"]["messages_count"] for update in updates}
+    assert counts == {first_chat: 3, second_chat: 2}
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_flushes_when_full(write_buffer, collections):
+    write_buffer.max_delay = 10
+    write_buffer.max_size = 2
+    chat_id = str(uuid4())
+
+    await asyncio.wait_for(
+        asyncio.gather(write_buffer.add(make_document(chat_id)), write_buffer.add(make_document(chat_id))),
+        timeout=1,
+    )
+
+    assert len(collections["message"].insert_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_fails_only_rejected_documents(write_buffer, collections):
+    chat_id = str(uuid4())
+    duplicate, valid = make_document(chat_id), make_document(chat_id)
+    collections["message"].duplicate_oids.add(duplicate["oid"])
+
+    results = await asyncio.gather(write_buffer.add(duplicate), write_buffer.add(valid), return_exceptions=True)
+
+    assert isinstance(results[0], DuplicateKeyError)
+    assert results[1] is None
+    (updates,) = collections["chat"].bulk_write_calls
+    assert updates[0]._doc["$inc"]["messages_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_close_flushes_pending_documents(write_buffer, collections):
+    write_buffer.max_delay = 10
+    pending = asyncio.create_task(write_buffer.add(make_document(str(uuid4()))))
+    await asyncio.sleep(0)
+
+    await write_buffer.close()
+
+    await asyncio.wait_for(pending, timeout=1)
+    assert len(collections["message"].insert_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_buffer_resolves_inserted_documents_when_counter_update_fails(write_buffer, collections):
+    chat_id = str(uuid4())
+    collections["chat"].fail_bulk_write = True
+    documents = [make_document(chat_id) for _ in range(2)]
+
+    results = await asyncio.gather(*(write_buffer.add(document) for document in documents), return_exceptions=True)
+
+    assert results == [None, None]
+    assert collections["message"].insert_calls == [documents]
+    # Счетчик сброшен, чтобы следующее чтение total пересчитало его
+    assert collections["chat"].update_many_calls == [
+        ({"oid": {"$in": [chat_id]}}, {"$unset": {"messages_count": ""}}),
+    ]
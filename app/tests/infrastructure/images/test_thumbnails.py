@@ -0,0 +1,38 @@
+from io import BytesIO
+
+import pytest
+import pytest_asyncio
+from infrastructure.images.thumbnails import PillowThumbnailGenerator
+
+
+Image = pytest.importorskip("PIL.Image")
+
+
+@pytest_asyncio.fixture
+async def generator():
+    generator = PillowThumbnailGenerator(sizes=(32, 64), max_workers=1)
+    yield generator
+    await generator.close()
+
+
+def make_image(size: tuple[int, int], image_format: str) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGBA" if image_format == "PNG" else "RGB", size, color=(200, 30, 30)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("image_format", ["JPEG", "PNG"])
+async def test_thumbnails_have_fixed_sizes(generator: PillowThumbnailGenerator, image_format: str):
+    thumbnails = await generator.generate(make_image((640, 480), image_format))
+
+    assert set(thumbnails) == {"32", "64"}
+    for name, content in thumbnails.items():
+        with Image.open(BytesIO(content)) as thumbnail:
+            assert thumbnail.format == "JPEG"
+            assert thumbnail.size == (int(name), int(name))
+
+
+@pytest.mark.asyncio
+async def test_not_an_image_has_no_thumbnails(generator: PillowThumbnailGenerator):
+    assert await generator.generate(b"definitely not an image") == {}
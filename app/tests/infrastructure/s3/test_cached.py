@@ -0,0 +1,97 @@
+import pytest
+import pytest_asyncio
+from infrastructure.cache.ttl import TTLCache
+from infrastructure.s3.cached import CachedFileStorage
+from infrastructure.s3.dummy import DummyFileStorage
+
+
+class SigningFileStorage(DummyFileStorage):
+    def __init__(self):
+        super().__init__()
+        self.signed: list[list[str]] = []
+
+    async def get_file_urls(self, file_paths, expiration=3600):
+        file_paths = list(file_paths)
+        self.signed.append(file_paths)
+        return {
+            file_path: f"http://test-storage/{file_path}?v={len(self.signed)}" if file_path in self._files else None
+            for file_path in file_paths
+        }
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest_asyncio.fixture
+async def inner() -> SigningFileStorage:
+    storage = SigningFileStorage()
+    for file_path in ("avatars/1.png", "avatars/2.png"):
+        await storage.upload_file(iter_chunks(b"avatar"), file_path)
+
+    return storage
+
+
+@pytest.fixture
+def cache() -> TTLCache:
+    return TTLCache(maxsize=100)
+
+
+@pytest.fixture
+def storage(inner, cache) -> CachedFileStorage:
+    return CachedFileStorage(storage=inner, cache=cache, safety_margin=300)
+
+
+@pytest.mark.asyncio
+async def test_url_is_reused(storage, inner):
+    first = await storage.get_file_url("avatars/1.png")
+    second = await storage.get_file_url("avatars/1.png")
+
+    assert first == second
+    assert inner.signed == [["avatars/1.png"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_signs_only_missing_paths(storage, inner):
+    await storage.get_file_url("avatars/1.png")
+
+    urls = await storage.get_file_urls(["avatars/1.png", "avatars/2.png", "avatars/2.png", "avatars/absent.png"])
+
+    assert set(urls) == {"avatars/1.png", "avatars/2.png", "avatars/absent.png"}
+    assert urls["avatars/absent.png"] is None
+    assert inner.signed == [["avatars/1.png"], ["avatars/2.png", "avatars/absent.png"]]
+
+
+@pytest.mark.asyncio
+async def test_url_is_not_reused_near_expiry(storage, inner):
+    await storage.get_file_url("avatars/1.png", expiration=200)
+    await storage.get_file_url("avatars/1.png", expiration=200)
+
+    assert len(inner.signed) == 2
+
+
+@pytest.mark.asyncio
+async def test_url_with_other_expiration_is_signed_again(storage, inner):
+    await storage.get_file_url("avatars/1.png", expiration=3600)
+    await storage.get_file_url("avatars/1.png", expiration=7200)
+    await storage.get_file_url("avatars/1.png", expiration=7200)
+
+    assert len(inner.signed) == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_file_is_not_cached(storage, inner):
+    await storage.get_file_url("avatars/absent.png")
+    await storage.upload_file(iter_chunks(b"avatar"), "avatars/absent.png")
+
+    assert await storage.get_file_url("avatars/absent.png") is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_drops_cached_url(storage, inner):
+    await storage.get_file_url("avatars/1.png")
+
+    await storage.delete_file("avatars/1.png")
+
+    assert await storage.get_file_url("avatars/1.png") is None
@@ -0,0 +1,173 @@
+import asyncio
+from io import BytesIO
+
+import pytest
+from botocore.exceptions import ClientError
+from infrastructure.s3.client import S3Client
+
+from settings.config import Config
+
+
+@pytest.fixture
+def s3_client() -> S3Client:
+    return S3Client(config=Config(S3_MAX_POOL_CONNECTIONS=25))
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared_between_calls(s3_client: S3Client):
+    await s3_client.start()
+
+    client = await s3_client.get_client()
+
+    assert await s3_client.get_client() is client
+    assert client.meta.config.max_pool_connections == 25
+    await s3_client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_is_opened_lazily_and_start_is_idempotent(s3_client: S3Client):
+    client = await s3_client.get_client()
+    await s3_client.start()
+
+    assert s3_client.is_started
+    assert await s3_client.get_client() is client
+    await s3_client.close()
+
+
+@pytest.mark.asyncio
+async def test_close_releases_client(s3_client: S3Client):
+    client = await s3_client.get_client()
+
+    await s3_client.close()
+    await s3_client.close()
+
+    assert not s3_client.is_started
+    assert await s3_client.get_client() is not client
+    await s3_client.close()
+
+
+class FakeS3Client:
+    def __init__(self, bucket_exists: bool) -> None:
+        self.bucket_exists = bucket_exists
+        self.calls: list[str] = []
+        self.objects: dict[str, bytes] = {}
+        self.parts: dict[int, bytes] = {}
+
+    async def head_bucket(self, Bucket: str) -> None:
+        self.calls.append("head_bucket")
+        if not self.bucket_exists:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadBucket")
+
+    async def create_bucket(self, Bucket: str) -> None:
+        self.calls.append("create_bucket")
+        self.bucket_exists = True
+
+    async def upload_fileobj(self, file_obj, bucket: str, key: str) -> None:
+        self.calls.append("upload_fileobj")
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes) -> None:
+        self.calls.append("put_object")
+        self.objects[Key] = Body
+
+    async def create_multipart_upload(self, Bucket: str, Key: str) -> dict:
+        self.calls.append("create_multipart_upload")
+        self.parts = {}
+        return {"UploadId": "upload-1"}
+
+    async def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes) -> dict:
+        self.calls.append("upload_part")
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    async def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> None:
+        self.calls.append("complete_multipart_upload")
+        self.objects[Key] = b"".join(self.parts[part["PartNumber"]] for part in MultipartUpload["Parts"])
+
+    async def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> None:
+        self.calls.append("abort_multipart_upload")
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_provisioned_once(s3_client: S3Client):
+    fake_client = FakeS3Client(bucket_exists=False)
+    s3_client._client = fake_client
+
+    await asyncio.gather(*(s3_client.ensure_bucket() for _ in range(5)))
+    await s3_client.upload_fileobj(BytesIO(b"avatar"), "avatars/1.png")
+    await s3_client.upload_fileobj(BytesIO(b"avatar"), "avatars/2.png")
+
+    assert s3_client.is_bucket_ready
+    assert fake_client.calls == ["head_bucket", "create_bucket", "upload_fileobj", "upload_fileobj"]
+    assert s3_client.operation_counts == {"head_bucket": 1, "create_bucket": 1, "upload_fileobj": 2}
+
+
+@pytest.mark.asyncio
+async def test_failed_provisioning_is_retried(s3_client: S3Client):
+    fake_client = FakeS3Client(bucket_exists=True)
+    s3_client._client = fake_client
+
+    async def unavailable(Bucket: str) -> None:
+        raise ConnectionError
+
+    fake_client.head_bucket = unavailable
+    with pytest.raises(ConnectionError):
+        await s3_client.ensure_bucket()
+
+    del fake_client.head_bucket
+    await s3_client.upload_fileobj(BytesIO(b"avatar"), "avatars/1.png")
+
+    assert s3_client.is_bucket_ready
+    assert fake_client.calls == ["head_bucket", "upload_fileobj"]
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_small_stream_is_uploaded_with_single_request(s3_client: S3Client):
+    fake_client = FakeS3Client(bucket_exists=True)
+    s3_client._client = fake_client
+    s3_client._bucket_ready = True
+
+    await s3_client.upload_stream(iter_chunks(b"ava", b"tar"), "avatars/1.png", part_size=10)
+
+    assert fake_client.calls == ["put_object"]
+    assert fake_client.objects["avatars/1.png"] == b"avatar"
+
+
+@pytest.mark.asyncio
+async def test_large_stream_is_uploaded_in_parts(s3_client: S3Client):
+    fake_client = FakeS3Client(bucket_exists=True)
+    s3_client._client = fake_client
+    s3_client._bucket_ready = True
+
+    await s3_client.upload_stream(iter_chunks(b"0123456", b"789abcdef", b"ghij"), "avatars/1.png", part_size=8)
+
+    assert fake_client.calls == [
+        "create_multipart_upload",
+        "upload_part",
+        "upload_part",
+        "upload_part",
+        "complete_multipart_upload",
+    ]
+    assert fake_client.parts == {1: b"01234567", 2: b"89abcdef", 3: b"ghij"}
+    assert fake_client.objects["avatars/1.png"] == b"0123456789abcdefghij"
+
+
+@pytest.mark.asyncio
+async def test_failed_stream_aborts_multipart_upload(s3_client: S3Client):
+    fake_client = FakeS3Client(bucket_exists=True)
+    s3_client._client = fake_client
+    s3_client._bucket_ready = True
+
+    async def broken_stream():
+        yield b"0123456789"
+        raise ValueError("too large")
+
+    with pytest.raises(ValueError):
+        await s3_client.upload_stream(broken_stream(), "avatars/1.png", part_size=8)
+
+    assert fake_client.calls == ["create_multipart_upload", "upload_part", "abort_multipart_upload"]
+    assert "avatars/1.png" not in fake_client.objects
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from infrastructure.security.bcrypt import BcryptPasswordHasher
+
+from domain.users.exceptions import PasswordHasherBusyException
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password():
+    hasher = BcryptPasswordHasher(rounds=4)
+
+    hashed_password = await hasher.hash_password("password123")
+
+    assert await hasher.verify_password("password123", hashed_password)
+    assert not await hasher.verify_password("wrong-password1", hashed_password)
+    await hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    hasher = BcryptPasswordHasher(rounds=10)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.001)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    await hasher.hash_password("password123")
+    ticker_task.cancel()
+
+    assert ticks > 1
+    await hasher.close()
+
+
+@pytest.mark.asyncio
+async def test_hasher_rejects_requests_over_concurrency_limit():
+    hasher = BcryptPasswordHasher(rounds=4, max_concurrency=1, acquire_timeout=0.01)
+    await hasher._semaphore.acquire()
+
+    with pytest.raises(PasswordHasherBusyException):
+        await hasher.hash_password("password123")
+
+    hasher._semaphore.release()
+    assert await hasher.hash_password("password123")
+    await hasher.close()
+
+
+def test_needs_rehash_only_upgrades_or_caps_cost():
+    hasher = BcryptPasswordHasher(rounds=10, max_rounds=12)
+
+    assert hasher.needs_rehash("$2b$08$" + "a" * 53)
+    assert not hasher.needs_rehash("$2b$10$" + "a" * 53)
+    assert not hasher.needs_rehash("$2b$11$" + "a" * 53)
+    assert hasher.needs_rehash("$2b$13$" + "a" * 53)
+    assert not hasher.needs_rehash("not-a-bcrypt-hash")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("latency_budget", "expected_rounds"),
+    [(None, 8), (1e-9, 4), (60.0, 6)],
+)
+async def test_calibrate_fits_rounds_into_latency_budget(latency_budget, expected_rounds):
+    hasher = BcryptPasswordHasher(rounds=8, latency_budget=latency_budget, min_rounds=4, max_rounds=6)
+
+    await hasher.calibrate()
+
+    assert hasher.rounds == expected_rounds
+    await hasher.close()
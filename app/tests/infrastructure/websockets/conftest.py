@@ -0,0 +1,35 @@
+import asyncio
+
+import pytest
+
+
+class FakeWebSocket:
+    def __init__(self, send_delay: float = 0, gate: asyncio.Event | None = None) -> None:
+        self.send_delay = send_delay
+        self.gate = gate
+        self.sent: list[str | bytes] = []
+        self.received = asyncio.Event()
+        self.closed = asyncio.Event()
+        self.close_code: int | None = None
+
+    async def send_text(self, data: str) -> None:
+        await self._send(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._send(data)
+
+    async def _send(self, data: str | bytes) -> None:
+        if self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(self.send_delay)
+        self.sent.append(data)
+        self.received.set()
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+        self.closed.set()
+
+
+@pytest.fixture
+def websocket_factory():
+    return FakeWebSocket
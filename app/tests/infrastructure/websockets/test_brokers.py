@@ -0,0 +1,98 @@
+import asyncio
+import json
+import tempfile
+from uuid import uuid4
+
+import pytest
+from infrastructure.websockets.brokers import (
+    InMemoryMessageBroker,
+    UnixSocketMessageBroker,
+)
+from infrastructure.websockets.manager import BrokerConnectionManager
+
+
+@pytest.mark.asyncio
+async def test_in_memory_broker_delivers_to_local_connections(websocket_factory):
+    manager = BrokerConnectionManager(broker=InMemoryMessageBroker())
+    key = str(uuid4())
+    websocket = websocket_factory()
+    other_chat_websocket = websocket_factory()
+
+    await manager.accept_connection(websocket=websocket, key=key)
+    await manager.accept_connection(websocket=other_chat_websocket, key=str(uuid4()))
+    await manager.send_json_to_all(key=key, data={"type": "new_message"})
+    await asyncio.wait_for(websocket.received.wait(), timeout=1)
+
+    assert [json.loads(data)["type"] for data in websocket.sent] == ["new_message"]
+    assert other_chat_websocket.sent == []
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_broker_fans_out_to_every_worker(websocket_factory):
+    # Короткий путь: длина пути UNIX сокета ограничена ~108 байтами
+    with tempfile.TemporaryDirectory(prefix="ws-", dir="/tmp") as socket_dir:
+        first_worker = BrokerConnectionManager(broker=UnixSocketMessageBroker(socket_dir=socket_dir))
+        second_worker = BrokerConnectionManager(broker=UnixSocketMessageBroker(socket_dir=socket_dir))
+        await first_worker.start()
+        await second_worker.start()
+
+        try:
+            key = str(uuid4())
+            first_websocket = websocket_factory()
+            second_websocket = websocket_factory()
+            await first_worker.accept_connection(websocket=first_websocket, key=key)
+            await second_worker.accept_connection(websocket=second_websocket, key=key)
+
+            await first_worker.send_json_to_all(key=key, data={"type": "new_message"})
+
+            await asyncio.wait_for(first_websocket.received.wait(), timeout=1)
+            await asyncio.wait_for(second_websocket.received.wait(), timeout=1)
+
+            assert [json.loads(data)["type"] for data in first_websocket.sent] == ["new_message"]
+            assert [json.loads(data)["type"] for data in second_websocket.sent] == ["new_message"]
+        finally:
+            await first_worker.stop()
+            await second_worker.stop()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_broker_delivers_oversized_event_locally(websocket_factory):
+    with tempfile.TemporaryDirectory(prefix="ws-", dir="/tmp") as socket_dir:
+        manager = BrokerConnectionManager(broker=UnixSocketMessageBroker(socket_dir=socket_dir))
+        await manager.start()
+
+        try:
+            key = str(uuid4())
+            websocket = websocket_factory()
+            await manager.accept_connection(websocket=websocket, key=key)
+
+            await manager.send_json_to_all(key=key, data={"type": "new_message", "text": "x" * 300 * 1024})
+
+            await asyncio.wait_for(websocket.received.wait(), timeout=1)
+
+            assert [json.loads(data)["type"] for data in websocket.sent] == ["new_message"]
+        finally:
+            await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_broker_sends_event_at_datagram_limit(websocket_factory):
+    with tempfile.TemporaryDirectory(prefix="ws-", dir="/tmp") as socket_dir:
+        first_worker = BrokerConnectionManager(broker=UnixSocketMessageBroker(socket_dir=socket_dir))
+        second_worker = BrokerConnectionManager(broker=UnixSocketMessageBroker(socket_dir=socket_dir))
+        await first_worker.start()
+        await second_worker.start()
+
+        try:
+            key = str(uuid4())
+            websocket = websocket_factory()
+            await second_worker.accept_connection(websocket=websocket, key=key)
+
+            await first_worker.send_json_to_all(key=key, data={"type": "new_message", "text": "x" * 250 * 1024})
+
+            await asyncio.wait_for(websocket.received.wait(), timeout=1)
+
+            assert [json.loads(data)["type"] for data in websocket.sent] == ["new_message"]
+        finally:
+            await first_worker.stop()
+            await second_worker.stop()
@@ -0,0 +1,193 @@
+import asyncio
+import json
+import time
+from uuid import uuid4
+
+from fastapi import status
+
+import pytest
+from infrastructure.websockets.connection import (
+    OverflowPolicy,
+    RESYNC_ENVELOPE,
+)
+from infrastructure.websockets.envelope import BroadcastEnvelope
+from infrastructure.websockets.manager import ConnectionManager
+
+
+@pytest.mark.asyncio
+async def test_send_json_to_all_evicts_slow_connections(websocket_factory):
+    manager = ConnectionManager(send_timeout=0.05)
+    key = str(uuid4())
+    fast_websocket = websocket_factory()
+    slow_websocket = websocket_factory(send_delay=10)
+
+    await manager.accept_connection(websocket=slow_websocket, key=key)
+    await manager.accept_connection(websocket=fast_websocket, key=key)
+
+    started_at = time.monotonic()
+    await manager.send_json_to_all(key=key, data={"type": "new_message"})
+
+    assert time.monotonic() - started_at < 0.05
+
+    await asyncio.wait_for(slow_websocket.closed.wait(), timeout=1)
+
+    assert len(fast_websocket.sent) == 1
+    assert slow_websocket.sent == []
+    assert slow_websocket.close_code == status.WS_1013_TRY_AGAIN_LATER
+    assert [connection.websocket for connection in manager.connections_map[key].values()] == [fast_websocket]
+
+
+async def _overflow_stuck_connection(manager: ConnectionManager, websocket, key: str) -> None:
+    await manager.accept_connection(websocket=websocket, key=key)
+
+    # Первый кадр забирает писатель и зависает на отправке, следующие копятся в очереди
+    for number in range(4):
+        await manager.send_json_to_all(key=key, data={"number": number})
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_overflow_policy_drop_oldest(websocket_factory):
+    manager = ConnectionManager(max_queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    key = str(uuid4())
+    gate = asyncio.Event()
+    websocket = websocket_factory(gate=gate)
+
+    await _overflow_stuck_connection(manager, websocket, key)
+    gate.set()
+    await asyncio.sleep(0.01)
+
+    assert [json.loads(frame)["number"] for frame in websocket.sent] == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_overflow_policy_coalesce(websocket_factory):
+    manager = ConnectionManager(max_queue_size=2, overflow_policy=OverflowPolicy.COALESCE)
+    key = str(uuid4())
+    gate = asyncio.Event()
+    websocket = websocket_factory(gate=gate)
+
+    await _overflow_stuck_connection(manager, websocket, key)
+    gate.set()
+    await asyncio.sleep(0.01)
+
+    assert [json.loads(frame).get("number") for frame in websocket.sent] == [0, None, 3]
+    assert websocket.sent[1] == RESYNC_ENVELOPE.text
+
+
+@pytest.mark.asyncio
+async def test_overflow_policy_disconnect(websocket_factory):
+    manager = ConnectionManager(max_queue_size=2, overflow_policy=OverflowPolicy.DISCONNECT)
+    key = str(uuid4())
+    websocket = websocket_factory(gate=asyncio.Event())
+
+    await _overflow_stuck_connection(manager, websocket, key)
+    await asyncio.wait_for(websocket.closed.wait(), timeout=1)
+
+    assert websocket.close_code == status.WS_1013_TRY_AGAIN_LATER
+    assert key not in manager.connections_map
+
+
+@pytest.mark.asyncio
+async def test_broadcast_shares_serialized_envelope(websocket_factory):
+    manager = ConnectionManager()
+    key = str(uuid4())
+    text_websocket = websocket_factory()
+    binary_websocket = websocket_factory()
+
+    await manager.accept_connection(websocket=text_websocket, key=key)
+    await manager.accept_connection(websocket=binary_websocket, key=key, binary=True)
+
+    envelope = BroadcastEnvelope.from_data({"type": "new_message", "content": "привет"})
+    await manager.broadcast(key=key, envelope=envelope)
+    await asyncio.wait_for(text_websocket.received.wait(), timeout=1)
+    await asyncio.wait_for(binary_websocket.received.wait(), timeout=1)
+
+    sequenced, *_ = manager.replay_buffer.get_events_since(key, 0, manager.replay_buffer.epoch)
+
+    assert binary_websocket.sent[0] is sequenced.payload
+    assert text_websocket.sent[0] is sequenced.text
+    assert json.loads(text_websocket.sent[0])["content"] == "привет"
+
+
+@pytest.mark.asyncio
+async def test_connection_counts_and_empty_key_cleanup(websocket_factory):
+    manager = ConnectionManager()
+    first_key, second_key = str(uuid4()), str(uuid4())
+    websockets = [websocket_factory() for _ in range(3)]
+
+    await manager.accept_connection(websocket=websockets[0], key=first_key)
+    await manager.accept_connection(websocket=websockets[1], key=first_key)
+    await manager.accept_connection(websocket=websockets[2], key=second_key)
+
+    assert manager.count_connections(first_key) == 2
+    assert manager.count_connections(second_key) == 1
+    assert manager.total_connections == 3
+
+    await manager.remove_connection(websocket=websockets[2], key=second_key)
+    await manager.remove_connection(websocket=websockets[2], key=second_key)
+
+    assert second_key not in manager.connections_map
+    assert manager.count_connections(second_key) == 0
+    assert manager.total_connections == 2
+
+
+@pytest.mark.asyncio
+async def test_reap_pings_idle_and_closes_dead_connections(websocket_factory):
+    manager = ConnectionManager(heartbeat_interval=10, heartbeat_timeout=30)
+    key = str(uuid4())
+    alive_websocket = websocket_factory()
+    idle_websocket = websocket_factory()
+    dead_websocket = websocket_factory()
+
+    for websocket in (alive_websocket, idle_websocket, dead_websocket):
+        await manager.accept_connection(websocket=websocket, key=key)
+
+    connections = manager.connections_map[key]
+    now = time.monotonic()
+    connections[id(idle_websocket)].last_seen_at = now - 15
+    connections[id(idle_websocket)].last_ping_at = now - 15
+    connections[id(dead_websocket)].last_seen_at = now - 45
+
+    reaped = await manager.reap()
+    await asyncio.wait_for(idle_websocket.received.wait(), timeout=1)
+
+    assert reaped == 1
+    assert manager.reaped_connections == 1
+    assert dead_websocket.close_code == status.WS_1001_GOING_AWAY
+    assert manager.count_connections(key) == 2
+    assert [json.loads(frame)["type"] for frame in idle_websocket.sent] == ["ping"]
+    assert alive_websocket.sent == []
+
+    # Повторный пинг не уходит, пока не прошел heartbeat_interval
+    await manager.reap()
+    await asyncio.sleep(0.01)
+    assert len(idle_websocket.sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_reap_counts_only_inbound_frames_as_liveness(websocket_factory):
+    manager = ConnectionManager(heartbeat_interval=10, heartbeat_timeout=30)
+    key = str(uuid4())
+    answering_websocket = websocket_factory()
+    silent_websocket = websocket_factory()
+
+    for websocket in (answering_websocket, silent_websocket):
+        await manager.accept_connection(websocket=websocket, key=key)
+
+    connections = manager.connections_map[key]
+    for connection in connections.values():
+        connection.last_seen_at = time.monotonic() - 45
+        connection.last_ping_at = time.monotonic() - 15
+
+    # Обоим клиентам кадры уходят без ошибок, но отвечает только один
+    await manager.broadcast(key, BroadcastEnvelope.from_data({"type": "new_message"}))
+    await asyncio.wait_for(silent_websocket.received.wait(), timeout=1)
+    await manager.touch_connection(websocket=answering_websocket, key=key)
+
+    reaped = await manager.reap()
+
+    assert reaped == 1
+    assert silent_websocket.close_code == status.WS_1001_GOING_AWAY
+    assert manager.count_connections(key) == 1
+    assert id(answering_websocket) in manager.connections_map[key]
@@ -0,0 +1,80 @@
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from infrastructure.websockets.connection import RESYNC_ENVELOPE
+from infrastructure.websockets.envelope import BroadcastEnvelope
+from infrastructure.websockets.manager import ConnectionManager
+from infrastructure.websockets.replay import ChatEventReplayBuffer
+
+
+def test_replay_buffer_returns_events_after_last_seq():
+    buffer = ChatEventReplayBuffer(size=3)
+    key = str(uuid4())
+
+    sequenced = [buffer.append(key, BroadcastEnvelope.from_data({"number": number})) for number in range(3)]
+    first_event = json.loads(sequenced[0].payload)
+
+    assert first_event == {"seq": 1, "epoch": buffer.epoch, "number": 0}
+    assert buffer.get_events_since(key, 1, buffer.epoch) == sequenced[1:]
+    assert buffer.get_events_since(key, 3, buffer.epoch) == []
+
+
+def test_replay_buffer_reports_unrecoverable_gaps():
+    buffer = ChatEventReplayBuffer(size=2, max_chats=1)
+    key, other_key = str(uuid4()), str(uuid4())
+
+    for number in range(3):
+        buffer.append(key, BroadcastEnvelope.from_data({"number": number}))
+
+    # Событие 1 вытеснено из кольцевого буфера
+    assert buffer.get_events_since(key, 0, buffer.epoch) is None
+    assert len(buffer.get_events_since(key, 1, buffer.epoch)) == 2
+    # Другой воркер или рестарт
+    assert buffer.get_events_since(key, 1, "other-epoch") is None
+    assert buffer.get_events_since(key, 10, buffer.epoch) is None
+
+    # Чат вытеснен целиком вместе со своими событиями
+    buffer.append(other_key, BroadcastEnvelope.from_data({"number": 3}))
+    assert buffer.get_events_since(key, 2, buffer.epoch) is None
+    assert buffer.get_events_since(key, 4, buffer.epoch) == []
+
+
+@pytest.mark.asyncio
+async def test_accept_connection_replays_missed_events(websocket_factory):
+    manager = ConnectionManager()
+    key = str(uuid4())
+
+    for number in range(3):
+        await manager.send_json_to_all(key=key, data={"number": number})
+
+    websocket = websocket_factory()
+    replayed = await manager.accept_connection(
+        websocket=websocket,
+        key=key,
+        last_seq=1,
+        epoch=manager.replay_buffer.epoch,
+    )
+    await manager.send_json_to_all(key=key, data={"number": 3})
+    await asyncio.sleep(0.01)
+
+    assert replayed is True
+    assert [json.loads(frame)["number"] for frame in websocket.sent] == [1, 2, 3]
+    assert [json.loads(frame)["seq"] for frame in websocket.sent] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_accept_connection_sends_resync_before_live_events_when_gap_is_lost(websocket_factory):
+    manager = ConnectionManager()
+    key = str(uuid4())
+    await manager.send_json_to_all(key=key, data={"number": 0})
+
+    websocket = websocket_factory()
+    replayed = await manager.accept_connection(websocket=websocket, key=key, last_seq=0, epoch="stale")
+    await manager.send_json_to_all(key=key, data={"number": 1})
+    await asyncio.sleep(0.01)
+
+    assert replayed is False
+    assert websocket.sent[0] == RESYNC_ENVELOPE.text
+    assert [json.loads(frame)["number"] for frame in websocket.sent[1:]] == [1]
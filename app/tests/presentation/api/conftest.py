@@ -5,10 +5,10 @@ import pytest
 import pytest_asyncio
 from faker import Faker
 from presentation.api.auth import auth_service
+from presentation.api.dependencies import get_container
 from presentation.api.main import create_app
 from punq import Container
 
-from application.container import init_container
 from application.mediator import Mediator
 from application.users.commands import CreateUserCommand
 from domain.users.entities import UserEntity
@@ -23,7 +23,7 @@ def container() -> Container:
 @pytest.fixture
 def app(container: Container) -> FastAPI:
     app = create_app()
-    app.dependency_overrides[init_container] = lambda: container
+    app.dependency_overrides[get_container] = lambda: container
 
     return app
 
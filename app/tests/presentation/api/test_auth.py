@@ -7,9 +7,12 @@ from fastapi.testclient import TestClient
 import pytest
 from faker import Faker
 from httpx import Response
+from punq import Container
 
 from application.mediator import Mediator
 from application.users.commands import CreateUserCommand
+from application.users.queries import GetUserByIdQuery
+from domain.users.interfaces import BasePasswordHasher
 
 
 @pytest.mark.asyncio
@@ -171,6 +174,29 @@ async def test_login_success(
     assert "refresh_token" in cookies
 
 
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password_hash(
+    app: FastAPI,
+    client: TestClient,
+    container: Container,
+    mediator: Mediator,
+    faker: Faker,
+):
+    """После входа хэш с устаревшей стоимостью пересчитывается в фоне."""
+    email = faker.email()
+    password = faker.password(length=12)
+    user, *_ = await mediator.handle_command(
+        CreateUserCommand(email=email, password=password, name=faker.name()),
+    )
+    container.resolve(BasePasswordHasher).rounds = 9
+
+    response: Response = client.post(url=app.url_path_for("login"), json={"email": email, "password": password})
+
+    assert response.is_success
+    updated_user = await mediator.handle_query(GetUserByIdQuery(user_id=user.oid))
+    assert updated_user.hashed_password.startswith("$2b$09$")
+
+
 @pytest.mark.asyncio
 async def test_login_invalid_email(app: FastAPI, client: TestClient):
     url = app.url_path_for("login")
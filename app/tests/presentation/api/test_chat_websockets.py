@@ -0,0 +1,76 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import pytest
+
+from application.chats.commands import CreateChatCommand
+from application.chats.queries import GetMessagesQuery
+from application.mediator import Mediator
+from domain.users.entities import UserEntity
+
+
+def receive_event(websocket, event_type: str) -> dict:
+    while True:
+        event = json.loads(websocket.receive_text())
+        if event["type"] == event_type:
+            return event
+
+
+@pytest.mark.asyncio
+async def test_websocket_create_message_acks_and_broadcasts(
+    app: FastAPI,
+    authenticated_client: TestClient,
+    authenticated_user: UserEntity,
+    mediator: Mediator,
+):
+    """Сообщение, отправленное через WebSocket, сохраняется и рассылается в чат."""
+    chat, *_ = await mediator.handle_command(
+        CreateChatCommand(title="WebSocket chat", owner_id=authenticated_user.oid),
+    )
+    url = app.url_path_for("websocket_endpoint", chat_oid=str(chat.oid))
+
+    with authenticated_client.websocket_connect(url) as websocket:
+        assert websocket.receive_text().startswith("You are now connected!")
+
+        websocket.send_text(json.dumps({"type": "create_message", "content": "Hello", "request_id": "1"}))
+        ack = receive_event(websocket, "ack")
+        new_message = receive_event(websocket, "new_message")
+
+    assert ack["request_id"] == "1"
+    assert ack["message"]["content"] == "Hello"
+    assert ack["message"]["sender_id"] == str(authenticated_user.oid)
+    assert new_message["message"]["oid"] == ack["message"]["oid"]
+
+    messages, total = await mediator.handle_query(GetMessagesQuery(chat_id=chat.oid))
+    assert total == 1
+    assert [message.content.as_generic_type() for message in messages] == ["Hello"]
+
+
+@pytest.mark.asyncio
+async def test_websocket_create_message_reports_errors(
+    app: FastAPI,
+    authenticated_client: TestClient,
+    authenticated_user: UserEntity,
+    mediator: Mediator,
+):
+    """Невалидный кадр не закрывает соединение, а возвращает error с request_id."""
+    chat, *_ = await mediator.handle_command(
+        CreateChatCommand(title="WebSocket errors", owner_id=authenticated_user.oid),
+    )
+    url = app.url_path_for("websocket_endpoint", chat_oid=str(chat.oid))
+
+    with authenticated_client.websocket_connect(url) as websocket:
+        websocket.receive_text()
+
+        websocket.send_text(json.dumps({"type": "create_message", "content": "   ", "request_id": "empty"}))
+        empty_error = receive_event(websocket, "error")
+
+        websocket.send_text(json.dumps({"type": "create_message", "request_id": "missing"}))
+        missing_error = receive_event(websocket, "error")
+
+    assert empty_error["request_id"] == "empty"
+    assert empty_error["errors"][0]["type"] == "EmptyMessageContentException"
+    assert missing_error["request_id"] == "missing"
+    assert missing_error["errors"][0]["type"] == "ValidationError"
@@ -0,0 +1,148 @@
+import gzip
+import json
+from datetime import (
+    datetime,
+    timedelta,
+)
+from uuid import uuid4
+
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+import pytest
+
+from application.chats.commands import (
+    BulkCreateMessagesCommand,
+    BulkMessageData,
+    CreateChatCommand,
+)
+from application.chats.queries import GetMessagesQuery
+from application.mediator import Mediator
+from domain.users.entities import UserEntity
+
+
+def ndjson_stream(lines: list[str]):
+    # Разбиваем тело на куски, не совпадающие с границами строк
+    body = "".join(lines).encode()
+    for start in range(0, len(body), 7):
+        yield body[start : start + 7]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_success(
+    app: FastAPI,
+    authenticated_client: TestClient,
+    mediator: Mediator,
+):
+    """Тест импорта сообщений потоком NDJSON."""
+    chat_id = uuid4()
+    url = app.url_path_for("bulk_create_messages", chat_id=str(chat_id))
+    started_at = datetime(2024, 1, 1, 12, 0)
+    lines = [
+        json.dumps({"content": f"Message {index}", "created_at": (started_at + timedelta(minutes=index)).isoformat()})
+        + "\n"
+        for index in range(10)
+    ] + ["\n"]
+
+    response = authenticated_client.post(url=url, content=ndjson_stream(lines))
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json()["data"]["created"] == 10
+
+    messages, total = await mediator.handle_query(GetMessagesQuery(chat_id=chat_id, limit=10))
+    assert total == 10
+    # Сообщения отдаются от новых к старым
+    assert [message.content.as_generic_type() for message in messages] == [
+        f"Message {index}" for index in range(9, -1, -1)
+    ]
+    assert messages[0].created_at == started_at + timedelta(minutes=9)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_invalid_line(
+    app: FastAPI,
+    authenticated_client: TestClient,
+):
+    """Невалидная строка NDJSON возвращает 422 с номером строки."""
+    url = app.url_path_for("bulk_create_messages", chat_id=str(uuid4()))
+    lines = [json.dumps({"content": "ok"}) + "\n", "not json\n"]
+
+    response = authenticated_client.post(url=url, content=ndjson_stream(lines))
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+    assert response.json()["errors"][0]["message"].startswith("body -> 2:")
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_messages_invalid_message_reports_line_number(
+    app: FastAPI,
+    authenticated_client: TestClient,
+):
+    """Ошибка валидации сообщения указывает строку тела, а не порядковый номер сообщения."""
+    url = app.url_path_for("bulk_create_messages", chat_id=str(uuid4()))
+    lines = [json.dumps({"content": "ok"}) + "\n", "\n", "\n", json.dumps({"content": "   "}) + "\n"]
+
+    response = authenticated_client.post(url=url, content=ndjson_stream(lines))
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json()["errors"][0]["message"].startswith("Line 4 is invalid")
+
+
+async def _iterate(contents: list[str]):
+    started_at = datetime.now() - timedelta(days=1)
+    for index, content in enumerate(contents):
+        yield BulkMessageData(content=content, line_number=index + 1, created_at=started_at + timedelta(seconds=index))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", ["ndjson", "gzip"])
+async def test_export_messages_success(
+    app: FastAPI,
+    authenticated_client: TestClient,
+    authenticated_user: UserEntity,
+    mediator: Mediator,
+    export_format: str,
+):
+    """Тест потокового экспорта истории чата."""
+    chat, *_ = await mediator.handle_command(
+        CreateChatCommand(title=f"Export {export_format}", owner_id=authenticated_user.oid),
+    )
+    contents = [f"Message {index}" for index in range(20)]
+    await mediator.handle_command(
+        BulkCreateMessagesCommand(chat_id=chat.oid, sender_id=authenticated_user.oid, messages=_iterate(contents)),
+    )
+    url = app.url_path_for("export_messages", chat_id=str(chat.oid))
+
+    response = authenticated_client.get(url=url, params={"format": export_format})
+
+    assert response.status_code == status.HTTP_200_OK
+    body = gzip.decompress(response.content) if export_format == "gzip" else response.content
+    exported = [json.loads(line) for line in body.decode().splitlines()]
+    assert [message["content"] for message in exported] == contents
+
+
+@pytest.mark.asyncio
+async def test_export_messages_chat_not_found(
+    app: FastAPI,
+    authenticated_client: TestClient,
+):
+    url = app.url_path_for("export_messages", chat_id=str(uuid4()))
+
+    response = authenticated_client.get(url=url)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_export_messages_unauthorized(
+    app: FastAPI,
+    client: TestClient,
+):
+    url = app.url_path_for("export_messages", chat_id=str(uuid4()))
+
+    response = client.get(url=url)
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
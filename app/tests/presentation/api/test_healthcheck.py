@@ -0,0 +1,54 @@
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.testclient import TestClient
+
+from infrastructure.cache.stats import CacheRegistry
+from infrastructure.cache.ttl import TTLCache
+from infrastructure.s3.client import S3Client
+from infrastructure.websockets.manager import (
+    BaseConnectionManager,
+    ConnectionManager,
+)
+from punq import Container
+
+from settings.config import Config
+
+
+def test_get_caches_stats(app: FastAPI, client: TestClient, container: Container):
+    """Статистика отдается для каждого зарегистрированного кэша."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("absent")
+    container.resolve(CacheRegistry).register("users", cache)
+
+    response = client.get(app.url_path_for("get_caches_stats"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"users": {"items": 1, "hits": 1, "misses": 1, "hit_ratio": 0.5}}
+
+
+def test_get_s3_stats(app: FastAPI, client: TestClient, container: Container):
+    """Счетчики операций S3 отдаются как есть."""
+    s3_client = S3Client(config=Config())
+    s3_client.operation_counts["upload_fileobj"] += 2
+    container.register(S3Client, instance=s3_client)
+
+    response = client.get(app.url_path_for("get_s3_stats"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"bucket_ready": False, "operations": {"upload_fileobj": 2}}
+
+
+def test_get_websockets_stats(app: FastAPI, client: TestClient, container: Container):
+    """Отдается число соединений воркера и закрытых reaper'ом."""
+    connection_manager = ConnectionManager()
+    connection_manager._reaped_connections = 3
+    container.register(BaseConnectionManager, instance=connection_manager)
+
+    response = client.get(app.url_path_for("get_websockets_stats"))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {"connections": 0, "reaped_connections": 3}
@@ -9,6 +9,8 @@ from fastapi.testclient import TestClient
 import pytest
 from httpx import Response
 
+from domain.users.services import users as users_service_module
+
 
 @pytest.mark.asyncio
 async def test_get_current_user_success(
@@ -78,6 +80,14 @@ async def test_upload_avatar_success(
     assert "avatars" in json_response["data"]["avatar_url"]
     assert str(authenticated_user.oid) in json_response["data"]["avatar_url"]
 
+    # Миниатюры создаются фоновой задачей после ответа
+    me_response = authenticated_client.get(app.url_path_for("get_current_user"))
+    avatar_stem = json_response["data"]["avatar_url"].rsplit(".", 1)[0]
+    assert me_response.json()["data"]["avatar_thumbnail_urls"] == {
+        "64": f"{avatar_stem}_64.jpg",
+        "128": f"{avatar_stem}_128.jpg",
+    }
+
 
 @pytest.mark.asyncio
 async def test_upload_avatar_unauthorized(
@@ -152,3 +162,74 @@ async def test_upload_avatar_updates_existing(
     # Avatar URLs should be different (new random filename)
     assert first_avatar_url != second_avatar_url
     assert json_response_2["data"]["oid"] == str(authenticated_user.oid)
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_too_large(
+    app: FastAPI,
+    authenticated_client: TestClient,
+    authenticated_user,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Тест загрузки аватара больше допустимого размера: файл не сохраняется."""
+    monkeypatch.setattr(users_service_module, "MAX_AVATAR_SIZE", 100 * 1024)
+    url = app.url_path_for("upload_avatar")
+
+    files = {"file": ("avatar.jpg", BytesIO(b"x" * (200 * 1024)), "image/jpeg")}
+
+    response: Response = authenticated_client.post(
+        url=url,
+        files=files,
+    )
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    me_response = authenticated_client.get(app.url_path_for("get_current_user"))
+    assert me_response.json()["data"]["avatar_url"] is None
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_rejected_by_content_length(
+    app: FastAPI,
+    authenticated_client: TestClient,
+):
+    """Тело больше лимита по Content-Length отклоняется до разбора формы."""
+    url = app.url_path_for("upload_avatar")
+
+    response: Response = authenticated_client.post(
+        url=url,
+        content=b"not even multipart",
+        headers={
+            "Content-Type": "multipart/form-data; boundary=boundary",
+            "Content-Length": str(users_service_module.MAX_AVATAR_SIZE * 2),
+        },
+    )
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert response.json()["errors"][0]["type"] == "AvatarTooLargeException"
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_rejected_while_reading_chunked_body(
+    app: FastAPI,
+    authenticated_client: TestClient,
+):
+    """Тело без Content-Length обрывается, как только превысит лимит."""
+    url = app.url_path_for("upload_avatar")
+    chunks_sent = 0
+
+    def chunked_body():
+        nonlocal chunks_sent
+        yield b'--boundary\r\nContent-Disposition: form-data; name="file"; filename="avatar.jpg"\r\n\r\n'
+        for _ in range(20):
+            chunks_sent += 1
+            yield b"x" * (1024 * 1024)
+
+    response: Response = authenticated_client.post(
+        url=url,
+        content=chunked_body(),
+        headers={"Content-Type": "multipart/form-data; boundary=boundary"},
+    )
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    me_response = authenticated_client.get(app.url_path_for("get_current_user"))
+    assert me_response.json()["data"]["avatar_url"] is None